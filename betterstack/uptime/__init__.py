@@ -10,14 +10,21 @@ Example:
     ...     print(f"{monitor.pronounceable_name}: {monitor.status}")
 """
 
+from .aio import AsyncPaginatedAPI, AsyncRESTAPI, AsyncUptimeAPI
 from .api import RESTAPI, PaginatedAPI, UptimeAPI
 from .auth import BearerAuth
 from .base import BaseAPIObject
+from .cache import CacheStats, ResponseCache, SQLiteCache
+from .circuit import CircuitBreaker, RetryBudget
+from .codec import JSONCodec
+from .concurrency import AdaptiveConcurrency, ConcurrencyDecision, HedgingPolicy
+from .deadline import Deadline
 from .exceptions import (
     APIError,
     AuthenticationError,
     BetterStackError,
     ConfigurationError,
+    DeadlineExceededError,
     ForbiddenError,
     NotFoundError,
     RateLimitError,
@@ -41,37 +48,62 @@ from .objects import (
     StatusPageResource,
     StatusPageSection,
 )
+from .pagesize import PageSizer
+from .ratelimit import FileTokenBucket, RateLimiter, TokenBucket
+from .scheduling import PriorityScheduler, request_priority
+from .transfer import TransferStats
 
 __all__ = [
     "RESTAPI",
     "APIError",
+    "AdaptiveConcurrency",
+    "AsyncPaginatedAPI",
+    "AsyncRESTAPI",
+    "AsyncUptimeAPI",
     "AuthenticationError",
     "BaseAPIObject",
     "BearerAuth",
     "BetterStackError",
+    "CacheStats",
+    "CircuitBreaker",
+    "ConcurrencyDecision",
     "ConfigurationError",
+    "Deadline",
+    "DeadlineExceededError",
     "EscalationPolicy",
+    "FileTokenBucket",
     "ForbiddenError",
     "Heartbeat",
     "HeartbeatGroup",
+    "HedgingPolicy",
     "Incident",
+    "JSONCodec",
     "Monitor",
     "MonitorGroup",
     "MonitorSLA",
     "NotFoundError",
     "OnCallCalendar",
     "OnCallEvent",
+    "PageSizer",
     "PaginatedAPI",
     "PolicyStep",
+    "PriorityScheduler",
     "RateLimitError",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryBudget",
+    "SQLiteCache",
     "ServerError",
     "StatusPage",
     "StatusPageGroup",
     "StatusPageResource",
     "StatusPageSection",
+    "TokenBucket",
+    "TransferStats",
     "UptimeAPI",
     "ValidationError",
     "filter_on_attribute",
+    "request_priority",
 ]
 
 __version__ = "2.0.0"
@@ -0,0 +1,323 @@
+"""Transport adapters used by the REST API clients."""
+
+from __future__ import annotations
+
+import queue
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, cast
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import HTTPError, MaxRetryError, ResponseError
+from urllib3.util.connection import is_connection_dropped
+from urllib3.util.retry import Retry
+
+from .circuit import RetryBudget
+from .deadline import current_deadline
+from .exceptions import DeadlineExceededError
+
+if TYPE_CHECKING:
+    from urllib3.response import BaseHTTPResponse
+
+# Start probing idle connections after a minute, then every 15 seconds.
+TCP_KEEPALIVE_IDLE = 60
+TCP_KEEPALIVE_INTERVAL = 15
+
+
+def keepalive_socket_options() -> list[tuple[int, int, int]]:
+    """Build socket options that enable TCP keep-alive probes.
+
+    Platform specific tuning options are only included when the running
+    platform supports them.
+
+    Returns:
+        The default urllib3 socket options extended with keep-alive options.
+    """
+    options: list[tuple[int, int, int]] = [
+        *(HTTPConnection.default_socket_options or []),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL))
+    return options
+
+
+class ClientRetry(Retry):
+    """urllib3 retry strategy used by the REST API clients.
+
+    Responses with status 429 are never retried at this level, even when
+    they carry a ``Retry-After`` header. The client handles them itself
+    so it can cap and jitter the wait, inform its rate limiter and report
+    the time spent throttled.
+
+    Retries stop early when the current deadline (see
+    :func:`~betterstack.uptime.deadline.deadline_scope`) would pass
+    before the wait ends, or when the retry budget is spent.
+
+    Attributes:
+        budget: Client-wide retry budget every retry is taken from, or None.
+    """
+
+    RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES - {429}
+
+    def __init__(self, *args: Any, budget: RetryBudget | None = None, **kwargs: Any) -> None:
+        """Initialize the retry strategy.
+
+        Args:
+            *args: Positional arguments of :class:`urllib3.util.retry.Retry`.
+            budget: Client-wide retry budget every retry is taken from.
+            **kwargs: Keyword arguments of :class:`urllib3.util.retry.Retry`.
+        """
+        super().__init__(*args, **kwargs)
+        self.budget = budget
+
+    def new(self, **kw: Any) -> ClientRetry:
+        """Copy the strategy with updated counters, keeping the budget."""
+        kw.setdefault("budget", self.budget)
+        return super().new(**kw)
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: BaseHTTPResponse | None = None,
+        error: Exception | None = None,
+        _pool: Any = None,
+        _stacktrace: TracebackType | None = None,
+    ) -> ClientRetry:
+        """Count a failed attempt, refusing the retry when the budget is spent.
+
+        Raises:
+            MaxRetryError: If the retries are exhausted or the budget is spent.
+        """
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.budget is not None and not self.budget.try_retry():
+            reason = error or ResponseError("retry budget exhausted")
+            raise MaxRetryError(_pool, url or "", reason) from reason
+        return retry
+
+    def sleep(self, response: BaseHTTPResponse | None = None) -> None:
+        """Wait before the next attempt, unless the deadline ends first.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before the wait is over.
+        """
+        deadline = current_deadline()
+        if deadline is not None:
+            wait = None
+            if self.respect_retry_after_header and response is not None:
+                wait = self.get_retry_after(response)
+            if wait is None:
+                wait = self.get_backoff_time()
+            deadline.check()
+            if wait >= deadline.remaining():
+                raise DeadlineExceededError(
+                    f"Retrying in {wait:.1f}s would exceed the deadline of {deadline.timeout} seconds"
+                )
+        super().sleep(response)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Connection reuse statistics of a connection pool manager.
+
+    Attributes:
+        connections_created: Number of new connections that were opened.
+        requests: Number of requests sent over pooled connections.
+        idle_connections: Number of open connections waiting in the pools.
+        pools: Number of per-host pools currently held.
+    """
+
+    connections_created: int = 0
+    requests: int = 0
+    idle_connections: int = 0
+    pools: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Number of requests that were sent over an existing connection."""
+        return max(self.requests - self.connections_created, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests that reused a connection (0.0 - 1.0)."""
+        if not self.requests:
+            return 0.0
+        return self.reused / self.requests
+
+
+class PoolingHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with pool tuning, TCP keep-alive and reuse statistics.
+
+    Example:
+        >>> adapter = PoolingHTTPAdapter(pool_maxsize=32, tcp_keepalive=True)
+        >>> session.mount("https://", adapter)
+        >>> adapter.pool_stats().reuse_ratio
+    """
+
+    __attrs__ = [*HTTPAdapter.__attrs__, "tcp_keepalive"]  # noqa: RUF012
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: Any = 0,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        tcp_keepalive: bool = False,
+    ) -> None:
+        """Initialize the adapter.
+
+        Args:
+            pool_connections: Number of per-host pools to keep.
+            pool_maxsize: Maximum number of connections kept per host.
+            max_retries: Retry configuration passed to urllib3.
+            pool_block: Whether to wait for a free connection when a host's
+                pool is exhausted instead of opening a throwaway connection.
+            tcp_keepalive: Whether to enable TCP keep-alive probes on new
+                connections so idle pooled connections survive NAT timeouts.
+        """
+        self.tcp_keepalive = tcp_keepalive
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = DEFAULT_POOLBLOCK,
+        **pool_kwargs: Any,
+    ) -> None:
+        """Create the pool manager, adding keep-alive socket options if enabled."""
+        if self.tcp_keepalive:
+            pool_kwargs.setdefault("socket_options", keepalive_socket_options())
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def pool_stats(self) -> PoolStats:
+        """Collect connection reuse statistics across all per-host pools.
+
+        Returns:
+            Aggregated statistics of the pools currently held.
+        """
+        connections_created = requests = idle = 0
+        pools = self.poolmanager.pools
+        keys = list(pools.keys())
+        for key in keys:
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections_created += pool.num_connections
+            requests += pool.num_requests
+            queue = getattr(pool, "pool", None)
+            if queue is not None:
+                idle += sum(1 for conn in list(queue.queue) if conn is not None)
+        return PoolStats(
+            connections_created=connections_created,
+            requests=requests,
+            idle_connections=idle,
+            pools=len(keys),
+        )
+
+    def warm_up(
+        self,
+        request: requests.PreparedRequest,
+        connections: int,
+        timeout: float | None = None,
+        verify: bool | str = True,
+        proxies: dict[str, str] | None = None,
+        cert: str | tuple[str, str] | None = None,
+    ) -> int:
+        """Open idle connections to the host of a request in parallel.
+
+        Up to ``connections`` idle connections are taken from the host's pool,
+        at most as many as the pool holds. Open ones go straight back; those
+        that are missing or were closed by the other end are opened (TCP
+        connect and TLS handshake) concurrently, and each returns to the pool
+        as soon as it is open, so requests sent meanwhile find a connection.
+        No request is sent.
+
+        Args:
+            request: Request whose host, proxy and TLS settings select the pool.
+            connections: Number of idle connections the pool should hold.
+            timeout: Connect timeout in seconds, or None to wait indefinitely.
+            verify: TLS verification setting, as for :meth:`send`.
+            proxies: Proxies of the request, as for :meth:`send`.
+            cert: Client certificate, as for :meth:`send`.
+
+        Returns:
+            The number of connections opened.
+
+        Raises:
+            requests.ConnectionError: If a connection couldn't be opened. The
+                connections that were opened stay in the pool.
+        """
+        pool = self._connection_pool(request, verify, proxies, cert)
+        idle: list[Any] = []
+        slots = pool.pool
+        while slots is not None and len(idle) < min(connections, slots.maxsize):
+            try:
+                idle.append(slots.get(block=False))
+            except queue.Empty:
+                break
+
+        closed = []
+        for conn in idle:
+            if conn is not None and not is_connection_dropped(conn):
+                pool._put_conn(conn)
+            else:
+                closed.append(conn)
+
+        def connect(conn: Any) -> Exception | None:
+            try:
+                if conn is None:
+                    conn = pool._new_conn()
+                conn.close()
+                conn.timeout = timeout
+                conn.connect()
+            except (OSError, HTTPError) as error:
+                if conn is not None:
+                    conn.close()
+                return error
+            finally:
+                pool._put_conn(conn)
+            return None
+
+        if not closed:
+            return 0
+        with ThreadPoolExecutor(
+            max_workers=len(closed), thread_name_prefix="betterstack-uptime-warm-up"
+        ) as executor:
+            errors = [error for error in executor.map(connect, closed) if error]
+        if errors:
+            raise requests.ConnectionError(errors[0], request=request) from errors[0]
+        return len(closed)
+
+    def _connection_pool(
+        self,
+        request: requests.PreparedRequest,
+        verify: bool | str,
+        proxies: dict[str, str] | None,
+        cert: str | tuple[str, str] | None,
+    ) -> HTTPConnectionPool:
+        """Look up the pool :meth:`send` uses for a request.
+
+        requests older than 2.32.2 select the pool by URL and proxy only and
+        apply the TLS settings to the pool afterwards.
+        """
+        if hasattr(self, "get_connection_with_tls_context"):
+            pool = self.get_connection_with_tls_context(request, verify, proxies=proxies, cert=cert)
+        else:
+            url = str(request.url)
+            pool = self.get_connection(url, proxies)
+            self.cert_verify(pool, url, verify, cert)
+        return cast("HTTPConnectionPool", pool)
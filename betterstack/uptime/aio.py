@@ -0,0 +1,482 @@
+"""Asynchronous REST API client classes for the BetterStack Uptime API.
+
+These classes mirror :class:`~betterstack.uptime.api.RESTAPI`,
+:class:`~betterstack.uptime.api.PaginatedAPI` and
+:class:`~betterstack.uptime.api.UptimeAPI`, but are built on ``httpx`` and
+``asyncio`` so that many requests can be in flight on a single event loop
+without any worker threads.
+
+``httpx`` is an optional dependency, install it with::
+
+    pip install betterstack-uptime[async]
+
+Example:
+    >>> async with AsyncUptimeAPI("your-bearer-token") as api:
+    ...     async for monitor in Monitor.aget_all_instances(api):
+    ...         print(monitor.url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections import deque
+from collections.abc import AsyncGenerator
+from types import TracebackType
+from typing import Any
+from urllib.parse import urljoin
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None  # type: ignore[assignment]
+
+from .api import _raise_for_status
+from .auth import BearerAuth
+from .exceptions import ConfigurationError
+from .pagination import clean_params, next_page_parameters, total_pages
+
+
+class AsyncRESTAPI:
+    """Low-level asynchronous REST API client with retry logic.
+
+    This class handles all HTTP communication with the BetterStack API
+    from asyncio code, including authentication, request retries, and
+    error handling. Errors are mapped to the same exceptions as
+    :class:`~betterstack.uptime.api.RESTAPI`.
+
+    Attributes:
+        base_url: The base URL for all API requests.
+        client: The ``httpx.AsyncClient`` used for all HTTP calls.
+    """
+
+    RETRY_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+    def __init__(
+        self,
+        base_url: str,
+        auth: BearerAuth,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+    ) -> None:
+        """Initialize AsyncRESTAPI with client and retry configuration.
+
+        Args:
+            base_url: The URL to be called, must end with a forward slash.
+            auth: Authentication class providing the bearer token.
+            retries: Number of retries for failed requests.
+            backoff_factor: Backoff factor for retry delays.
+            timeout: Default timeout for requests in seconds.
+            max_connections: Maximum number of open connections in the pool.
+
+        Raises:
+            ValueError: If base_url doesn't end with a forward slash.
+            ConfigurationError: If httpx is not installed.
+        """
+        if not base_url.endswith("/"):
+            raise ValueError("base_url should end with a /")
+        if httpx is None:
+            raise ConfigurationError(
+                "httpx is required for the asyncio client, "
+                "install it with 'pip install betterstack-uptime[async]'"
+            )
+
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+        self.client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {auth.token}"},
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=retries),
+        )
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client when leaving the async context manager."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        await self.client.aclose()
+
+    def _get_backoff_time(self, attempt: int) -> float:
+        """Calculate the delay before a retry, matching urllib3's backoff.
+
+        Args:
+            attempt: Number of the retry that is about to be made, starting at 1.
+
+        Returns:
+            Delay in seconds.
+        """
+        if attempt <= 1:
+            return 0.0
+        return float(self.backoff_factor * (2 ** (attempt - 1)))
+
+    def _handle_response(self, response: httpx.Response) -> None:
+        """Handle response status codes and raise appropriate exceptions.
+
+        Args:
+            response: The response object to check.
+
+        Raises:
+            APIError: Or one of its subclasses for error responses.
+        """
+        if response.status_code < 400:
+            return
+
+        try:
+            error_body = response.json()
+        except (ValueError, KeyError):
+            error_body = None
+        _raise_for_status(
+            response.status_code, response.reason_phrase, response.headers, error_body
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Send a request, retrying on server errors.
+
+        Args:
+            method: HTTP method to use.
+            url: URL path to access (relative to base_url).
+            body: Request body as a dictionary (will be sent as JSON).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        parameters = clean_params(parameters)
+        attempt = 0
+        while True:
+            response = await self.client.request(
+                method,
+                urljoin(self.base_url, url),
+                json=body,
+                params=parameters,
+                headers=headers,
+            )
+            if response.status_code not in self.RETRY_STATUS_CODES or attempt >= self.retries:
+                break
+            attempt += 1
+            await response.aclose()
+            await asyncio.sleep(self._get_backoff_time(attempt))
+
+        self._handle_response(response)
+        return response
+
+    async def get(
+        self,
+        url: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Perform a GET request.
+
+        Args:
+            url: URL path to access (relative to base_url).
+            body: Request body (unused for GET, kept for interface consistency).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+
+        Returns:
+            Response JSON as a dictionary.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        response = await self._request("GET", url, headers=headers, parameters=parameters)
+        result: dict[str, Any] = response.json()
+        return result
+
+    async def post(
+        self,
+        url: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Perform a POST request.
+
+        Args:
+            url: URL path to access (relative to base_url).
+            body: Request body as a dictionary (will be sent as JSON).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        return await self._request("POST", url, body, headers, parameters)
+
+    async def patch(
+        self,
+        url: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Perform a PATCH request.
+
+        Args:
+            url: URL path to access (relative to base_url).
+            body: Request body as a dictionary (will be sent as JSON).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        return await self._request("PATCH", url, body, headers, parameters)
+
+    async def delete(
+        self,
+        url: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Perform a DELETE request.
+
+        Args:
+            url: URL path to access (relative to base_url).
+            body: Request body (unused for DELETE).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        return await self._request("DELETE", url, headers=headers, parameters=parameters)
+
+
+class AsyncPaginatedAPI(AsyncRESTAPI):
+    """Asynchronous REST API client that handles paginated responses.
+
+    Remaining pages are fetched as concurrent tasks on the running event
+    loop, bounded by ``max_workers``, and items are yielded in page order
+    as soon as each page is available. At most twice ``max_workers`` pages
+    are requested ahead of the page being consumed.
+
+    Attributes:
+        max_workers: Maximum number of concurrent page requests per listing.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth: BearerAuth,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 30.0,
+        max_workers: int = 5,
+        max_connections: int = 100,
+    ) -> None:
+        """Initialize AsyncPaginatedAPI with concurrency configuration.
+
+        Args:
+            base_url: The URL to be called, must end with a forward slash.
+            auth: Authentication class providing the bearer token.
+            retries: Number of retries for failed requests.
+            backoff_factor: Backoff factor for retry delays.
+            timeout: Default timeout for requests in seconds.
+            max_workers: Maximum number of concurrent page requests per listing.
+            max_connections: Maximum number of open connections in the pool.
+        """
+        super().__init__(base_url, auth, retries, backoff_factor, timeout, max_connections)
+        self.max_workers = max_workers
+
+    async def get(  # type: ignore[override]
+        self,
+        url: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Perform a GET request with automatic pagination and concurrent fetching.
+
+        Closing the generator early (e.g. breaking out of an ``async for``)
+        cancels all page requests that are still pending.
+
+        Args:
+            url: URL path to access (relative to base_url).
+            body: Request body (unused for GET).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+
+        Yields:
+            Individual items from the response data array.
+        """
+        if parameters is None:
+            parameters = {}
+
+        data = await super().get(url, body, headers, parameters)
+
+        # For single objects, yield and return
+        if isinstance(data.get("data"), dict):
+            yield data["data"]
+            return
+
+        for item in data.get("data", []):
+            yield item
+
+        pagination = data.get("pagination", {})
+        if not pagination.get("next"):
+            return
+
+        last_page = total_pages(pagination)
+
+        if last_page is None:
+            async for item in self._fetch_pages_sequential(url, headers, parameters, data):
+                yield item
+            return
+
+        if last_page <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+        parent_get = super().get
+
+        async def fetch_page(page: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                page_data = await parent_get(url, None, headers, {**parameters, "page": page})
+            items: list[dict[str, Any]] = page_data.get("data", [])
+            return items
+
+        # Like the synchronous client, keep at most twice max_workers pages in
+        # flight or buffered ahead of the consumer
+        pages = iter(range(2, last_page + 1))
+        pending: deque[asyncio.Future[list[dict[str, Any]]]] = deque()
+
+        def submit_next() -> None:
+            page = next(pages, None)
+            if page is not None:
+                pending.append(asyncio.ensure_future(fetch_page(page)))
+
+        try:
+            for _ in range(2 * self.max_workers):
+                submit_next()
+
+            while pending:
+                items = await pending[0]
+                pending.popleft()
+                submit_next()
+                for item in items:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_pages_sequential(
+        self,
+        url: str,
+        headers: dict[str, Any] | None,
+        parameters: dict[str, Any],
+        current_data: dict[str, Any],
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Fetch pages sequentially when total pages is unknown.
+
+        Args:
+            url: URL path to access.
+            headers: Additional headers to send.
+            parameters: Base URL query parameters.
+            current_data: Current page data with pagination info.
+
+        Yields:
+            Individual items from response data arrays.
+        """
+        data = current_data
+        while data.get("pagination", {}).get("next"):
+            params = next_page_parameters(data["pagination"]["next"], parameters)
+
+            data = await super().get(url, None, headers, params)
+            for item in data.get("data", []):
+                yield item
+
+
+class AsyncUptimeAPI(AsyncPaginatedAPI):
+    """Asynchronous BetterStack Uptime API client.
+
+    This is the asyncio counterpart of
+    :class:`~betterstack.uptime.api.UptimeAPI`, pre-configured with the
+    correct base URL.
+
+    Example:
+        >>> async with AsyncUptimeAPI("your-bearer-token") as api:
+        ...     monitors = [m async for m in Monitor.aget_all_instances(api)]
+
+    Attributes:
+        BETTERSTACK_API_URL: The base URL for the BetterStack Uptime API.
+    """
+
+    BETTERSTACK_API_URL = "https://uptime.betterstack.com/api/v2/"
+
+    def __init__(
+        self,
+        bearer_token: str,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 30.0,
+        max_workers: int = 5,
+        max_connections: int = 100,
+    ) -> None:
+        """Initialize AsyncUptimeAPI with bearer token authentication.
+
+        Args:
+            bearer_token: Bearer token for API authentication.
+            retries: Number of retries for failed requests.
+            backoff_factor: Backoff factor for retry delays.
+            timeout: Default timeout for requests in seconds.
+            max_workers: Maximum number of concurrent page requests per listing.
+            max_connections: Maximum number of open connections in the pool.
+        """
+        super().__init__(
+            base_url=self.BETTERSTACK_API_URL,
+            auth=BearerAuth(bearer_token),
+            retries=retries,
+            backoff_factor=backoff_factor,
+            timeout=timeout,
+            max_workers=max_workers,
+            max_connections=max_connections,
+        )
@@ -2,24 +2,110 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import itertools
+import math
+import random
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from types import TracebackType
 from typing import Any
 from urllib.parse import parse_qs, urljoin, urlparse
 
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from requests.adapters import DEFAULT_POOLSIZE
 
+from .adapters import ClientRetry, PoolingHTTPAdapter, PoolStats
 from .auth import BearerAuth
+from .cache import CacheKey, ResponseCache
+from .circuit import CircuitBreaker, RetryBudget
+from .codec import JSONCodec, get_codec
+from .concurrency import AdaptiveConcurrency, HedgingPolicy, SingleFlight
+from .deadline import Deadline, current_deadline, deadline_scope
 from .exceptions import (
     APIError,
     AuthenticationError,
+    BetterStackError,
+    DeadlineExceededError,
     ForbiddenError,
     NotFoundError,
     RateLimitError,
     ServerError,
 )
+from .pagesize import PageSizer
+from .pagination import clean_params, next_page_parameters, total_pages
+from .ratelimit import RateLimiter
+from .scheduling import BULK, INTERACTIVE, PriorityScheduler, current_priority, request_priority
+from .streaming import StreamingPage
+from .transfer import TransferMeter, TransferStats, accept_encoding, endpoint_name
+
+# Size of the chunks a streamed page body is read and decoded in.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Seconds between deadline checks while waiting for a page, so a cancelled
+# deadline is noticed even when it has no timeout.
+DEADLINE_POLL_INTERVAL = 0.1
+
+
+def _raise_for_status(
+    status_code: int,
+    reason: str | None,
+    headers: Mapping[str, str],
+    error_body: Any,
+) -> None:
+    """Raise the exception matching an error response.
+
+    This mapping is shared by the synchronous and asynchronous clients so
+    both surface identical exceptions for the same response.
+
+    Args:
+        status_code: HTTP status code of the response.
+        reason: HTTP reason phrase of the response.
+        headers: Response headers.
+        error_body: Decoded JSON body, or None if it could not be decoded.
+
+    Raises:
+        AuthenticationError: For 401 responses.
+        ForbiddenError: For 403 responses.
+        NotFoundError: For 404 responses.
+        RateLimitError: For 429 responses.
+        ServerError: For 5xx responses.
+        APIError: For other error responses.
+    """
+    if isinstance(error_body, dict):
+        message = str(error_body.get("error", reason))
+    else:
+        message = reason or f"HTTP {status_code}"
+
+    if status_code == 401:
+        raise AuthenticationError(message)
+    elif status_code == 403:
+        raise ForbiddenError(message)
+    elif status_code == 404:
+        raise NotFoundError(message)
+    elif status_code == 429:
+        retry_after = headers.get("Retry-After")
+        try:
+            retry_after_seconds = int(retry_after) if retry_after else None
+        except (ValueError, TypeError):
+            retry_after_seconds = None
+        raise RateLimitError(
+            message,
+            retry_after=retry_after_seconds,
+        )
+    elif status_code >= 500:
+        raise ServerError(message, status_code)
+    else:
+        raise APIError(message, status_code, error_body)
 
 
 class RESTAPI:
@@ -28,9 +114,27 @@ class RESTAPI:
     This class handles all HTTP communication with the BetterStack API,
     including authentication, request retries, and error handling.
 
+    The client can be used as a context manager, which calls :meth:`close`
+    on exit.
+
     Attributes:
         base_url: The base URL for all API requests.
         session: The requests session used for all HTTP calls.
+        adapter: The transport adapter holding the connection pools.
+        max_in_flight: Maximum number of concurrent requests, or None.
+        rate_limiter: Rate limiter pacing all requests, or None.
+        cache: Cache serving GET responses, or None.
+        codec: JSON codec encoding request bodies and decoding responses.
+        single_flight: Group coalescing concurrent identical GET requests, or None.
+        hedging: Policy hedging slow GET requests, or None.
+        circuit_breaker: Per-endpoint circuit breaker, or None.
+        retry_budget: Budget limiting the retries of the client, or None.
+        scheduler: Scheduler admitting requests by priority class, or None.
+        keep_alive: Seconds between the keep-alive rounds started by
+            :meth:`warm_up`, or None while no keep-alive runs.
+        throttled_seconds: Total time spent waiting to retry 429 responses.
+        throttled_retries: Number of requests retried after a 429 response.
+        transfer: Per-endpoint counters of received and decoded bytes.
     """
 
     def __init__(
@@ -40,6 +144,22 @@ class RESTAPI:
         retries: int = 3,
         backoff_factor: float = 0.5,
         timeout: float = 30.0,
+        max_in_flight: int | None = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int | None = None,
+        pool_block: bool = False,
+        tcp_keepalive: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        rate_limit_retries: int | None = None,
+        max_retry_after: float = 60.0,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        json_codec: JSONCodec | str = "stdlib",
+        compression: bool = True,
+        hedging: HedgingPolicy | bool = False,
+        circuit_breaker: CircuitBreaker | bool = False,
+        retry_budget: RetryBudget | bool = False,
+        priorities: PriorityScheduler | bool = False,
     ) -> None:
         """Initialize RESTAPI with session and retry configuration.
 
@@ -49,30 +169,264 @@ class RESTAPI:
             retries: Number of retries for failed requests.
             backoff_factor: Backoff factor for retry delays.
             timeout: Default timeout for requests in seconds.
+            max_in_flight: Maximum number of requests in flight at once across
+                all threads using this client, or None for no limit.
+            pool_connections: Number of per-host connection pools to keep.
+            pool_maxsize: Maximum number of connections kept open per host.
+                Defaults to the larger of 10 and ``max_in_flight``.
+            pool_block: Wait for a pooled connection to become free instead of
+                opening (and then discarding) an extra connection.
+            tcp_keepalive: Enable TCP keep-alive probes on pooled connections.
+            rate_limiter: Rate limiter every request waits on, shared by all threads
+                using this client.
+            rate_limit_retries: Number of times a request answered with 429 is retried
+                after waiting for ``Retry-After``, by default ``retries``.
+            max_retry_after: Upper bound in seconds on a single wait before retrying
+                a 429 response.
+            cache: Cache serving GET responses while they are fresh,
+                shared by all threads using this client.
+            coalesce_requests: Let concurrent identical GET requests share a
+                single request and its result.
+            json_codec: JSON codec used to encode request bodies and decode
+                responses, or its name: ``"stdlib"``, ``"orjson"``, ``"msgspec"`` or
+                ``"auto"`` for the fastest one installed.
+            compression: Ask for gzip/deflate compressed responses, plus brotli
+                and zstd when their packages are installed. Disable to receive
+                uncompressed bodies.
+            hedging: Race GET requests that are slower than the 95th percentile
+                latency against a second identical request, for at most 5% of the
+                requests, or pass a :class:`~betterstack.uptime.concurrency.HedgingPolicy`
+                to configure this.
+            circuit_breaker: Stop sending requests to an endpoint after 5 consecutive
+                failures, failing fast with ServerError for 30 seconds, or pass a
+                :class:`~betterstack.uptime.circuit.CircuitBreaker` to configure this.
+            retry_budget: Cap the retries of the client at 10% of its recent
+                successful requests (plus 10 per 10 seconds), or pass a
+                :class:`~betterstack.uptime.circuit.RetryBudget` to configure this.
+            priorities: Give interactive requests (single objects and writes) their
+                own in-flight slots and precedence at the rate limiter over the bulk
+                pages of listings, or pass a
+                :class:`~betterstack.uptime.scheduling.PriorityScheduler` to set the
+                slots per class. With True, ``max_in_flight`` is required and limits
+                bulk requests only. A scheduler sets all limits itself, so it can't be
+                combined with ``max_in_flight``.
 
         Raises:
-            ValueError: If base_url doesn't end with a forward slash.
+            ValueError: If base_url doesn't end with a forward slash, or
+                ``priorities`` and ``max_in_flight`` don't fit together.
         """
         if not base_url.endswith("/"):
             raise ValueError("base_url should end with a /")
+        if priorities is True and not max_in_flight:
+            raise ValueError("priorities=True needs max_in_flight to limit the bulk requests")
+        if isinstance(priorities, PriorityScheduler) and max_in_flight:
+            raise ValueError("Set the limits on the PriorityScheduler instead of max_in_flight")
 
         self.base_url = base_url
         self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.rate_limiter = rate_limiter
+        self.rate_limit_retries = retries if rate_limit_retries is None else rate_limit_retries
+        self.max_retry_after = max_retry_after
+        self.backoff_factor = backoff_factor
+        self.cache = cache
+        self.codec = get_codec(json_codec)
+        self.single_flight: SingleFlight[dict[str, Any]] | None = (
+            SingleFlight() if coalesce_requests else None
+        )
+        self.hedging: HedgingPolicy | None
+        if hedging is True:
+            self.hedging = HedgingPolicy()
+        elif hedging is False:
+            self.hedging = None
+        else:
+            self.hedging = hedging
+        self._owns_hedging = hedging is True
+        self.circuit_breaker: CircuitBreaker | None
+        if circuit_breaker is True:
+            self.circuit_breaker = CircuitBreaker()
+        elif circuit_breaker is False:
+            self.circuit_breaker = None
+        else:
+            self.circuit_breaker = circuit_breaker
+        self.retry_budget: RetryBudget | None
+        if retry_budget is True:
+            self.retry_budget = RetryBudget()
+        elif retry_budget is False:
+            self.retry_budget = None
+        else:
+            self.retry_budget = retry_budget
+        self.scheduler: PriorityScheduler | None
+        if priorities is True:
+            self.scheduler = PriorityScheduler(limits={BULK: max_in_flight})
+        elif priorities is False:
+            self.scheduler = None
+        else:
+            self.scheduler = priorities
+        self._revalidating: set[CacheKey] = set()
+        self.throttled_seconds = 0.0
+        self.throttled_retries = 0
+        self.transfer = TransferMeter()
+        self._base_path = urlparse(base_url).path
+        self._stats_lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self.keep_alive: float | None = None
+        self._keep_alive_stop = threading.Event()
+        self._keep_alive_thread: threading.Thread | None = None
 
         # Create session with retry strategy
         self.session = requests.Session()
         self.session.auth = auth
+        self.session.headers["Accept-Encoding"] = accept_encoding(compression)
 
-        retry_strategy = Retry(
+        retry_strategy = ClientRetry(
             total=retries,
             backoff_factor=backoff_factor,
             status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET", "POST", "PATCH", "DELETE"],
             raise_on_status=False,
+            budget=self.retry_budget,
+        )
+        if pool_maxsize is None:
+            pool_maxsize = max(DEFAULT_POOLSIZE, max_in_flight or 0)
+        self.adapter = PoolingHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry_strategy,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release all resources when leaving the context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop the keep-alive, then close the session and its pooled connections."""
+        self._stop_keep_alive()
+        if self.hedging is not None and self._owns_hedging:
+            self.hedging.close()
+        self.session.close()
+
+    def warm_up(self, connections: int | None = None, keep_alive: float | None = None) -> int:
+        """Open pooled connections to the API ahead of the first requests.
+
+        The connections (DNS lookup, TCP connect and TLS handshake) are opened
+        in parallel and left idle in the pool, so the first requests don't pay
+        for them. No request is sent, so warming up doesn't count towards the
+        API's rate limit.
+
+        With ``keep_alive``, a daemon thread repeats the warm-up every
+        ``keep_alive`` seconds until :meth:`close`, reopening the idle
+        connections the server or a NAT gateway dropped between bursts of
+        requests. Combine it with ``tcp_keepalive=True`` to make such drops
+        rarer. Errors of these rounds are ignored.
+
+        Example:
+            >>> api = UptimeAPI("your-bearer-token")
+            >>> api.warm_up(keep_alive=30)
+            >>> incident.acknowledge()  # Sent over an open connection
+
+        Args:
+            connections: Number of connections to open, by default
+                ``max_in_flight`` or one. Capped at the pool size.
+            keep_alive: Seconds between keep-alive rounds, or None to not
+                start (or to stop) the keep-alive.
+
+        Returns:
+            The number of connections opened.
+
+        Raises:
+            ValueError: If keep_alive is not positive.
+            requests.ConnectionError: If a connection couldn't be opened.
+        """
+        if keep_alive is not None and keep_alive <= 0:
+            raise ValueError("keep_alive should be positive")
+        if connections is None:
+            connections = self.max_in_flight or 1
+
+        self._stop_keep_alive()
+        opened = self._warm_up(connections)
+        if keep_alive is not None:
+            self._start_keep_alive(connections, keep_alive)
+        return opened
+
+    def _warm_up(self, connections: int) -> int:
+        """Open idle connections to the base URL's host.
+
+        Args:
+            connections: Number of idle connections the pool should hold.
+
+        Returns:
+            The number of connections opened.
+        """
+        request = self.session.prepare_request(requests.Request("GET", self.base_url))
+        settings = self.session.merge_environment_settings(request.url, {}, None, None, None)
+        return self.adapter.warm_up(
+            request,
+            connections,
+            timeout=self.timeout,
+            verify=True if settings["verify"] is None else settings["verify"],
+            proxies=dict(settings["proxies"]),
+            cert=settings["cert"],
+        )
+
+    def _start_keep_alive(self, connections: int, interval: float) -> None:
+        """Repeat the warm-up in a daemon thread until stopped.
+
+        Args:
+            connections: Number of idle connections the pool should hold.
+            interval: Seconds between warm-ups.
+        """
+        stop = self._keep_alive_stop = threading.Event()
+
+        def keep_alive() -> None:
+            while not stop.wait(interval):
+                try:
+                    self._warm_up(connections)
+                except requests.RequestException:
+                    pass
+
+        self.keep_alive = interval
+        self._keep_alive_thread = threading.Thread(
+            target=keep_alive, name="betterstack-uptime-keep-alive", daemon=True
+        )
+        self._keep_alive_thread.start()
+
+    def _stop_keep_alive(self) -> None:
+        """Stop the keep-alive thread, if running, and wait for it to finish."""
+        thread, self._keep_alive_thread = self._keep_alive_thread, None
+        self.keep_alive = None
+        self._keep_alive_stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def pool_stats(self) -> PoolStats:
+        """Report connection pool usage, to verify that connections are reused.
+
+        Returns:
+            Connection reuse statistics of the client's connection pools.
+        """
+        return self.adapter.pool_stats()
+
+    def transfer_stats(self) -> dict[str, TransferStats]:
+        """Report bytes received and decoded per endpoint, to verify compression.
+
+        Returns:
+            Bandwidth counters per endpoint, e.g. ``"monitors/{id}"``.
+        """
+        return self.transfer.stats()
 
     def _clean_params(self, parameters: dict[str, Any] | None) -> dict[str, Any]:
         """Remove trailing underscores from parameter names.
@@ -86,15 +440,7 @@ class RESTAPI:
         Returns:
             A dict with cleaned parameter names.
         """
-        if not parameters:
-            return {}
-
-        result = {}
-        for key, value in parameters.items():
-            if key.endswith("_"):
-                key = key[:-1]
-            result[key] = value
-        return result
+        return clean_params(parameters)
 
     def _handle_response(self, response: requests.Response) -> None:
         """Handle response status codes and raise appropriate exceptions.
@@ -113,37 +459,323 @@ class RESTAPI:
         if response.ok:
             return
 
-        status_code = response.status_code
         try:
-            error_body = response.json()
-            if isinstance(error_body, dict):
-                message = error_body.get("error", response.reason)
-            else:
-                message = response.reason or f"HTTP {status_code}"
+            error_body = self.decode(response)
         except (ValueError, KeyError):
             error_body = None
-            message = response.reason or f"HTTP {status_code}"
-
-        if status_code == 401:
-            raise AuthenticationError(message)
-        elif status_code == 403:
-            raise ForbiddenError(message)
-        elif status_code == 404:
-            raise NotFoundError(message)
-        elif status_code == 429:
-            retry_after = response.headers.get("Retry-After")
+        _raise_for_status(response.status_code, response.reason, response.headers, error_body)
+
+    def decode(self, response: requests.Response) -> Any:
+        """Decode a JSON response body with the configured codec.
+
+        Args:
+            response: The response to decode.
+
+        Returns:
+            The decoded body.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        content = response.content
+        started = time.perf_counter()
+        try:
+            return self.codec.loads(content)
+        finally:
+            self.transfer.record(
+                endpoint_name(response.url, self._base_path),
+                wire_bytes=self._wire_bytes(response, len(content)),
+                decoded_bytes=len(content),
+                encoding=response.headers.get("Content-Encoding"),
+                decode_seconds=time.perf_counter() - started,
+            )
+
+    @staticmethod
+    def _wire_bytes(response: requests.Response, decoded_bytes: int) -> int:
+        """Count the body bytes of a read response as received, before decompression.
+
+        Args:
+            response: Response whose body was read.
+            decoded_bytes: Size of the decompressed body, used when the
+                transport doesn't report the raw size.
+
+        Returns:
+            Number of body bytes read from the connection.
+        """
+        tell = getattr(response.raw, "tell", None)
+        if tell is None:
+            return decoded_bytes
+        try:
+            return int(tell())
+        except (OSError, ValueError, TypeError):
+            return decoded_bytes
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        parameters: dict[str, Any] | None = None,
+        stream: bool = False,
+        deadline: Deadline | None = None,
+    ) -> requests.Response:
+        """Send a request and check the response for errors.
+
+        All HTTP verbs go through this method, which also enforces the
+        ``max_in_flight`` limit, paces requests through the rate limiter,
+        retries requests answered with 429 up to ``rate_limit_retries`` times
+        (within the retry budget, if set), hedges slow GET requests when a
+        hedging policy is set and fails fast while the circuit breaker has
+        the endpoint's circuit open.
+
+        Args:
+            method: HTTP method to use.
+            url: URL path to access (relative to base_url).
+            body: Request body as a dictionary (will be sent as JSON).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+            stream: Return as soon as the headers arrived and leave the body
+                to be read from the response, which must then be closed.
+            deadline: Deadline bounding the request and its retries.
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If the request fails.
+            ServerError: If the endpoint's circuit is open.
+            DeadlineExceededError: If the deadline expires first.
+        """
+        parameters = self._clean_params(parameters)
+        if method != "GET" and self.cache is not None:
+            # Drop cached copies even when the write fails, it may have been applied
             try:
-                retry_after_seconds = int(retry_after) if retry_after else None
-            except (ValueError, TypeError):
-                retry_after_seconds = None
-            raise RateLimitError(
-                message,
-                retry_after=retry_after_seconds,
+                return self._retry_rate_limited(
+                    method, url, body, headers, parameters, deadline=deadline
+                )
+            finally:
+                self.cache.invalidate(url)
+        if method == "GET" and not stream and self.hedging is not None:
+            hedged = self._hedgeable(
+                lambda: self._retry_rate_limited(
+                    method, url, body, headers, parameters, deadline=deadline
+                )
             )
-        elif status_code >= 500:
-            raise ServerError(message, status_code)
-        else:
-            raise APIError(message, status_code, error_body)
+            return self.hedging.call(hedged)
+        return self._retry_rate_limited(method, url, body, headers, parameters, stream, deadline)
+
+    def _hedgeable(self, call: Callable[[], requests.Response]) -> Callable[[], requests.Response]:
+        """Carry the calling thread's request context over to a hedged copy of a call.
+
+        Hedged copies run on the hedging policy's threads, so the priority of
+        the request is set again there.
+
+        Args:
+            call: The request to run on another thread.
+
+        Returns:
+            A function running ``call`` with the current priority.
+        """
+        priority = current_priority() or INTERACTIVE
+
+        def hedged() -> requests.Response:
+            with request_priority(priority):
+                return call()
+
+        return hedged
+
+    def _retry_rate_limited(
+        self,
+        method: str,
+        url: str,
+        body: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+        parameters: dict[str, Any],
+        stream: bool = False,
+        deadline: Deadline | None = None,
+    ) -> requests.Response:
+        """Send a request, retrying it up to ``rate_limit_retries`` times on 429.
+
+        Args:
+            method: HTTP method to use.
+            url: URL path to access (relative to base_url).
+            body: Request body as a dictionary (will be sent as JSON).
+            headers: Additional headers to send.
+            parameters: Cleaned URL query parameters.
+            stream: Leave the body to be read from the response.
+            deadline: Deadline bounding the request and its retries. A retry
+                whose wait would outlast it is not attempted.
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If the request fails.
+            DeadlineExceededError: If the deadline expires first.
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._send(method, url, body, headers, parameters, stream, deadline)
+            except RateLimitError as e:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.penalize(e.retry_after)
+                if attempt >= self.rate_limit_retries:
+                    raise
+                if self.retry_budget is not None and not self.retry_budget.try_retry():
+                    raise
+                attempt += 1
+                if deadline is not None:
+                    wait = e.retry_after
+                    if wait is None:
+                        wait = self.backoff_factor * (2 ** (attempt - 1))
+                    if min(wait, self.max_retry_after) >= deadline.remaining():
+                        raise DeadlineExceededError(
+                            f"Retrying in {wait:.1f}s would exceed the deadline "
+                            f"of {deadline.timeout} seconds"
+                        ) from e
+                self._wait_for_rate_limit(e.retry_after, attempt)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+        parameters: dict[str, Any],
+        stream: bool = False,
+        deadline: Deadline | None = None,
+    ) -> requests.Response:
+        """Send a single request and check the response for errors.
+
+        Args:
+            method: HTTP method to use.
+            url: URL path to access (relative to base_url).
+            body: Request body as a dictionary (will be sent as JSON).
+            headers: Additional headers to send.
+            parameters: Cleaned URL query parameters.
+            stream: Leave the body to be read from the response.
+            deadline: Deadline bounding the request. Its remaining time caps
+                the timeout, including the transport's retries.
+
+        Returns:
+            Response object.
+
+        Raises:
+            APIError: If the request fails.
+            DeadlineExceededError: If the deadline expires first.
+        """
+        data = None
+        if body is not None:
+            data = self.codec.dumps(body)
+            headers = {"Content-Type": "application/json", **(headers or {})}
+
+        endpoint = endpoint_name(url)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(endpoint)
+
+        # Admission waits are bounded by the deadline, so enter its scope first
+        with deadline_scope(deadline), self._admitted(current_priority() or INTERACTIVE):
+            timeout = self.timeout if deadline is None else deadline.clamp(self.timeout)
+            try:
+                response = self.session.request(
+                    method,
+                    url=urljoin(self.base_url, url),
+                    data=data,
+                    params=parameters,
+                    headers=headers,
+                    timeout=timeout,
+                    stream=stream,
+                )
+            except (requests.RequestException, DeadlineExceededError) as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure(endpoint)
+                # A timeout shortened by the deadline is reported as the deadline
+                if deadline is not None and deadline.expired:
+                    raise deadline.error() from e
+                raise
+        self._record_outcome(endpoint, response.status_code)
+        self._handle_response(response)
+        return response
+
+    @contextmanager
+    def _admitted(self, priority: str) -> Iterator[None]:
+        """Wait for the rate limiter and a free in-flight slot.
+
+        Without a scheduler every request takes a token and then one of the
+        ``max_in_flight`` slots. With a scheduler the request takes a slot of
+        its priority class, then a token in priority order. All waits end
+        at the current deadline.
+
+        Args:
+            priority: Priority class of the request.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before the request
+                is admitted.
+        """
+        if self.scheduler is None:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if self._in_flight is None:
+                yield
+                return
+            deadline = current_deadline()
+            if deadline is None:
+                self._in_flight.acquire()
+            else:
+                remaining = deadline.remaining()
+                timeout = None if math.isinf(remaining) else remaining
+                if not self._in_flight.acquire(timeout=timeout):
+                    raise deadline.error()
+            try:
+                yield
+            finally:
+                self._in_flight.release()
+            return
+
+        with self.scheduler.slot(priority):
+            if self.rate_limiter is not None:
+                with self.scheduler.turn(priority):
+                    self.rate_limiter.acquire()
+            yield
+
+    def _record_outcome(self, endpoint: str, status_code: int) -> None:
+        """Report a response to the circuit breaker and the retry budget.
+
+        Args:
+            endpoint: Name of the endpoint the request was sent to.
+            status_code: HTTP status code of the response.
+        """
+        if status_code >= 500:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure(endpoint)
+            return
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success(endpoint)
+        if self.retry_budget is not None and status_code != 429:
+            self.retry_budget.record_success()
+
+    def _wait_for_rate_limit(self, retry_after: float | None, attempt: int) -> None:
+        """Sleep before retrying a request that was answered with 429.
+
+        Waits for ``Retry-After`` when the API sent it, or an exponential
+        backoff otherwise. Up to 10% jitter is added so concurrent page
+        fetches don't retry in lockstep, and the wait is capped at
+        ``max_retry_after``.
+
+        Args:
+            retry_after: Seconds the API asked to wait, if it said so.
+            attempt: Number of the retry that is about to be made, starting at 1.
+        """
+        if retry_after is None:
+            retry_after = self.backoff_factor * (2 ** (attempt - 1))
+        delay = min(retry_after * (1 + random.uniform(0, 0.1)), self.max_retry_after)
+        with self._stats_lock:
+            self.throttled_seconds += delay
+            self.throttled_retries += 1
+        time.sleep(delay)
 
     def get(
         self,
@@ -151,30 +783,177 @@ class RESTAPI:
         body: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
         parameters: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
     ) -> dict[str, Any]:
         """Perform a GET request.
 
+        When a cache is configured, fresh cached responses are returned
+        without a request and successful responses are stored in it. An
+        expired response with an ``ETag`` or ``Last-Modified`` header is
+        revalidated with a conditional request, and reused when the API
+        answers ``304 Not Modified``. Within the cache's ``stale_ttl``, an
+        expired response is returned right away and revalidated in a
+        background thread.
+
+        With ``coalesce_requests``, a GET arriving while an identical GET
+        (same URL, parameters and headers) is in flight waits for that
+        request and receives a copy of its result. Requests with a deadline
+        are not coalesced, as the shared request would not honour it.
+
         Args:
             url: URL path to access (relative to base_url).
             body: Request body (unused for GET, kept for interface consistency).
             headers: Additional headers to send.
             parameters: URL query parameters.
+            deadline: Deadline bounding the request and its retries.
 
         Returns:
             Response JSON as a dictionary.
 
         Raises:
             APIError: If the request fails.
+            DeadlineExceededError: If the deadline expires first.
         """
-        parameters = self._clean_params(parameters)
-        response = self.session.get(
-            url=urljoin(self.base_url, url),
-            params=parameters,
-            headers=headers,
-            timeout=self.timeout,
+        if self.single_flight is None or deadline is not None:
+            return self._get(url, headers, parameters, deadline)
+
+        key = (
+            ResponseCache.key(url, self._clean_params(parameters)),
+            tuple(sorted((headers or {}).items())),
         )
-        self._handle_response(response)
-        return response.json()
+        return self.single_flight.do(key, lambda: self._get(url, headers, parameters))
+
+    def _get(
+        self,
+        url: str,
+        headers: dict[str, Any] | None,
+        parameters: dict[str, Any] | None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """Perform a GET request, through the cache if one is configured.
+
+        Args:
+            url: URL path to access (relative to base_url).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+            deadline: Deadline bounding the request and its retries.
+
+        Returns:
+            Response JSON as a dictionary.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        if self.cache is None:
+            response = self._request(
+                "GET", url, headers=headers, parameters=parameters, deadline=deadline
+            )
+            return self.decode(response)
+
+        key = self.cache.key(url, self._clean_params(parameters))
+        cached: dict[str, Any] | None = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        stale: dict[str, Any] | None = self.cache.get_stale(key)
+        if stale is not None:
+            self._revalidate_in_background(self.cache, key, url, headers, parameters)
+            return stale
+
+        return self._fetch_into_cache(self.cache, key, url, headers, parameters, deadline)
+
+    def _fetch_into_cache(
+        self,
+        cache: ResponseCache,
+        key: CacheKey,
+        url: str,
+        headers: dict[str, Any] | None,
+        parameters: dict[str, Any] | None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """Fetch a response, revalidating the cached copy if possible, and cache it.
+
+        Args:
+            cache: Cache to revalidate against and store the response in.
+            key: Cache key of the request.
+            url: URL path to access (relative to base_url).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+            deadline: Deadline bounding the requests and their retries.
+
+        Returns:
+            Response JSON as a dictionary.
+
+        Raises:
+            APIError: If the request fails.
+        """
+        validators = cache.validators(key)
+        try:
+            response = self._request(
+                "GET",
+                url,
+                headers={**(headers or {}), **validators} if validators else headers,
+                parameters=parameters,
+                deadline=deadline,
+            )
+            if response.status_code == 304:
+                revalidated: dict[str, Any] | None = cache.revalidate(key)
+                if revalidated is not None:
+                    return revalidated
+                # The entry was evicted while revalidating, fetch it in full
+                response = self._request(
+                    "GET", url, headers=headers, parameters=parameters, deadline=deadline
+                )
+        except NotFoundError:
+            cache.set_not_found(key)
+            raise
+
+        data: dict[str, Any] = self.decode(response)
+        cache.set(
+            key,
+            data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return data
+
+    def _revalidate_in_background(
+        self,
+        cache: ResponseCache,
+        key: CacheKey,
+        url: str,
+        headers: dict[str, Any] | None,
+        parameters: dict[str, Any] | None,
+    ) -> None:
+        """Refresh a stale cache entry in a daemon thread.
+
+        At most one refresh per entry runs at a time. When the refresh fails
+        the stale entry stays in the cache until ``stale_ttl`` passes.
+
+        Args:
+            cache: Cache holding the stale entry.
+            key: Cache key of the request.
+            url: URL path to access (relative to base_url).
+            headers: Additional headers to send.
+            parameters: URL query parameters.
+        """
+        with self._stats_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def revalidate() -> None:
+            try:
+                self._fetch_into_cache(cache, key, url, headers, parameters)
+            except (BetterStackError, requests.RequestException):
+                pass
+            finally:
+                with self._stats_lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(
+            target=revalidate, name="betterstack-uptime-revalidate", daemon=True
+        ).start()
 
     def post(
         self,
@@ -182,6 +961,7 @@ class RESTAPI:
         body: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
         parameters: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
     ) -> requests.Response:
         """Perform a POST request.
 
@@ -190,23 +970,16 @@ class RESTAPI:
             body: Request body as a dictionary (will be sent as JSON).
             headers: Additional headers to send.
             parameters: URL query parameters.
+            deadline: Deadline bounding the request and its retries.
 
         Returns:
             Response object.
 
         Raises:
             APIError: If the request fails.
+            DeadlineExceededError: If the deadline expires first.
         """
-        parameters = self._clean_params(parameters)
-        response = self.session.post(
-            url=urljoin(self.base_url, url),
-            json=body,
-            params=parameters,
-            headers=headers,
-            timeout=self.timeout,
-        )
-        self._handle_response(response)
-        return response
+        return self._request("POST", url, body, headers, parameters, deadline=deadline)
 
     def patch(
         self,
@@ -214,6 +987,7 @@ class RESTAPI:
         body: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
         parameters: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
     ) -> requests.Response:
         """Perform a PATCH request.
 
@@ -222,23 +996,16 @@ class RESTAPI:
             body: Request body as a dictionary (will be sent as JSON).
             headers: Additional headers to send.
             parameters: URL query parameters.
+            deadline: Deadline bounding the request and its retries.
 
         Returns:
             Response object.
 
         Raises:
             APIError: If the request fails.
+            DeadlineExceededError: If the deadline expires first.
         """
-        parameters = self._clean_params(parameters)
-        response = self.session.patch(
-            url=urljoin(self.base_url, url),
-            json=body,
-            params=parameters,
-            headers=headers,
-            timeout=self.timeout,
-        )
-        self._handle_response(response)
-        return response
+        return self._request("PATCH", url, body, headers, parameters, deadline=deadline)
 
     def delete(
         self,
@@ -246,6 +1013,7 @@ class RESTAPI:
         body: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
         parameters: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
     ) -> requests.Response:
         """Perform a DELETE request.
 
@@ -254,22 +1022,18 @@ class RESTAPI:
             body: Request body (unused for DELETE).
             headers: Additional headers to send.
             parameters: URL query parameters.
+            deadline: Deadline bounding the request and its retries.
 
         Returns:
             Response object.
 
         Raises:
             APIError: If the request fails.
+            DeadlineExceededError: If the deadline expires first.
         """
-        parameters = self._clean_params(parameters)
-        response = self.session.delete(
-            url=urljoin(self.base_url, url),
-            headers=headers,
-            params=parameters,
-            timeout=self.timeout,
+        return self._request(
+            "DELETE", url, headers=headers, parameters=parameters, deadline=deadline
         )
-        self._handle_response(response)
-        return response
 
 
 class PaginatedAPI(RESTAPI):
@@ -279,8 +1043,23 @@ class PaginatedAPI(RESTAPI):
     and yield all results across multiple pages. Supports concurrent
     fetching of pages for improved performance.
 
+    Pages are fetched on a single executor that is shared by every listing
+    made through this client, so ``max_workers`` bounds the number of
+    concurrent page requests across all callers. The executor is created
+    on first use and shut down by :meth:`close`.
+
     Attributes:
         max_workers: Maximum number of threads for concurrent page fetching.
+        prefetch_window: Maximum number of pages in flight or buffered ahead
+            of the consumer, or None for twice ``max_workers``.
+        concurrency: Adaptive concurrency controller limiting the page requests
+            in flight, or None when ``max_workers`` is the only limit.
+        stream_pages: Whether page items are decoded while the body is downloaded,
+            with the standard library decoder.
+        page_sizer: Sizer choosing ``per_page`` for listings that don't set it,
+            or None to use the server's default page size.
+        speculative_pages: Number of pages requested ahead of a listing
+            without a ``last`` link.
     """
 
     def __init__(
@@ -291,6 +1070,28 @@ class PaginatedAPI(RESTAPI):
         backoff_factor: float = 0.5,
         timeout: float = 30.0,
         max_workers: int = 5,
+        prefetch_window: int | None = None,
+        max_in_flight: int | None = None,
+        executor: Executor | None = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int | None = None,
+        pool_block: bool = False,
+        tcp_keepalive: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        rate_limit_retries: int | None = None,
+        max_retry_after: float = 60.0,
+        adaptive_concurrency: AdaptiveConcurrency | bool = False,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        json_codec: JSONCodec | str = "stdlib",
+        stream_pages: bool = False,
+        compression: bool = True,
+        auto_per_page: PageSizer | bool = False,
+        speculative_pages: int = 0,
+        hedging: HedgingPolicy | bool = False,
+        circuit_breaker: CircuitBreaker | bool = False,
+        retry_budget: RetryBudget | bool = False,
+        priorities: PriorityScheduler | bool = False,
     ) -> None:
         """Initialize PaginatedAPI with threading configuration.
 
@@ -301,9 +1102,197 @@ class PaginatedAPI(RESTAPI):
             backoff_factor: Backoff factor for retry delays.
             timeout: Default timeout for requests in seconds.
             max_workers: Maximum number of threads for concurrent page fetching.
+            prefetch_window: Maximum number of pages in flight or buffered ahead
+                of the consumer. Bounds memory on large listings, applies
+                backpressure when the consumer is slow and lets concurrent
+                listings take turns on the shared executor. Defaults to twice
+                ``max_workers``.
+            max_in_flight: Maximum number of requests in flight at once across
+                all threads using this client, or None for no limit.
+            executor: Executor to fetch pages on. It is not shut down by
+                :meth:`close`. When omitted, a thread pool of ``max_workers``
+                threads is created on first use.
+            pool_connections: Number of per-host connection pools to keep.
+            pool_maxsize: Maximum number of connections kept open per host.
+                Defaults to enough connections for every page worker plus the
+                calling thread.
+            pool_block: Wait for a pooled connection to become free instead of
+                opening (and then discarding) an extra connection.
+            tcp_keepalive: Enable TCP keep-alive probes on pooled connections.
+            rate_limiter: Rate limiter every request waits on, shared by all threads
+                using this client.
+            rate_limit_retries: Number of times a request answered with 429 is retried
+                after waiting for ``Retry-After``, by default ``retries``.
+            max_retry_after: Upper bound in seconds on a single wait before retrying
+                a 429 response.
+            adaptive_concurrency: Tune the number of page requests in flight with an
+                AIMD controller. True creates an
+                :class:`~betterstack.uptime.concurrency.AdaptiveConcurrency` growing up to
+                ``max_workers``; pass a controller to configure it.
+            cache: Cache serving GET responses while they are fresh,
+                shared by all threads using this client.
+            coalesce_requests: Let concurrent identical GET requests share a
+                single request and its result.
+            json_codec: JSON codec used to encode request bodies and decode
+                responses, or its name: ``"stdlib"``, ``"orjson"``, ``"msgspec"`` or
+                ``"auto"`` for the fastest one installed. Not used for the pages of
+                listings when ``stream_pages`` is set.
+            stream_pages: Decode the items of each page while its body is
+                downloaded instead of after, keeping roughly one item in memory per page.
+                Pages are then not cached or coalesced, and are always decoded with the
+                standard library ``json`` module rather than ``json_codec``.
+            compression: Ask for gzip/deflate compressed responses, plus brotli
+                and zstd when their packages are installed. Disable to receive
+                uncompressed bodies.
+            auto_per_page: Request the largest page size each endpoint supports
+                for collection listings that don't pass ``per_page``, or pass a
+                :class:`~betterstack.uptime.pagesize.PageSizer` to configure limits
+                and latency tuning.
+            speculative_pages: Number of pages to request ahead, by guessing their
+                page numbers, when a listing has no ``last`` link. 0 follows
+                ``next`` links one request at a time.
+            hedging: Race GET requests that are slower than the 95th percentile
+                latency against a second identical request, for at most 5% of the
+                requests, or pass a :class:`~betterstack.uptime.concurrency.HedgingPolicy`
+                to configure this.
+            circuit_breaker: Stop sending requests to an endpoint after 5 consecutive
+                failures, failing fast with ServerError for 30 seconds, or pass a
+                :class:`~betterstack.uptime.circuit.CircuitBreaker` to configure this.
+            retry_budget: Cap the retries of the client at 10% of its recent
+                successful requests (plus 10 per 10 seconds), or pass a
+                :class:`~betterstack.uptime.circuit.RetryBudget` to configure this.
+            priorities: Give interactive requests (single objects and writes) their
+                own in-flight slots and precedence at the rate limiter over the bulk
+                pages of listings, or pass a
+                :class:`~betterstack.uptime.scheduling.PriorityScheduler` to set the
+                slots per class. With True, ``max_in_flight`` is required and limits
+                bulk requests only. A scheduler sets all limits itself, so it can't be
+                combined with ``max_in_flight``.
+
+        Raises:
+            ValueError: If prefetch_window is smaller than 1, speculative_pages
+                is negative, or ``priorities`` and ``max_in_flight`` don't fit
+                together.
         """
-        super().__init__(base_url, auth, retries, backoff_factor, timeout)
+        if prefetch_window is not None and prefetch_window < 1:
+            raise ValueError("prefetch_window should be at least 1")
+        if speculative_pages < 0:
+            raise ValueError("speculative_pages should not be negative")
+
+        if pool_maxsize is None:
+            pool_maxsize = max(DEFAULT_POOLSIZE, max_workers + 1, max_in_flight or 0)
+
+        super().__init__(
+            base_url,
+            auth,
+            retries,
+            backoff_factor,
+            timeout,
+            max_in_flight,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+            rate_limiter=rate_limiter,
+            rate_limit_retries=rate_limit_retries,
+            max_retry_after=max_retry_after,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            json_codec=json_codec,
+            compression=compression,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            priorities=priorities,
+        )
         self.max_workers = max_workers
+        self.prefetch_window = prefetch_window
+        self.stream_pages = stream_pages
+        self.speculative_pages = speculative_pages
+        self.page_sizer: PageSizer | None
+        if auto_per_page is True:
+            self.page_sizer = PageSizer()
+        elif auto_per_page is False:
+            self.page_sizer = None
+        else:
+            self.page_sizer = auto_per_page
+        self.concurrency: AdaptiveConcurrency | None
+        if adaptive_concurrency is True:
+            self.concurrency = AdaptiveConcurrency(
+                initial_limit=min(2, max_workers), max_limit=max_workers
+            )
+        elif adaptive_concurrency is False:
+            self.concurrency = None
+        else:
+            self.concurrency = adaptive_concurrency
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor:
+        """Executor used to fetch pages, created on first use.
+
+        Returns:
+            The shared page executor.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="betterstack-uptime",
+                    )
+        return self._executor
+
+    def warm_up(self, connections: int | None = None, keep_alive: float | None = None) -> int:
+        """Open pooled connections to the API, by default one per page worker.
+
+        See :meth:`RESTAPI.warm_up`.
+
+        Args:
+            connections: Number of connections to open, by default ``max_workers``.
+            keep_alive: Seconds between keep-alive rounds, or None.
+
+        Returns:
+            The number of connections opened.
+        """
+        if connections is None:
+            connections = self.max_workers
+        return super().warm_up(connections, keep_alive)
+
+    def close(self) -> None:
+        """Shut down the page executor (if owned) and close the session."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        super().close()
+
+    def _hedgeable(self, call: Callable[[], requests.Response]) -> Callable[[], requests.Response]:
+        """Carry the request context over, and report 429s of the copy to this thread's slot.
+
+        Args:
+            call: The request to run on another thread.
+
+        Returns:
+            A function running ``call`` within the current request context.
+        """
+        hedged = super()._hedgeable(call)
+        if self.concurrency is not None:
+            hedged = self.concurrency.bind(hedged)
+        return hedged
+
+    def _wait_for_rate_limit(self, retry_after: float | None, attempt: int) -> None:
+        """Report the 429 to the concurrency controller, then wait before retrying.
+
+        Args:
+            retry_after: Seconds the API asked to wait, if it said so.
+            attempt: Number of the retry that is about to be made, starting at 1.
+        """
+        if self.concurrency is not None:
+            self.concurrency.throttled()
+        super()._wait_for_rate_limit(retry_after, attempt)
 
     def get(
         self,
@@ -311,39 +1300,65 @@ class PaginatedAPI(RESTAPI):
         body: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
         parameters: dict[str, Any] | None = None,
+        ordered: bool = True,
+        deadline: Deadline | None = None,
+        listing: bool = False,
     ) -> Generator[dict[str, Any], None, None]:
         """Perform a GET request with automatic pagination and concurrent fetching.
 
         This method fetches the first page to determine total pages, then
         fetches remaining pages concurrently using a thread pool. Results
-        are yielded in page order.
+        are yielded in page order, each page as soon as all pages before
+        it are available. Closing the generator early (for example by
+        breaking out of a loop) cancels all pending page requests, and so
+        does an expired deadline.
 
         Args:
             url: URL path to access (relative to base_url).
             body: Request body (unused for GET).
             headers: Additional headers to send.
             parameters: URL query parameters.
+            ordered: Yield pages in page order. When False, the items of each
+                page are yielded as soon as that page arrives, which lowers the
+                time to first item for consumers that don't depend on order.
+            deadline: Deadline bounding the whole listing: every page request
+                and its retries. Pages still pending when it expires are
+                cancelled.
+            listing: The URL is a collection listing, so ``auto_per_page`` may
+                choose its page size. Other URLs, such as single objects and
+                sub-resources like ``monitors/1/sla``, are requested unchanged.
 
         Yields:
             Individual items from the response data array.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before the last page.
         """
         if parameters is None:
             parameters = {}
 
-        # Fetch first page to get pagination info
-        data = super().get(url, body, headers, parameters)
+        per_page = None
+        if listing and self.page_sizer is not None and "per_page" not in parameters:
+            per_page = self.page_sizer.per_page(url)
+            if per_page is not None:
+                parameters = {**parameters, "per_page": per_page}
+
+        # Fetch first page to get pagination info, yielding its items
+        started = time.monotonic()
+        page = self._get_page(url, headers, parameters, deadline)
+        latency = time.monotonic() - started
+        data = yield from self._page_items(page)
 
-        # For single objects, yield and return
+        # Single objects have no further pages
         if isinstance(data.get("data"), dict):
-            yield data["data"]
             return
 
-        # Yield results from first page
-        for item in data.get("data", []):
-            yield item
+        pagination = data.get("pagination", {})
+        if self.page_sizer is not None and per_page is not None:
+            items = page.count if isinstance(page, StreamingPage) else len(data.get("data") or [])
+            self.page_sizer.observe(url, per_page, items, bool(pagination.get("next")), latency)
 
         # Check if there are more pages
-        pagination = data.get("pagination", {})
         if not pagination.get("next"):
             return
 
@@ -352,34 +1367,296 @@ class PaginatedAPI(RESTAPI):
         total_pages = self._get_total_pages(pagination)
 
         if total_pages is None:
+            next_page = self._next_page_number(pagination["next"], parameters)
+            if self.speculative_pages and next_page is not None:
+                # Guess the following page numbers, stopping at the last page
+                yield from self._fetch_pages_concurrent(
+                    url,
+                    headers,
+                    self._next_page_parameters(pagination["next"], parameters),
+                    itertools.count(next_page),
+                    deadline=deadline,
+                )
+                return
+
             # Fall back to sequential fetching if we can't determine total pages
-            yield from self._fetch_pages_sequential(url, headers, parameters, data)
+            yield from self._fetch_pages_sequential(url, headers, parameters, data, deadline)
             return
 
         if total_pages <= 1:
             return
 
-        # Fetch remaining pages concurrently
-        pages_data: dict[int, list[dict[str, Any]]] = {}
+        yield from self._fetch_pages_concurrent(
+            url, headers, parameters, range(2, total_pages + 1), ordered, deadline
+        )
+
+    @property
+    def _streaming(self) -> bool:
+        """Whether pages are streamed, which caching and coalescing rule out."""
+        return self.stream_pages and self.cache is None and self.single_flight is None
+
+    def _get_page(
+        self,
+        url: str,
+        headers: dict[str, Any] | None,
+        parameters: dict[str, Any],
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any] | StreamingPage:
+        """Request a single page.
+
+        Pages of listings are sent with ``bulk`` priority and single objects
+        with ``interactive`` priority, unless the caller set a priority.
+
+        Args:
+            url: URL path to access.
+            headers: Additional headers to send.
+            parameters: URL query parameters, including the page number.
+            deadline: Deadline bounding the request and its retries.
+
+        Returns:
+            The decoded page, or a :class:`StreamingPage` decoding the body
+            while it is read when ``stream_pages`` is enabled.
+        """
+        priority = current_priority()
+        if priority is None:
+            priority = INTERACTIVE if endpoint_name(url).endswith("{id}") else BULK
+
+        with request_priority(priority):
+            if not self._streaming:
+                return super().get(url, None, headers, parameters, deadline)
+            response = self._request(
+                "GET", url, headers=headers, parameters=parameters, stream=True, deadline=deadline
+            )
+        decoded_bytes = 0
+
+        def chunks() -> Generator[bytes, None, None]:
+            nonlocal decoded_bytes
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                decoded_bytes += len(chunk)
+                yield chunk
+
+        def close() -> None:
+            self.transfer.record(
+                endpoint_name(response.url, self._base_path),
+                wire_bytes=self._wire_bytes(response, decoded_bytes),
+                decoded_bytes=decoded_bytes,
+                encoding=response.headers.get("Content-Encoding"),
+            )
+            response.close()
 
-        # Capture parent's get method before entering executor context
-        parent_get = super().get
+        return StreamingPage(chunks(), on_close=close)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(parent_get, url, None, headers, {**parameters, "page": page}): page
-                for page in range(2, total_pages + 1)
-            }
+    @staticmethod
+    def _page_items(
+        page: dict[str, Any] | StreamingPage,
+    ) -> Generator[dict[str, Any], None, dict[str, Any]]:
+        """Yield the items of a page.
+
+        The ``data`` member of a single object response is yielded as the
+        only item.
+
+        Args:
+            page: Page returned by :meth:`_get_page`.
+
+        Yields:
+            Individual items from the response data array.
+
+        Returns:
+            The top-level members of the page, without a streamed ``data`` array.
+        """
+        if isinstance(page, StreamingPage):
+            try:
+                yield from page
+            finally:
+                page.close()
+            document = page.document
+        else:
+            document = page
+            if isinstance(document.get("data"), list):
+                yield from document["data"]
+
+        if isinstance(document.get("data"), dict):
+            yield document["data"]
+        return document
+
+    @staticmethod
+    def _close_page(future: Future[dict[str, Any] | StreamingPage]) -> None:
+        """Release the body of a streamed page that will not be consumed.
+
+        Args:
+            future: Finished page future.
+        """
+        if future.cancelled() or future.exception() is not None:
+            return
+        page = future.result()
+        if isinstance(page, StreamingPage):
+            page.close()
+
+    @staticmethod
+    def _wait_first(
+        futures: Iterable[Future[dict[str, Any] | StreamingPage]], deadline: Deadline | None
+    ) -> Future[dict[str, Any] | StreamingPage]:
+        """Wait for the first of some page futures to finish.
+
+        Args:
+            futures: Page futures to wait for.
+            deadline: Deadline to give up at, or None to wait indefinitely.
+
+        Returns:
+            A finished future.
 
-            for future in as_completed(futures):
-                page_num = futures[future]
+        Raises:
+            DeadlineExceededError: If the deadline expires first.
+        """
+        while True:
+            timeout = None
+            if deadline is not None:
+                deadline.check()
+                timeout = min(deadline.remaining(), DEADLINE_POLL_INTERVAL)
+            done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+            if done:
+                return next(iter(done))
+
+    def _fetch_pages_concurrent(
+        self,
+        url: str,
+        headers: dict[str, Any] | None,
+        parameters: dict[str, Any],
+        pages: range | Iterator[int],
+        ordered: bool = True,
+        deadline: Deadline | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """Fetch pages concurrently and yield their items.
+
+        At most ``prefetch_window`` pages are requested ahead of the page
+        being consumed; a new page is only requested once the consumer
+        moves on, so a slow consumer throttles fetching. Closing the
+        generator cancels every page that has not been sent yet.
+
+        An open-ended iterator of page numbers is fetched speculatively,
+        ``speculative_pages`` ahead and in page order, until a page without
+        a ``next`` link or without items. Pages requested beyond it are
+        discarded.
+
+        Args:
+            url: URL path to access.
+            headers: Additional headers to send.
+            parameters: Base URL query parameters.
+            pages: Page numbers to fetch.
+            ordered: Yield pages in page order rather than in completion order.
+            deadline: Deadline bounding the page requests. Pending pages are
+                cancelled when it expires.
+
+        Yields:
+            Individual items from response data arrays.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before the last page.
+        """
+        speculative = not isinstance(pages, range)
+        if isinstance(pages, range):
+            # Bounded by default, so a long listing doesn't queue all its pages
+            # ahead of the pages of other listings on the shared executor
+            window = self.prefetch_window or 2 * self.max_workers
+        else:
+            window = self.speculative_pages
+            ordered = True
+        if self._streaming:
+            # Every streamed page holds a pooled connection until it is consumed
+            window = min(window, self.max_workers)
+        remaining = iter(pages)
+
+        executor = self.executor
+        concurrency = self.concurrency
+        pending: deque[Future[dict[str, Any] | StreamingPage]] = deque()
+
+        # Worker threads don't see the priority the caller set
+        priority = current_priority() or BULK
+
+        def fetch_page(page: int) -> dict[str, Any] | StreamingPage:
+            with request_priority(priority), deadline_scope(deadline):
+                if concurrency is None:
+                    return self._get_page(url, headers, {**parameters, "page": page}, deadline)
+                with concurrency.slot():
+                    return self._get_page(url, headers, {**parameters, "page": page}, deadline)
+
+        def submit_next() -> None:
+            page = next(remaining, None)
+            if page is not None:
+                pending.append(executor.submit(fetch_page, page))
+
+        try:
+            for _ in range(window):
+                submit_next()
+
+            while pending:
+                if ordered:
+                    future = self._wait_first([pending[0]], deadline)
+                    pending.popleft()
+                else:
+                    future = self._wait_first(pending, deadline)
+                    pending.remove(future)
                 page_data = future.result()
-                pages_data[page_num] = page_data.get("data", [])
+                submit_next()
+                document = yield from self._page_items(page_data)
+                if speculative and self._is_last_page(page_data, document):
+                    return
+        finally:
+            # Reached when the consumer stops early (close, GC or an exception):
+            # drop queued pages and don't wait for requests already on the wire.
+            for future in pending:
+                if not future.cancel():
+                    future.add_done_callback(self._close_page)
+
+    @staticmethod
+    def _is_last_page(page: dict[str, Any] | StreamingPage, document: dict[str, Any]) -> bool:
+        """Check whether a consumed page ends its listing.
+
+        Args:
+            page: Page returned by :meth:`_get_page`.
+            document: Top-level members of the page returned by :meth:`_page_items`.
+
+        Returns:
+            True when the page has no ``next`` link or holds no items.
+        """
+        if not document.get("pagination", {}).get("next"):
+            return True
+        if isinstance(page, StreamingPage):
+            return page.count == 0
+        return not document.get("data")
+
+    @staticmethod
+    def _next_page_parameters(next_url: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Merge the query parameters of a ``next`` link into the base parameters.
+
+        Args:
+            next_url: The ``next`` link of a page.
+            parameters: Base URL query parameters.
+
+        Returns:
+            The parameters to request the linked page with.
+        """
+        return next_page_parameters(next_url, parameters)
+
+    def _next_page_number(self, next_url: str, parameters: dict[str, Any]) -> int | None:
+        """Extract the page number of a ``next`` link that pages by number.
 
-        # Yield results in page order
-        for page_num in sorted(pages_data.keys()):
-            for item in pages_data[page_num]:
-                yield item
+        Args:
+            next_url: The ``next`` link of a page.
+            parameters: Base URL query parameters.
+
+        Returns:
+            The page number, or None when the link has no numeric ``page``
+            parameter or carries parameters the request didn't (such as a
+            cursor), so following pages can't be guessed.
+        """
+        page_params = parse_qs(urlparse(next_url).query)
+        page = page_params.pop("page", [""])
+        if len(page) != 1 or not page[0].isdigit():
+            return None
+        if not set(page_params) <= set(self._clean_params(parameters)):
+            return None
+        return int(page[0])
 
     def _get_total_pages(self, pagination: dict[str, Any]) -> int | None:
         """Extract total page count from pagination info.
@@ -390,17 +1667,7 @@ class PaginatedAPI(RESTAPI):
         Returns:
             Total number of pages, or None if not determinable.
         """
-        # Try to get last page URL and extract page number
-        last_url = pagination.get("last")
-        if last_url:
-            parsed = urlparse(last_url)
-            params = parse_qs(parsed.query)
-            if "page" in params:
-                try:
-                    return int(params["page"][0])
-                except (ValueError, IndexError):
-                    pass
-        return None
+        return total_pages(pagination)
 
     def _fetch_pages_sequential(
         self,
@@ -408,6 +1675,7 @@ class PaginatedAPI(RESTAPI):
         headers: dict[str, Any] | None,
         parameters: dict[str, Any],
         current_data: dict[str, Any],
+        deadline: Deadline | None = None,
     ) -> Generator[dict[str, Any], None, None]:
         """Fetch pages sequentially when total pages is unknown.
 
@@ -416,20 +1684,15 @@ class PaginatedAPI(RESTAPI):
             headers: Additional headers to send.
             parameters: Base URL query parameters.
             current_data: Current page data with pagination info.
+            deadline: Deadline bounding the page requests.
 
         Yields:
             Individual items from response data arrays.
         """
         data = current_data
         while data.get("pagination", {}).get("next"):
-            next_url = data["pagination"]["next"]
-            parsed = urlparse(next_url)
-            page_params = parse_qs(parsed.query)
-            params = {**parameters}
-            params.update({k: v[0] if len(v) == 1 else v for k, v in page_params.items()})
-
-            data = super().get(url, None, headers, params)
-            yield from data.get("data", [])
+            params = self._next_page_parameters(data["pagination"]["next"], parameters)
+            data = yield from self._page_items(self._get_page(url, headers, params, deadline))
 
 
 class UptimeAPI(PaginatedAPI):
@@ -456,6 +1719,27 @@ class UptimeAPI(PaginatedAPI):
         backoff_factor: float = 0.5,
         timeout: float = 30.0,
         max_workers: int = 5,
+        prefetch_window: int | None = None,
+        max_in_flight: int | None = None,
+        executor: Executor | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool = False,
+        tcp_keepalive: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        rate_limit_retries: int | None = None,
+        max_retry_after: float = 60.0,
+        adaptive_concurrency: AdaptiveConcurrency | bool = False,
+        cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        json_codec: JSONCodec | str = "stdlib",
+        stream_pages: bool = False,
+        compression: bool = True,
+        auto_per_page: PageSizer | bool = False,
+        speculative_pages: int = 0,
+        hedging: HedgingPolicy | bool = False,
+        circuit_breaker: CircuitBreaker | bool = False,
+        retry_budget: RetryBudget | bool = False,
+        priorities: PriorityScheduler | bool = False,
     ) -> None:
         """Initialize UptimeAPI with bearer token authentication.
 
@@ -465,6 +1749,66 @@ class UptimeAPI(PaginatedAPI):
             backoff_factor: Backoff factor for retry delays.
             timeout: Default timeout for requests in seconds.
             max_workers: Maximum number of threads for concurrent page fetching.
+            prefetch_window: Maximum number of pages in flight or buffered ahead
+                of the consumer, by default twice ``max_workers``.
+            max_in_flight: Maximum number of requests in flight at once across
+                all threads using this client, or None for no limit.
+            executor: Executor to fetch pages on instead of a thread pool owned
+                by the client.
+            pool_maxsize: Maximum number of pooled connections, by default
+                derived from ``max_workers``.
+            pool_block: Wait for a pooled connection to become free instead of
+                opening (and then discarding) an extra connection.
+            tcp_keepalive: Enable TCP keep-alive probes on pooled connections.
+            rate_limiter: Rate limiter every request waits on, shared by all threads
+                using this client.
+            rate_limit_retries: Number of times a request answered with 429 is retried
+                after waiting for ``Retry-After``, by default ``retries``.
+            max_retry_after: Upper bound in seconds on a single wait before retrying
+                a 429 response.
+            adaptive_concurrency: Tune the number of page requests in flight with an
+                AIMD controller. True creates an
+                :class:`~betterstack.uptime.concurrency.AdaptiveConcurrency` growing up to
+                ``max_workers``; pass a controller to configure it.
+            cache: Cache serving GET responses while they are fresh,
+                shared by all threads using this client.
+            coalesce_requests: Let concurrent identical GET requests share a
+                single request and its result.
+            json_codec: JSON codec used to encode request bodies and decode
+                responses, or its name: ``"stdlib"``, ``"orjson"``, ``"msgspec"`` or
+                ``"auto"`` for the fastest one installed. Not used for the pages of
+                listings when ``stream_pages`` is set.
+            stream_pages: Decode the items of each page while its body is
+                downloaded instead of after, keeping roughly one item in memory per page.
+                Pages are then not cached or coalesced, and are always decoded with the
+                standard library ``json`` module rather than ``json_codec``.
+            compression: Ask for gzip/deflate compressed responses, plus brotli
+                and zstd when their packages are installed. Disable to receive
+                uncompressed bodies.
+            auto_per_page: Request the largest page size each endpoint supports
+                for collection listings that don't pass ``per_page``, or pass a
+                :class:`~betterstack.uptime.pagesize.PageSizer` to configure limits
+                and latency tuning.
+            speculative_pages: Number of pages to request ahead, by guessing their
+                page numbers, when a listing has no ``last`` link. 0 follows
+                ``next`` links one request at a time.
+            hedging: Race GET requests that are slower than the 95th percentile
+                latency against a second identical request, for at most 5% of the
+                requests, or pass a :class:`~betterstack.uptime.concurrency.HedgingPolicy`
+                to configure this.
+            circuit_breaker: Stop sending requests to an endpoint after 5 consecutive
+                failures, failing fast with ServerError for 30 seconds, or pass a
+                :class:`~betterstack.uptime.circuit.CircuitBreaker` to configure this.
+            retry_budget: Cap the retries of the client at 10% of its recent
+                successful requests (plus 10 per 10 seconds), or pass a
+                :class:`~betterstack.uptime.circuit.RetryBudget` to configure this.
+            priorities: Give interactive requests (single objects and writes) their
+                own in-flight slots and precedence at the rate limiter over the bulk
+                pages of listings, or pass a
+                :class:`~betterstack.uptime.scheduling.PriorityScheduler` to set the
+                slots per class. With True, ``max_in_flight`` is required and limits
+                bulk requests only. A scheduler sets all limits itself, so it can't be
+                combined with ``max_in_flight``.
         """
         super().__init__(
             base_url=self.BETTERSTACK_API_URL,
@@ -473,4 +1817,25 @@ class UptimeAPI(PaginatedAPI):
             backoff_factor=backoff_factor,
             timeout=timeout,
             max_workers=max_workers,
+            prefetch_window=prefetch_window,
+            max_in_flight=max_in_flight,
+            executor=executor,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+            rate_limiter=rate_limiter,
+            rate_limit_retries=rate_limit_retries,
+            max_retry_after=max_retry_after,
+            adaptive_concurrency=adaptive_concurrency,
+            cache=cache,
+            coalesce_requests=coalesce_requests,
+            json_codec=json_codec,
+            stream_pages=stream_pages,
+            compression=compression,
+            auto_per_page=auto_per_page,
+            speculative_pages=speculative_pages,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            priorities=priorities,
         )
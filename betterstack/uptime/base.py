@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -16,7 +16,9 @@ from .exceptions import ValidationError
 from .helpers import filter_on_attribute
 
 if TYPE_CHECKING:
+    from .aio import AsyncPaginatedAPI
     from .api import PaginatedAPI
+    from .deadline import Deadline
 
 
 @dataclass
@@ -28,6 +30,7 @@ class BaseAPIObject:
     - Change tracking for efficient updates (only modified fields are sent)
     - CRUD operations (fetch, save, delete)
     - Class methods for querying and creating objects
+    - ``a``-prefixed coroutine counterparts for use with the asyncio client
 
     The hybrid approach stores known fields as dataclass fields with proper types,
     while unknown fields from the API are stored in the `_extras` dictionary.
@@ -161,21 +164,29 @@ class BaseAPIObject:
         """
         return cls._url_endpoint
 
-    def fetch_data(self, **kwargs: Any) -> None:
+    def fetch_data(self, deadline: Deadline | None = None, **kwargs: Any) -> None:
         r"""Fetch all attributes from the API.
 
         Args:
+            deadline: Deadline bounding the request and its retries.
             \*\*kwargs: Additional parameters for the API request.
         """
-        data = next(self._api.get(self.generate_url(), parameters=kwargs))
+        items = self._api.get(self.generate_url(), parameters=kwargs, deadline=deadline)
+        try:
+            data = next(items)
+        finally:
+            items.close()
         for key, value in data.get("attributes", {}).items():
             self._set_attribute(key, value)
         self.reset_variable_tracking()
 
-    def save(self) -> None:
+    def save(self, deadline: Deadline | None = None) -> None:
         """Update all changed attributes on the API.
 
         Only sends modified attributes to minimize API payload.
+
+        Args:
+            deadline: Deadline bounding the request and its retries.
         """
         modified = self.get_modified_properties()
         if not modified:
@@ -185,8 +196,8 @@ class BaseAPIObject:
         for var in modified:
             data[var] = self._get_attribute(var)
 
-        response = self._api.patch(self.generate_url(), body=data)
-        response_data = response.json()
+        response = self._api.patch(self.generate_url(), body=data, deadline=deadline)
+        response_data = self._api.decode(response)
 
         # Update local state with response
         for key, value in response_data.get("data", {}).get("attributes", {}).items():
@@ -194,12 +205,18 @@ class BaseAPIObject:
 
         self.reset_variable_tracking()
 
-    def delete(self) -> None:
-        """Delete this object from the API."""
-        self._api.delete(url=self.generate_url())
+    def delete(self, deadline: Deadline | None = None) -> None:
+        """Delete this object from the API.
+
+        Args:
+            deadline: Deadline bounding the request and its retries.
+        """
+        self._api.delete(url=self.generate_url(), deadline=deadline)
 
     @classmethod
-    def get_or_create(cls, api: PaginatedAPI, **kwargs: Any) -> tuple[bool, Self]:
+    def get_or_create(
+        cls, api: PaginatedAPI, deadline: Deadline | None = None, **kwargs: Any
+    ) -> tuple[bool, Self]:
         r"""Get an existing object or create a new one.
 
         Attempts to find an object matching the given attributes. If no match
@@ -207,6 +224,7 @@ class BaseAPIObject:
 
         Args:
             api: API instance.
+            deadline: Deadline bounding the lookup and the creation together.
             \*\*kwargs: Attributes to search for or use when creating.
 
         Returns:
@@ -217,10 +235,10 @@ class BaseAPIObject:
             ValueError: If multiple objects match the criteria.
         """
         try:
-            instances = list(cls.filter(api, **kwargs))
+            instances = list(cls.filter(api, deadline=deadline, **kwargs))
         except (ValueError, ValidationError):
             # Filter not supported, fall back to get all and filter locally
-            instances = list(cls.get_all_instances(api))
+            instances = list(cls.get_all_instances(api, deadline=deadline))
             for key, value in kwargs.items():
                 instances = filter_on_attribute(instances, key, value)
 
@@ -229,31 +247,41 @@ class BaseAPIObject:
                 f"Multiple matches on get_or_create for {cls.__name__}, expected unique match"
             )
         elif len(instances) == 0:
-            return True, cls.new(api, **kwargs)
+            return True, cls.new(api, deadline=deadline, **kwargs)
         else:
             return False, instances[0]
 
     @classmethod
-    def new(cls, api: PaginatedAPI, **kwargs: Any) -> Self:
+    def new(cls, api: PaginatedAPI, deadline: Deadline | None = None, **kwargs: Any) -> Self:
         r"""Create a new object on the API.
 
         Args:
             api: API instance.
+            deadline: Deadline bounding the request and its retries.
             \*\*kwargs: Attributes for the new object.
 
         Returns:
             The newly created object.
         """
-        response = api.post(cls.generate_global_url(), body=kwargs)
-        response_data = response.json()
+        response = api.post(cls.generate_global_url(), body=kwargs, deadline=deadline)
+        response_data = api.decode(response)
         return cls._from_api_response(api, response_data["data"])
 
     @classmethod
-    def filter(cls, api: PaginatedAPI, **kwargs: Any) -> Generator[Self, None, None]:
+    def filter(
+        cls,
+        api: PaginatedAPI,
+        ordered: bool = True,
+        deadline: Deadline | None = None,
+        **kwargs: Any,
+    ) -> Generator[Self, None, None]:
         r"""Filter objects using URL query parameters.
 
         Args:
             api: API instance with pagination support.
+            ordered: Yield objects in page order. Pass False to receive each
+                page as soon as it arrives.
+            deadline: Deadline bounding the whole listing.
             \*\*kwargs: Query parameters to filter by.
 
         Yields:
@@ -263,22 +291,128 @@ class BaseAPIObject:
             ValidationError: If a filter parameter is not allowed.
         """
         cls._validate_query_options(**kwargs)
-        for item in api.get(cls.generate_global_url(), parameters=kwargs):
+        listing = api.get(
+            cls.generate_global_url(),
+            parameters=kwargs,
+            ordered=ordered,
+            deadline=deadline,
+            listing=True,
+        )
+        for item in listing:
             yield cls._from_api_response(api, item)
 
     @classmethod
-    def get_all_instances(cls, api: PaginatedAPI) -> Generator[Self, None, None]:
+    def get_all_instances(
+        cls, api: PaginatedAPI, ordered: bool = True, deadline: Deadline | None = None
+    ) -> Generator[Self, None, None]:
         """Fetch all objects of this type from the API.
 
         Args:
             api: API instance with pagination support.
+            ordered: Yield objects in page order. Pass False to receive each
+                page as soon as it arrives.
+            deadline: Deadline bounding the whole listing. Pages still pending
+                when it expires are cancelled.
 
         Yields:
             All objects of this type.
         """
-        for item in api.get(cls.generate_global_url()):
+        listing = api.get(
+            cls.generate_global_url(), ordered=ordered, deadline=deadline, listing=True
+        )
+        for item in listing:
             yield cls._from_api_response(api, item)
 
+    async def afetch_data(self, **kwargs: Any) -> None:
+        r"""Fetch all attributes from the API using an asyncio client.
+
+        Args:
+            \*\*kwargs: Additional parameters for the API request.
+        """
+        api = cast("AsyncPaginatedAPI", self._api)
+        items = api.get(self.generate_url(), parameters=kwargs)
+        try:
+            data = await anext(items)
+        finally:
+            await items.aclose()
+        for key, value in data.get("attributes", {}).items():
+            self._set_attribute(key, value)
+        self.reset_variable_tracking()
+
+    async def asave(self) -> None:
+        """Update all changed attributes on the API using an asyncio client.
+
+        Only sends modified attributes to minimize API payload.
+        """
+        modified = self.get_modified_properties()
+        if not modified:
+            return
+
+        data = {}
+        for var in modified:
+            data[var] = self._get_attribute(var)
+
+        api = cast("AsyncPaginatedAPI", self._api)
+        response = await api.patch(self.generate_url(), body=data)
+        response_data = response.json()
+
+        # Update local state with response
+        for key, value in response_data.get("data", {}).get("attributes", {}).items():
+            self._set_attribute(key, value)
+
+        self.reset_variable_tracking()
+
+    async def adelete(self) -> None:
+        """Delete this object from the API using an asyncio client."""
+        api = cast("AsyncPaginatedAPI", self._api)
+        await api.delete(url=self.generate_url())
+
+    @classmethod
+    async def anew(cls, api: AsyncPaginatedAPI, **kwargs: Any) -> Self:
+        r"""Create a new object on the API using an asyncio client.
+
+        Args:
+            api: Asynchronous API instance.
+            \*\*kwargs: Attributes for the new object.
+
+        Returns:
+            The newly created object.
+        """
+        response = await api.post(cls.generate_global_url(), body=kwargs)
+        response_data = response.json()
+        return cls._from_api_response(cast("PaginatedAPI", api), response_data["data"])
+
+    @classmethod
+    async def afilter(cls, api: AsyncPaginatedAPI, **kwargs: Any) -> AsyncGenerator[Self, None]:
+        r"""Filter objects using URL query parameters with an asyncio client.
+
+        Args:
+            api: Asynchronous API instance with pagination support.
+            \*\*kwargs: Query parameters to filter by.
+
+        Yields:
+            Objects matching the filter criteria.
+
+        Raises:
+            ValidationError: If a filter parameter is not allowed.
+        """
+        cls._validate_query_options(**kwargs)
+        async for item in api.get(cls.generate_global_url(), parameters=kwargs):
+            yield cls._from_api_response(cast("PaginatedAPI", api), item)
+
+    @classmethod
+    async def aget_all_instances(cls, api: AsyncPaginatedAPI) -> AsyncGenerator[Self, None]:
+        """Fetch all objects of this type from the API with an asyncio client.
+
+        Args:
+            api: Asynchronous API instance with pagination support.
+
+        Yields:
+            All objects of this type.
+        """
+        async for item in api.get(cls.generate_global_url()):
+            yield cls._from_api_response(cast("PaginatedAPI", api), item)
+
     @classmethod
     def _from_api_response(cls, api: PaginatedAPI, data: dict[str, Any]) -> Self:
         """Create an instance from API response data.
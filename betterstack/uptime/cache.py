@@ -0,0 +1,718 @@
+"""Response caching for the BetterStack Uptime API clients.
+
+A :class:`ResponseCache` sits in front of ``RESTAPI.get`` and serves
+decoded responses from memory while they are fresh. Entries are keyed on
+the URL path plus the cleaned query parameters, so every page of a
+listing is cached separately. Expired entries carrying an ``ETag`` or
+``Last-Modified`` validator are revalidated with a conditional request,
+and their body is reused when the API answers ``304 Not Modified``.
+
+:class:`SQLiteCache` keeps the entries in a SQLite database instead, so
+they survive restarts and are shared by all processes using the file.
+
+Example:
+    >>> cache = ResponseCache(ttl=10, endpoint_ttls={"status-pages": 60}, negative_ttl=5)
+    >>> api = UptimeAPI("your-bearer-token", cache=cache)
+    >>> monitors = list(Monitor.get_all_instances(api))
+    >>> cache.stats().hit_ratio
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode, urlparse
+
+from .exceptions import NotFoundError
+
+CacheKey = tuple[str, str]
+
+# SQLiteCache writes the recency of entries read from it in batches of this
+# many reads, or after this many seconds, instead of once per read.
+TOUCH_BATCH_SIZE = 100
+TOUCH_FLUSH_INTERVAL = 5.0
+
+
+def _normalize_path(url: str) -> str:
+    """Strip the query and surrounding slashes from a URL path.
+
+    Args:
+        url: URL path, relative to the API base URL.
+
+    Returns:
+        The normalized path, e.g. ``"monitors/123"``.
+    """
+    return urlparse(url).path.strip("/")
+
+
+@dataclass
+class CacheEntry:
+    """A cached response.
+
+    Attributes:
+        value: Decoded JSON body, or None for a cached 404 response.
+        status_code: HTTP status code of the cached response.
+        stored_at: Wall clock time the entry was stored or last revalidated.
+        expires_at: Wall clock time after which the entry is stale.
+        etag: ``ETag`` header of the response, if any.
+        last_modified: ``Last-Modified`` header of the response, if any.
+    """
+
+    value: Any
+    status_code: int
+    stored_at: float
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, now: float) -> bool:
+        """Check whether the entry may still be served.
+
+        Args:
+            now: Current wall clock time.
+
+        Returns:
+            True when the entry has not expired yet.
+        """
+        return now < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Build the headers of a conditional request for this entry.
+
+        Returns:
+            ``If-None-Match`` and/or ``If-Modified-Since`` headers, empty when
+            the response carried no validators.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Usage statistics of a :class:`ResponseCache`.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that had to go to the network.
+        revalidations: Number of misses answered with ``304 Not Modified``.
+        evictions: Number of entries dropped to stay within ``max_entries``.
+        invalidations: Number of entries dropped because of a write.
+        entries: Number of entries currently held.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache (0.0 - 1.0)."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
+
+
+class ResponseCache:
+    """Thread-safe in-memory LRU cache for decoded GET responses.
+
+    Entries expire after a time to live that can be configured per
+    endpoint: the longest prefix of ``endpoint_ttls`` matching the request
+    path wins, ``ttl`` applies otherwise. When more than ``max_entries``
+    entries are held, the least recently used entry is evicted.
+
+    Expired entries are dropped, unless the response carried an ``ETag``
+    or ``Last-Modified`` header. Those are kept so the client can ask the
+    API whether they changed, see :meth:`validators` and :meth:`revalidate`.
+    With a TTL of ``0`` every read is revalidated. For ``stale_ttl``
+    seconds after expiring, an entry may still be served by
+    :meth:`get_stale` while the client revalidates it in the background.
+
+    A ``POST``, ``PATCH`` or ``DELETE`` through the client invalidates the
+    resource it targets, everything below it and its parent collections,
+    so ``PATCH monitors/123`` drops ``monitors/123`` as well as every page
+    of ``monitors``.
+
+    Subclasses can store entries elsewhere by overriding the storage
+    methods (:meth:`_lookup`, :meth:`_put`, :meth:`_touch`, :meth:`_remove`,
+    :meth:`_keys`, :meth:`_clear`, :meth:`_size`) and the value conversion
+    (:meth:`_encode`, :meth:`_decode`). They are called with the lock held.
+
+    Attributes:
+        ttl: Default time to live of an entry in seconds.
+        endpoint_ttls: Time to live per path prefix, e.g. ``{"monitors": 5}``.
+        max_entries: Maximum number of entries held.
+        negative_ttl: Time to live of a cached 404 response, or None to not
+            cache them.
+        stale_ttl: Seconds an expired entry may still be served while it is
+            revalidated in the background.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        endpoint_ttls: Mapping[str, float] | None = None,
+        max_entries: int = 1024,
+        negative_ttl: float | None = None,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Default time to live of an entry in seconds.
+            endpoint_ttls: Time to live per path prefix, overriding ``ttl``.
+            max_entries: Maximum number of entries held.
+            negative_ttl: Time to live of a cached 404 response, or None to
+                not cache 404 responses.
+            stale_ttl: Seconds an expired entry may still be served while it
+                is revalidated in the background, 0 to never serve stale data.
+
+        Raises:
+            ValueError: If max_entries is smaller than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries should be at least 1")
+
+        self.ttl = ttl
+        self.endpoint_ttls = {
+            _normalize_path(prefix): value for prefix, value in (endpoint_ttls or {}).items()
+        }
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def key(url: str, parameters: Mapping[str, Any] | None = None) -> CacheKey:
+        """Build the cache key of a request.
+
+        Args:
+            url: URL path, relative to the API base URL.
+            parameters: Cleaned query parameters.
+
+        Returns:
+            The normalized path and the sorted, encoded query string.
+        """
+        query = urlencode(sorted((parameters or {}).items()), doseq=True)
+        return _normalize_path(url), query
+
+    def ttl_for(self, url: str) -> float:
+        """Determine the time to live of a path.
+
+        Args:
+            url: URL path, relative to the API base URL.
+
+        Returns:
+            The time to live of the longest matching prefix in
+            ``endpoint_ttls``, or ``ttl`` when no prefix matches.
+        """
+        path = _normalize_path(url)
+        best: str | None = None
+        for prefix in self.endpoint_ttls:
+            if (path == prefix or path.startswith(f"{prefix}/") or not prefix) and (
+                best is None or len(prefix) > len(best)
+            ):
+                best = prefix
+        return self.endpoint_ttls[best] if best is not None else self.ttl
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Look up a fresh response.
+
+        Args:
+            key: Cache key built by :meth:`key`.
+
+        Returns:
+            A copy of the cached body, or None on a miss.
+
+        Raises:
+            NotFoundError: If a 404 response is cached for the key.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or not entry.is_fresh(now):
+                if (
+                    entry is not None
+                    and not entry.validators()
+                    and now >= entry.expires_at + self.stale_ttl
+                ):
+                    self._remove([key])
+                self._misses += 1
+                return None
+
+            self._touch(key)
+            self._hits += 1
+
+        if entry.status_code == 404:
+            raise NotFoundError()
+        return self._decode(entry.value)
+
+    def get_stale(self, key: CacheKey) -> Any | None:
+        """Look up an expired response that may be served while it is revalidated.
+
+        Args:
+            key: Cache key built by :meth:`key`.
+
+        Returns:
+            A copy of the cached body when it expired less than ``stale_ttl``
+            seconds ago, None otherwise.
+        """
+        if self.stale_ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._lookup(key)
+            if (
+                entry is None
+                or entry.status_code != 200
+                or time.time() >= entry.expires_at + self.stale_ttl
+            ):
+                return None
+            self._touch(key)
+        return self._decode(entry.value)
+
+    def validators(self, key: CacheKey) -> dict[str, str]:
+        """Build the headers to revalidate an expired entry with.
+
+        Args:
+            key: Cache key built by :meth:`key`.
+
+        Returns:
+            Conditional request headers, empty when there is nothing to revalidate.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or entry.status_code != 200:
+                return {}
+            return entry.validators()
+
+    def revalidate(self, key: CacheKey) -> Any | None:
+        """Mark an entry as fresh again after a ``304 Not Modified`` response.
+
+        Args:
+            key: Cache key built by :meth:`key`.
+
+        Returns:
+            A copy of the cached body, or None when the entry was dropped
+            in the meantime.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or entry.status_code != 200:
+                return None
+            entry.stored_at = now
+            entry.expires_at = now + self.ttl_for(key[0])
+            self._put(key, entry)
+            self._revalidations += 1
+        return self._decode(entry.value)
+
+    def set(
+        self,
+        key: CacheKey,
+        value: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a successful response.
+
+        Args:
+            key: Cache key built by :meth:`key`.
+            value: Decoded JSON body; a copy is stored.
+            etag: ``ETag`` header of the response, if any.
+            last_modified: ``Last-Modified`` header of the response, if any.
+        """
+        self._store(
+            CacheEntry(self._encode(value), 200, 0.0, 0.0, etag, last_modified),
+            key,
+            self.ttl_for(key[0]),
+        )
+
+    def set_not_found(self, key: CacheKey) -> None:
+        """Store a 404 response, if negative caching is enabled.
+
+        Args:
+            key: Cache key built by :meth:`key`.
+        """
+        if self.negative_ttl is not None:
+            self._store(CacheEntry(None, 404, 0.0, 0.0), key, self.negative_ttl)
+
+    def _store(self, entry: CacheEntry, key: CacheKey, ttl: float) -> None:
+        """Insert an entry and evict the least recently used entries.
+
+        Entries that would expire immediately are only kept when they can
+        be revalidated.
+
+        Args:
+            entry: Entry to store; its timestamps are set here.
+            key: Cache key built by :meth:`key`.
+            ttl: Time to live in seconds.
+        """
+        if ttl <= 0 and not entry.validators():
+            return
+
+        now = time.time()
+        entry.stored_at = now
+        entry.expires_at = now + ttl
+        with self._lock:
+            self._evictions += self._put(key, entry)
+
+    def expire(self, url: str | None = None) -> int:
+        """Mark entries as expired so the next read revalidates or refetches them.
+
+        Unlike :meth:`invalidate`, entries with validators are kept, so an
+        unchanged response is revalidated with a cheap conditional request.
+
+        Args:
+            url: Path prefix of the entries to expire, or None for all entries.
+
+        Returns:
+            Number of entries expired.
+        """
+        prefix = _normalize_path(url) if url is not None else None
+        now = time.time()
+        expired = 0
+        with self._lock:
+            for key in self._keys():
+                if prefix and key[0] != prefix and not key[0].startswith(f"{prefix}/"):
+                    continue
+                entry = self._lookup(key)
+                if entry is None or entry.expires_at <= now:
+                    continue
+                # Also skip the stale window: the entry was explicitly asked for
+                entry.expires_at = now - self.stale_ttl
+                self._put(key, entry)
+                expired += 1
+        return expired
+
+    def invalidate(self, url: str) -> int:
+        """Drop a resource, everything below it and its parent collections.
+
+        Args:
+            url: URL path of the resource that was written.
+
+        Returns:
+            Number of entries dropped.
+        """
+        path = _normalize_path(url)
+        with self._lock:
+            stale = [
+                key
+                for key in self._keys()
+                if key[0] == path or key[0].startswith(f"{path}/") or path.startswith(f"{key[0]}/")
+            ]
+            self._remove(stale)
+            self._invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> CacheStats:
+        """Collect usage statistics.
+
+        Returns:
+            Counters since the cache was created.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                revalidations=self._revalidations,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=self._size(),
+            )
+
+    def __len__(self) -> int:
+        """Return the number of entries held, including expired ones."""
+        with self._lock:
+            return self._size()
+
+    def _encode(self, value: Any) -> Any:
+        """Convert a decoded body to the form it is stored in.
+
+        Args:
+            value: Decoded JSON body.
+
+        Returns:
+            A deep copy, so later changes by the caller don't leak into the cache.
+        """
+        return copy.deepcopy(value)
+
+    def _decode(self, stored: Any) -> Any:
+        """Convert a stored value back to a decoded body.
+
+        Args:
+            stored: Value as returned by :meth:`_encode`.
+
+        Returns:
+            A deep copy, so changes by the caller don't leak into the cache.
+        """
+        return copy.deepcopy(stored)
+
+    def _lookup(self, key: CacheKey) -> CacheEntry | None:
+        """Return the entry stored for a key, without marking it as used."""
+        return self._entries.get(key)
+
+    def _put(self, key: CacheKey, entry: CacheEntry) -> int:
+        """Insert or replace an entry, mark it as most recently used and evict.
+
+        Returns:
+            Number of entries evicted to stay within ``max_entries``.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def _touch(self, key: CacheKey) -> None:
+        """Mark an entry as most recently used."""
+        self._entries.move_to_end(key)
+
+    def _remove(self, keys: list[CacheKey]) -> None:
+        """Drop entries."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def _keys(self) -> list[CacheKey]:
+        """Return the keys of all entries."""
+        return list(self._entries)
+
+    def _clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def _size(self) -> int:
+        """Return the number of entries held."""
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """Response cache persisted in a SQLite database.
+
+    Entries survive restarts of the process, so short-lived scripts start
+    with the responses of their previous run instead of listing everything
+    again. Combine it with ``stale_ttl`` to serve those responses instantly
+    while they are revalidated in the background, or call :meth:`expire`
+    to revalidate on demand. Several processes may share one database;
+    SQLite serializes their writes.
+
+    Reads don't write to the database: the recency of the entries read is
+    kept in memory and written in batches, so eviction is approximately
+    least recently used. The number of entries is tracked as they are
+    written and counted only to recover from an estimate that is too high,
+    so with several processes the database may hold more than
+    ``max_entries`` entries until one of them evicts.
+
+    Example:
+        >>> cache = SQLiteCache("~/.cache/betterstack-uptime.db", ttl=300, stale_ttl=86400)
+        >>> api = UptimeAPI("your-bearer-token", cache=cache)
+
+    Attributes:
+        path: Path of the SQLite database file.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttl: float = 30.0,
+        endpoint_ttls: Mapping[str, float] | None = None,
+        max_entries: int = 10000,
+        negative_ttl: float | None = None,
+        stale_ttl: float = 0.0,
+    ) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Path of the SQLite database file; ``~`` is expanded.
+            ttl: Default time to live of an entry in seconds.
+            endpoint_ttls: Time to live per path prefix, overriding ``ttl``.
+            max_entries: Maximum number of entries held.
+            negative_ttl: Time to live of a cached 404 response, or None to
+                not cache 404 responses.
+            stale_ttl: Seconds an expired entry may still be served while it
+                is revalidated in the background, 0 to never serve stale data.
+
+        Raises:
+            ValueError: If max_entries is smaller than 1.
+        """
+        super().__init__(ttl, endpoint_ttls, max_entries, negative_ttl, stale_ttl)
+        self.path = os.path.expanduser(os.fspath(path))
+        self._connection = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " path TEXT NOT NULL,"
+            " query TEXT NOT NULL,"
+            " value TEXT,"
+            " status_code INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " used_at REAL NOT NULL,"
+            " PRIMARY KEY (path, query))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)"
+        )
+        self._touched: dict[CacheKey, float] = {}
+        self._flushed_at = time.time()
+        self._estimated_size = self._size()
+
+    def close(self) -> None:
+        """Write the pending recency updates and close the database connection."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("BEGIN IMMEDIATE")
+                self._flush_touched()
+            self._connection.close()
+
+    def expire(self, url: str | None = None) -> int:
+        """Mark entries as expired so the next read revalidates or refetches them.
+
+        Unlike :meth:`invalidate`, entries with validators are kept, so an
+        unchanged response is revalidated with a cheap conditional request.
+
+        Args:
+            url: Path prefix of the entries to expire, or None for all entries.
+
+        Returns:
+            Number of entries expired.
+        """
+        prefix = _normalize_path(url) if url is not None else ""
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE responses SET expires_at = ? WHERE expires_at > ?"
+                " AND (? = '' OR path = ? OR substr(path, 1, ?) = ?)",
+                # Also skip the stale window: the entries were explicitly asked for
+                (now - self.stale_ttl, now, prefix, prefix, len(prefix) + 1, f"{prefix}/"),
+            )
+        return cursor.rowcount
+
+    def _encode(self, value: Any) -> Any:
+        """Serialize a decoded body to JSON text."""
+        return json.dumps(value)
+
+    def _decode(self, stored: Any) -> Any:
+        """Deserialize a body stored as JSON text."""
+        return json.loads(stored) if stored is not None else None
+
+    def _lookup(self, key: CacheKey) -> CacheEntry | None:
+        """Read the entry stored for a key."""
+        row = self._connection.execute(
+            "SELECT value, status_code, stored_at, expires_at, etag, last_modified"
+            " FROM responses WHERE path = ? AND query = ?",
+            key,
+        ).fetchone()
+        return CacheEntry(*row) if row is not None else None
+
+    def _put(self, key: CacheKey, entry: CacheEntry) -> int:
+        """Write an entry, mark it as most recently used and evict when over the limit."""
+        evicted = 0
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._flush_touched()
+            exists = self._connection.execute(
+                "SELECT 1 FROM responses WHERE path = ? AND query = ?", key
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *key,
+                    entry.value,
+                    entry.status_code,
+                    entry.stored_at,
+                    entry.expires_at,
+                    entry.etag,
+                    entry.last_modified,
+                    time.time(),
+                ),
+            )
+            if not exists:
+                self._estimated_size += 1
+            if self._estimated_size > self.max_entries:
+                # Keep the max_entries most recently used entries
+                evicted = self._connection.execute(
+                    "DELETE FROM responses WHERE rowid IN (SELECT rowid FROM responses"
+                    " ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+                # Other processes may have evicted entries counted in the estimate
+                self._estimated_size = self.max_entries if evicted else self._size()
+        return evicted
+
+    def _touch(self, key: CacheKey) -> None:
+        """Mark an entry as most recently used, writing the marks in batches."""
+        now = time.time()
+        self._touched[key] = now
+        if len(self._touched) >= TOUCH_BATCH_SIZE or now - self._flushed_at >= TOUCH_FLUSH_INTERVAL:
+            with self._connection:
+                self._connection.execute("BEGIN IMMEDIATE")
+                self._flush_touched()
+
+    def _flush_touched(self) -> None:
+        """Write the pending recency marks, within the caller's transaction."""
+        if self._touched:
+            self._connection.executemany(
+                "UPDATE responses SET used_at = ? WHERE path = ? AND query = ?",
+                [(used_at, *key) for key, used_at in self._touched.items()],
+            )
+            self._touched.clear()
+        self._flushed_at = time.time()
+
+    def _remove(self, keys: list[CacheKey]) -> None:
+        """Delete entries."""
+        cursor = self._connection.executemany(
+            "DELETE FROM responses WHERE path = ? AND query = ?",
+            keys,
+        )
+        self._estimated_size = max(self._estimated_size - cursor.rowcount, 0)
+
+    def _keys(self) -> list[CacheKey]:
+        """Read the keys of all entries."""
+        return [
+            (path, query)
+            for path, query in self._connection.execute("SELECT path, query FROM responses")
+        ]
+
+    def _clear(self) -> None:
+        """Delete all entries."""
+        self._connection.execute("DELETE FROM responses")
+        self._touched.clear()
+        self._estimated_size = 0
+
+    def _size(self) -> int:
+        """Count the entries held."""
+        count: int = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return count
@@ -0,0 +1,250 @@
+"""Circuit breaking and retry budgeting for the REST API clients.
+
+Every request is retried up to ``retries`` times on connection errors and
+5xx responses, so while an endpoint is failing the client sends it several
+times the usual load. A :class:`CircuitBreaker` stops sending requests to
+an endpoint after consecutive failures: its circuit opens and requests
+fail fast with :class:`~betterstack.uptime.exceptions.ServerError` until,
+after ``recovery_timeout``, a trial request is let through. A successful
+trial closes the circuit, a failed one opens it again.
+
+A :class:`RetryBudget` caps the retries of the whole client at a fraction
+of its recent successful requests, so retries can't multiply the load of
+an API that is failing everywhere.
+
+Example:
+    >>> api = UptimeAPI("your-bearer-token", circuit_breaker=True, retry_budget=True)
+    >>> api.circuit_breaker.state("monitors")
+    'closed'
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from .exceptions import ServerError
+from .transfer import endpoint_name
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    """Mutable state of the circuit of one endpoint."""
+
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker.
+
+    Endpoints are named by their path with numeric IDs folded into
+    ``{id}``, as in :func:`~betterstack.uptime.transfer.endpoint_name`, so
+    all monitors share the circuit of ``monitors/{id}``.
+
+    While a circuit is half open a single trial request is in flight and
+    other requests are rejected. A trial that never reports back, for
+    example because its deadline expired before it was sent, is replaced
+    by a new one after another ``recovery_timeout``.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+        >>> api = UptimeAPI("your-bearer-token", circuit_breaker=breaker)
+        >>> breaker.opened, breaker.rejected
+
+    Attributes:
+        failure_threshold: Consecutive failures that open a circuit.
+        recovery_timeout: Seconds a circuit stays open before a trial request.
+        opened: Number of times a circuit opened.
+        rejected: Number of requests failed fast by an open circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        """Initialize the breaker with all circuits closed.
+
+        Args:
+            failure_threshold: Number of consecutive failed requests to an
+                endpoint that open its circuit.
+            recovery_timeout: Seconds an open circuit rejects requests before
+                letting a trial request through.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold should be at least 1")
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout should not be negative")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.opened = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self, url: str) -> str:
+        """Report the state of the circuit of an endpoint.
+
+        Args:
+            url: URL of a request to the endpoint, or the endpoint name.
+
+        Returns:
+            ``"closed"``, ``"open"`` or ``"half_open"``. An open circuit whose
+            recovery timeout passed, ready for a trial, is reported as half open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint_name(url))
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and self._recovered(circuit):
+                return HALF_OPEN
+            return circuit.state
+
+    def before_request(self, url: str) -> None:
+        """Let a request through, or fail it fast while its circuit is open.
+
+        Requests let through report their outcome with :meth:`record_success`
+        or :meth:`record_failure`.
+
+        Args:
+            url: URL of the request.
+
+        Raises:
+            ServerError: If the endpoint's circuit is open, or half open with
+                a trial request in flight.
+        """
+        endpoint = endpoint_name(url)
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            if self._recovered(circuit):
+                # Let this request through as the trial, rejecting others meanwhile
+                circuit.state = HALF_OPEN
+                circuit.opened_at = time.monotonic()
+                return
+            self.rejected += 1
+        raise ServerError(f"Circuit breaker open for {endpoint}", 503)
+
+    def record_success(self, url: str) -> None:
+        """Count a request the endpoint answered, closing its circuit.
+
+        Args:
+            url: URL of the request.
+        """
+        with self._lock:
+            self._circuits.pop(endpoint_name(url), None)
+
+    def record_failure(self, url: str) -> None:
+        """Count a failed request, opening the circuit at the threshold.
+
+        A failed trial request opens a half open circuit right away.
+
+        Args:
+            url: URL of the request.
+        """
+        endpoint = endpoint_name(url)
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or (
+                circuit.state == CLOSED and circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                self.opened += 1
+
+    def reset(self) -> None:
+        """Close all circuits."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _recovered(self, circuit: _Circuit) -> bool:
+        """Check whether a circuit waited out its recovery timeout since the last trial."""
+        return time.monotonic() - circuit.opened_at >= self.recovery_timeout
+
+
+class RetryBudget:
+    """Client-wide limit on retries relative to successful requests.
+
+    A retry is allowed while the retries of the last ``window`` seconds
+    stay below ``min_retries`` plus ``ratio`` times the successful requests
+    of that window. The floor lets a quiet client retry its few requests.
+
+    Example:
+        >>> budget = RetryBudget(ratio=0.1)
+        >>> api = UptimeAPI("your-bearer-token", retry_budget=budget)
+        >>> budget.retries, budget.denied
+
+    Attributes:
+        ratio: Retries allowed per successful request.
+        min_retries: Retries allowed per window regardless of successes.
+        window: Seconds over which retries and successes are counted.
+        retries: Number of retries allowed.
+        denied: Number of retries refused.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10, window: float = 10.0) -> None:
+        """Initialize an unused budget.
+
+        Args:
+            ratio: Retries allowed per successful request (0.0 - 1.0).
+            min_retries: Retries allowed per window regardless of successes.
+            window: Seconds over which retries and successes are counted.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if not 0 <= ratio <= 1:
+            raise ValueError("ratio should be between 0 and 1")
+        if min_retries < 0:
+            raise ValueError("min_retries should not be negative")
+        if window <= 0:
+            raise ValueError("window should be positive")
+
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self.retries = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+        self._successes: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def record_success(self) -> None:
+        """Count a successful request, adding ``ratio`` retries to the budget."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._successes.append(now)
+
+    def try_retry(self) -> bool:
+        """Spend one retry from the budget.
+
+        Returns:
+            True if the retry may be made, False if the budget is spent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._successes):
+                self.denied += 1
+                return False
+            self._retries.append(now)
+            self.retries += 1
+            return True
+
+    def _expire(self, now: float) -> None:
+        """Drop the events that left the window."""
+        cutoff = now - self.window
+        for events in (self._successes, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
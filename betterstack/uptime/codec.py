@@ -0,0 +1,173 @@
+"""JSON codecs used to encode request bodies and decode response bodies.
+
+The standard library codec is always available. The faster ``orjson``
+and ``msgspec`` codecs are used when the package is installed:
+
+    pip install betterstack-uptime[fast-json]
+
+Example:
+    >>> api = UptimeAPI("your-bearer-token", json_codec="auto")
+    >>> api.codec.name
+    'orjson'
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from .exceptions import ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+
+class JSONCodec:
+    """Base class for JSON codecs.
+
+    The codec decodes every response body except streamed pages
+    (``stream_pages=True``), which are parsed item by item with the
+    standard library decoder. Streamed and buffered pages may therefore
+    differ where the codecs do, for example in the precision of floats.
+
+    Attributes:
+        name: Name the codec is selected by in :func:`get_codec`.
+    """
+
+    name = ""
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as UTF-8 JSON.
+
+        Args:
+            value: JSON serializable value.
+
+        Returns:
+            The encoded document.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement dumps()")
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The encoded document.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+            NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement loads()")
+
+
+class StdlibCodec(JSONCodec):
+    """Codec based on the standard library :mod:`json` module."""
+
+    name = "stdlib"
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as UTF-8 JSON."""
+        return json.dumps(value).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec based on `orjson <https://github.com/ijl/orjson>`_."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Check that orjson is installed.
+
+        Raises:
+            ConfigurationError: If orjson is not installed.
+        """
+        if orjson is None:
+            raise ConfigurationError("The orjson codec requires the orjson package")
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as UTF-8 JSON."""
+        return orjson.dumps(value)
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        # orjson.JSONDecodeError is a ValueError
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec based on `msgspec <https://jcristharif.com/msgspec/>`_."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Check that msgspec is installed and create its encoder and decoder.
+
+        Raises:
+            ConfigurationError: If msgspec is not installed.
+        """
+        if msgspec is None:
+            raise ConfigurationError("The msgspec codec requires the msgspec package")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as UTF-8 JSON."""
+        encoded: bytes = self._encoder.encode(value)
+        return encoded
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a JSON document."""
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    codec.name: codec for codec in (StdlibCodec, OrjsonCodec, MsgspecCodec)
+}
+
+
+def get_codec(codec: JSONCodec | str = "stdlib") -> JSONCodec:
+    """Resolve a codec by name.
+
+    Args:
+        codec: A codec instance, a codec name (``"stdlib"``, ``"orjson"``,
+            ``"msgspec"``), or ``"auto"`` for the fastest installed codec.
+
+    Returns:
+        The codec instance.
+
+    Raises:
+        ConfigurationError: If the codec is unknown or its package is missing.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return StdlibCodec()
+    if codec not in CODECS:
+        raise ConfigurationError(
+            f"Unknown JSON codec {codec!r}, expected one of {', '.join(['auto', *CODECS])}"
+        )
+    return CODECS[codec]()
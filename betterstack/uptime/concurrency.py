@@ -0,0 +1,504 @@
+"""Concurrency control for the REST API clients.
+
+An :class:`AdaptiveConcurrency` controller limits how many page requests
+are in flight at once and tunes that limit with an AIMD (additive
+increase, multiplicative decrease) strategy: the limit grows by one after
+a full window of requests completed at a stable latency, and is halved
+when the API answers with 429 or 5xx responses or latency spikes.
+
+Example:
+    >>> api = UptimeAPI("your-bearer-token", max_workers=32, adaptive_concurrency=True)
+    >>> monitors = list(Monitor.get_all_instances(api))
+    >>> api.concurrency.limit
+    12
+
+A :class:`SingleFlight` group lets concurrent identical calls share the
+work of one of them, and a :class:`HedgingPolicy` races slow calls
+against a second copy of themselves.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from .deadline import wait_within_deadline
+from .exceptions import RateLimitError, ServerError
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ConcurrencyDecision:
+    """A change of the concurrency limit made by :class:`AdaptiveConcurrency`.
+
+    Attributes:
+        timestamp: Wall clock time of the change, as returned by ``time.time()``.
+        previous_limit: Limit before the change.
+        limit: Limit after the change.
+        reason: Why the limit changed, one of ``"latency stable"``,
+            ``"latency spike"``, ``"rate limited"`` and ``"server error"``.
+    """
+
+    timestamp: float
+    previous_limit: int
+    limit: int
+    reason: str
+
+
+class AdaptiveConcurrency:
+    """Thread-safe AIMD controller for the number of requests in flight.
+
+    Requests run inside :meth:`slot`, which blocks while ``limit`` requests
+    are already in flight and feeds the outcome of each request back into
+    the limit. Only one decrease is made per window: failures of requests
+    that were started before the last decrease are ignored, so a burst of
+    errors from the same window halves the limit once.
+
+    Attributes:
+        min_limit: Lowest limit the controller decreases to.
+        max_limit: Highest limit the controller grows to.
+        latency_tolerance: Factor over the baseline latency that counts as a spike.
+        smoothing: Weight of a new sample in the baseline latency average.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        history: int = 100,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            initial_limit: Number of requests allowed in flight at the start.
+            min_limit: Lowest limit the controller decreases to.
+            max_limit: Highest limit the controller grows to.
+            latency_tolerance: A request slower than this factor times the
+                baseline latency is treated as a latency spike.
+            smoothing: Weight (0.0 - 1.0) of a new sample in the exponentially
+                weighted baseline latency.
+            history: Number of recent decisions to keep in :attr:`decisions`.
+
+        Raises:
+            ValueError: If the limits are inconsistent or a factor is out of range.
+        """
+        if min_limit < 1:
+            raise ValueError("min_limit should be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit should not be smaller than min_limit")
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit should be between min_limit and max_limit")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance should be greater than 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing should be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._limit = initial_limit
+        self._in_flight = 0
+        self._successes = 0
+        self._epoch = 0
+        self._baseline: float | None = None
+        self._decisions: deque[ConcurrencyDecision] = deque(maxlen=history)
+
+    @property
+    def limit(self) -> int:
+        """Number of requests currently allowed in flight."""
+        with self._condition:
+            return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        with self._condition:
+            return self._in_flight
+
+    @property
+    def baseline_latency(self) -> float | None:
+        """Smoothed latency of successful requests in seconds, None before the first."""
+        with self._condition:
+            return self._baseline
+
+    @property
+    def decisions(self) -> list[ConcurrencyDecision]:
+        """Most recent limit changes, oldest first."""
+        with self._condition:
+            return list(self._decisions)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Run a request within the concurrency limit and learn from its outcome.
+
+        Blocks until fewer than ``limit`` requests are in flight, at most
+        until the current deadline. A
+        :class:`~betterstack.uptime.exceptions.RateLimitError` or
+        :class:`~betterstack.uptime.exceptions.ServerError` raised inside
+        the block decreases the limit and is re-raised.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before a slot is free.
+        """
+        with self._condition:
+            while self._in_flight >= self._limit:
+                wait_within_deadline(self._condition)
+            self._in_flight += 1
+            epoch = self._epoch
+
+        throttle = self._local.throttle = threading.Event()
+        start = time.monotonic()
+        try:
+            yield
+        except RateLimitError:
+            self._decrease(epoch, "rate limited")
+            raise
+        except ServerError:
+            self._decrease(epoch, "server error")
+            raise
+        else:
+            if throttle.is_set():
+                self._decrease(epoch, "rate limited")
+            else:
+                self._record_latency(epoch, time.monotonic() - start)
+        finally:
+            self._local.throttle = None
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def throttled(self) -> None:
+        """Report that the request in the current thread's slot was answered with 429.
+
+        Used for 429 responses that are retried and therefore never raised
+        out of the slot. Calls outside a slot are ignored.
+        """
+        throttle = getattr(self._local, "throttle", None)
+        if throttle is not None:
+            throttle.set()
+
+    def bind(self, call: Callable[[], T]) -> Callable[[], T]:
+        """Let ``call`` report throttles to the current thread's slot from another thread.
+
+        Args:
+            call: Function that will run on another thread, such as a hedged copy
+                of a request.
+
+        Returns:
+            A function running ``call`` with :meth:`throttled` reporting to the
+            slot of the thread that called ``bind``.
+        """
+        throttle = getattr(self._local, "throttle", None)
+
+        def bound() -> T:
+            previous = getattr(self._local, "throttle", None)
+            self._local.throttle = throttle
+            try:
+                return call()
+            finally:
+                self._local.throttle = previous
+
+        return bound
+
+    def _record_latency(self, epoch: int, latency: float) -> None:
+        """Grow the limit on stable latency, or halve it on a latency spike.
+
+        Args:
+            epoch: Decrease epoch the request was started in.
+            latency: Duration of the request in seconds.
+        """
+        with self._condition:
+            baseline = self._baseline
+            self._baseline = (
+                latency if baseline is None else baseline + self.smoothing * (latency - baseline)
+            )
+
+            if baseline is not None and latency > baseline * self.latency_tolerance:
+                self._decrease_locked(epoch, "latency spike")
+                return
+
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < self.max_limit:
+                self._change_limit(self._limit + 1, "latency stable")
+                self._successes = 0
+                self._condition.notify_all()
+
+    def _decrease(self, epoch: int, reason: str) -> None:
+        """Halve the limit unless it was already decreased during this request.
+
+        Args:
+            epoch: Decrease epoch the request was started in.
+            reason: Why the limit is decreased.
+        """
+        with self._condition:
+            self._decrease_locked(epoch, reason)
+
+    def _decrease_locked(self, epoch: int, reason: str) -> None:
+        """Halve the limit, must be called with the condition held.
+
+        Args:
+            epoch: Decrease epoch the request was started in.
+            reason: Why the limit is decreased.
+        """
+        self._successes = 0
+        if epoch != self._epoch:
+            return
+        self._epoch += 1
+        if self._limit > self.min_limit:
+            self._change_limit(max(self.min_limit, self._limit // 2), reason)
+
+    def _change_limit(self, limit: int, reason: str) -> None:
+        """Set a new limit and record the decision, with the condition held.
+
+        Args:
+            limit: New limit.
+            reason: Why the limit changed.
+        """
+        self._decisions.append(
+            ConcurrencyDecision(
+                timestamp=time.time(),
+                previous_limit=self._limit,
+                limit=limit,
+                reason=reason,
+            )
+        )
+        self._limit = limit
+
+
+class SingleFlight(Generic[T]):
+    """Thread-safe de-duplication of concurrent identical calls.
+
+    The first caller for a key runs the call; callers arriving with the
+    same key while it is running wait for it and share its outcome instead
+    of running the call again. Once the call finished, the next caller
+    starts a new one, so results are never reused after the fact.
+
+    When a result is shared, every caller receives its own deep copy, so
+    callers can't see each other's changes.
+
+    Attributes:
+        shared: Number of calls that were answered with another call's outcome.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, tuple[Future[T], list[int]]] = {}
+
+    def do(self, key: Hashable, call: Callable[[], T]) -> T:
+        """Run ``call``, or wait for the running call with the same key.
+
+        Args:
+            key: Identity of the call; equal keys are coalesced.
+            call: Function producing the result.
+
+        Returns:
+            The result of the call.
+
+        Raises:
+            Exception: Whatever the call raised, re-raised in every caller.
+        """
+        with self._lock:
+            running = self._calls.get(key)
+            if running is not None:
+                future, waiters = running
+                waiters[0] += 1
+                self.shared += 1
+            else:
+                future, waiters = Future(), [0]
+                self._calls[key] = (future, waiters)
+
+        if running is not None:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = call()
+        except BaseException as error:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(error)
+            raise
+
+        with self._lock:
+            del self._calls[key]
+        future.set_result(result)
+        # Keep the shared object private once other callers copy it
+        return copy.deepcopy(result) if waiters[0] else result
+
+
+class HedgingPolicy:
+    """Hedges slow idempotent calls with a second identical call.
+
+    A call that hasn't finished after :attr:`delay` is raced against a
+    copy of itself, and whichever succeeds first is used. The delay is
+    either fixed or the ``percentile`` of recently observed latencies, so
+    only the slowest calls are hedged. The share of hedged calls among the
+    recent ones is capped at ``max_hedge_ratio``, so a slow API can't make
+    the client double its load.
+
+    The losing call is not interrupted; it finishes in the background and
+    its result is discarded. :meth:`close` waits for the losing calls.
+
+    Example:
+        >>> policy = HedgingPolicy(percentile=0.95, max_hedge_ratio=0.05)
+        >>> api = UptimeAPI("your-bearer-token", hedging=policy)
+        >>> policy.hedged, policy.hedge_wins
+
+    Attributes:
+        percentile: Latency percentile (0.0 - 1.0) used as the delay.
+        min_samples: Number of latencies to observe before hedging.
+        max_hedge_ratio: Maximum share of recent calls that may be hedged.
+        hedged: Number of calls that were hedged.
+        hedge_wins: Number of hedged calls answered by the hedge.
+    """
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.05,
+        history: int = 200,
+        max_workers: int = 32,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            delay: Seconds to wait before hedging, or None to use the
+                ``percentile`` of the observed latencies.
+            percentile: Latency percentile (0.0 - 1.0) used as the delay.
+            min_samples: Number of calls to observe before the first hedge.
+            max_hedge_ratio: Maximum share (0.0 - 1.0) of the recent calls
+                that may be hedged.
+            history: Number of recent calls the latencies and the hedge
+                ratio are computed over.
+            max_workers: Number of threads running hedgeable calls.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if delay is not None and delay < 0:
+            raise ValueError("delay should not be negative")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile should be between 0 and 1")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio should be between 0 and 1")
+        if min_samples < 1 or history < min_samples:
+            raise ValueError("history should be at least min_samples, which should be positive")
+
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._fixed_delay = delay
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=history)
+        self._recent: deque[bool] = deque(maxlen=history)
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def delay(self) -> float | None:
+        """Seconds a call runs before it is hedged, or None while still observing."""
+        with self._lock:
+            if len(self._recent) < self.min_samples:
+                return None
+            if self._fixed_delay is not None:
+                return self._fixed_delay
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[min(int(len(latencies) * self.percentile), len(latencies) - 1)]
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Executor running hedgeable calls, created on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="betterstack-uptime-hedge"
+                )
+            return self._executor
+
+    def call(self, call: Callable[[], T]) -> T:
+        """Run ``call``, hedging it when it is slow and the budget allows.
+
+        Args:
+            call: Idempotent function producing the result.
+
+        Returns:
+            The result of the first copy of the call that succeeded.
+
+        Raises:
+            Exception: What the call raised, when no copy succeeded.
+        """
+        delay = self.delay
+        if delay is None or not self._may_hedge():
+            self._record(hedged=False)
+            return self._timed(call)
+
+        primary = self.executor.submit(self._timed, call)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._may_hedge():
+            self._record(hedged=False)
+            return primary.result()
+
+        self._record(hedged=True)
+        hedge = self.executor.submit(self._timed, call)
+        pending = {primary, hedge}
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                errors.append(error)
+        raise errors[0]
+
+    def close(self) -> None:
+        """Shut down the executor once the losing calls have finished."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _timed(self, call: Callable[[], T]) -> T:
+        """Run a call and record its latency when it succeeds."""
+        started = time.monotonic()
+        result = call()
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+        return result
+
+    def _may_hedge(self) -> bool:
+        """Check whether one more hedge stays within ``max_hedge_ratio``."""
+        with self._lock:
+            return sum(self._recent) + 1 <= self.max_hedge_ratio * (len(self._recent) + 1)
+
+    def _record(self, hedged: bool) -> None:
+        """Count a call in the recent history."""
+        with self._lock:
+            self._recent.append(hedged)
+            if hedged:
+                self.hedged += 1
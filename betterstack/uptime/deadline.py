@@ -0,0 +1,159 @@
+"""Deadlines bounding the total time of an API operation.
+
+The client's ``timeout`` applies to every HTTP call separately, so a
+listing of many pages, each retried a few times, has no overall bound. A
+:class:`Deadline` passed to an operation bounds all of it: every request
+gets at most the remaining time as its timeout, retries that can't finish
+in time are not started, and the pages of a listing that are still
+pending are cancelled once time is up. A deadline can also be cancelled
+from another thread.
+
+Example:
+    >>> try:
+    ...     monitors = list(Monitor.get_all_instances(api, deadline=Deadline(30)))
+    ... except DeadlineExceededError:
+    ...     monitors = []
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from .exceptions import DeadlineExceededError
+
+_local = threading.local()
+
+
+class Deadline:
+    """Time budget and cancellation token shared by the requests of an operation.
+
+    Attributes:
+        timeout: Seconds the operation may take in total, or None when the
+            deadline only ends by being cancelled.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        """Start the deadline.
+
+        Args:
+            timeout: Seconds from now until the deadline expires, or None
+                for a deadline that only ends when :meth:`cancel` is called.
+
+        Raises:
+            ValueError: If the timeout is negative.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout should not be negative")
+        self.timeout = timeout
+        self._expires_at = None if timeout is None else time.monotonic() + timeout
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether :meth:`cancel` was called."""
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline passed or was cancelled."""
+        return self.remaining() <= 0
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline.
+
+        Returns:
+            The remaining time, 0.0 once expired or cancelled, or infinity
+            for a deadline without a timeout.
+        """
+        if self._cancelled.is_set():
+            return 0.0
+        if self._expires_at is None:
+            return math.inf
+        return max(self._expires_at - time.monotonic(), 0.0)
+
+    def cancel(self) -> None:
+        """End the deadline now, failing the operations that use it."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise if the deadline passed or was cancelled.
+
+        Raises:
+            DeadlineExceededError: If the deadline expired.
+        """
+        if self.expired:
+            raise self.error()
+
+    def error(self) -> DeadlineExceededError:
+        """Build the error raised when the deadline expired.
+
+        Returns:
+            An error telling whether the deadline passed or was cancelled.
+        """
+        if self.cancelled:
+            return DeadlineExceededError("Operation cancelled")
+        return DeadlineExceededError(f"Deadline of {self.timeout} seconds exceeded")
+
+    def clamp(self, timeout: float) -> float:
+        """Shorten a timeout to the remaining time.
+
+        Args:
+            timeout: The timeout that applies without a deadline.
+
+        Returns:
+            The smaller of ``timeout`` and the remaining time.
+
+        Raises:
+            DeadlineExceededError: If the deadline expired.
+        """
+        self.check()
+        return min(timeout, self.remaining())
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[None]:
+    """Make a deadline the current one of this thread while the block runs.
+
+    Lets code that can't be passed the deadline, such as the urllib3 retry
+    strategy, find it through :func:`current_deadline`.
+
+    Args:
+        deadline: The deadline, or None to leave the block unbounded.
+    """
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = deadline
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline set by :func:`deadline_scope` in this thread, if any."""
+    deadline: Deadline | None = getattr(_local, "deadline", None)
+    return deadline
+
+
+def wait_within_deadline(condition: threading.Condition) -> None:
+    """Wait on a condition for at most the remaining time of the current deadline.
+
+    Lets a request waiting to be admitted, for a free slot or its turn at
+    the rate limiter, fail once its deadline passes instead of blocking.
+
+    Args:
+        condition: The condition to wait on, whose lock the caller holds.
+
+    Raises:
+        DeadlineExceededError: If the current deadline expired.
+    """
+    deadline = current_deadline()
+    if deadline is None:
+        condition.wait()
+        return
+    deadline.check()
+    remaining = deadline.remaining()
+    condition.wait(None if math.isinf(remaining) else remaining)
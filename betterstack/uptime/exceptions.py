@@ -82,3 +82,9 @@ class ConfigurationError(BetterStackError):
     """Configuration error (e.g., missing required settings)."""
 
     pass
+
+
+class DeadlineExceededError(BetterStackError):
+    """An operation ran out of its deadline or was cancelled."""
+
+    pass
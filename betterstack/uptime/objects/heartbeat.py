@@ -43,7 +43,7 @@ class Heartbeat(BaseAPIObject):
 
     type: ClassVar[str] = "heartbeat"
     _url_endpoint: ClassVar[str] = "heartbeats"
-    _allowed_query_parameters: ClassVar[list[str]] = ["team_name"]
+    _allowed_query_parameters: ClassVar[list[str]] = ["per_page", "team_name"]
 
     # Known fields
     name: str | None = None
@@ -30,7 +30,7 @@ class HeartbeatGroup(BaseAPIObject):
 
     type: ClassVar[str] = "heartbeat_group"
     _url_endpoint: ClassVar[str] = "heartbeat-groups"
-    _allowed_query_parameters: ClassVar[list[str]] = ["team_name"]
+    _allowed_query_parameters: ClassVar[list[str]] = ["per_page", "team_name"]
 
     # Known fields
     name: str | None = None
@@ -2,10 +2,121 @@
 
 from __future__ import annotations
 
+import sys
+import threading
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any, ClassVar
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
 
 from ..base import BaseAPIObject
+from ..exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from ..api import PaginatedAPI
+    from ..deadline import Deadline
+
+#: Number of threads shared by all history calls to list their windows.
+HISTORY_WORKERS = 32
+
+_history_executor: ThreadPoolExecutor | None = None
+_history_executor_lock = threading.Lock()
+
+
+def _get_history_executor() -> ThreadPoolExecutor:
+    """Return the executor listing history windows, created on first use.
+
+    The windows are not listed on the API's page executor: each window
+    waits on its own page requests there, so windows occupying every page
+    worker would never finish.
+
+    Returns:
+        The executor shared by all history calls.
+    """
+    global _history_executor
+    with _history_executor_lock:
+        if _history_executor is None:
+            _history_executor = ThreadPoolExecutor(
+                max_workers=HISTORY_WORKERS,
+                thread_name_prefix="betterstack-uptime-history",
+            )
+        return _history_executor
+
+
+def _parse_bound(value: date | datetime | str) -> date | datetime:
+    """Parse a ``from``/``to`` bound given as a date, datetime or ISO 8601 string.
+
+    Args:
+        value: The bound to parse.
+
+    Returns:
+        A date for date-only bounds, otherwise a datetime.
+
+    Raises:
+        ValidationError: If a string is not a valid ISO 8601 date or datetime.
+    """
+    if isinstance(value, date):
+        return value
+    try:
+        if len(value) == 10:
+            return date.fromisoformat(value)
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as e:
+        raise ValidationError(f"Invalid time range bound {value!r}: {e}") from e
+
+
+def _split_range(
+    start: date | datetime, end: date | datetime, slices: int
+) -> list[tuple[str, str]]:
+    """Split a time range into consecutive ``from``/``to`` windows.
+
+    Date ranges are inclusive on both ends and split into whole days that
+    don't overlap. Datetime ranges are split into windows sharing their
+    boundaries, so incidents on a boundary may be returned twice.
+
+    Args:
+        start: Start of the range.
+        end: End of the range.
+        slices: Maximum number of windows.
+
+    Returns:
+        ISO 8601 ``(from, to)`` pairs in chronological order.
+
+    Raises:
+        ValidationError: If the range is empty or mixes naive and aware datetimes.
+    """
+    if not isinstance(start, datetime) and not isinstance(end, datetime):
+        days = (end - start).days + 1
+        if days < 1:
+            raise ValidationError(f"Time range starts after it ends: {start} > {end}")
+        step = -(-days // slices)
+        windows = []
+        for offset in range(0, days, step):
+            first = start + timedelta(days=offset)
+            last = min(first + timedelta(days=step - 1), end)
+            windows.append((first.isoformat(), last.isoformat()))
+        return windows
+
+    if not isinstance(start, datetime):
+        start = datetime(start.year, start.month, start.day, tzinfo=getattr(end, "tzinfo", None))
+    if not isinstance(end, datetime):
+        end = datetime(end.year, end.month, end.day, tzinfo=start.tzinfo) + timedelta(days=1)
+    try:
+        length = (end - start) / slices
+    except TypeError as e:
+        raise ValidationError(f"Invalid time range {start} - {end}: {e}") from e
+    if length <= timedelta(0):
+        raise ValidationError(f"Time range starts after it ends: {start} >= {end}")
+    bounds = [start + length * i for i in range(slices)] + [end]
+    return [(bounds[i].isoformat(), bounds[i + 1].isoformat()) for i in range(slices)]
 
 
 @dataclass
@@ -97,6 +208,96 @@ class Incident(BaseAPIObject):
     monitor_id: int | None = None
     heartbeat_id: int | None = None
 
+    @classmethod
+    def history(
+        cls,
+        api: PaginatedAPI,
+        from_: date | datetime | str,
+        to: date | datetime | str,
+        slices: int = 12,
+        max_workers: int = 4,
+        deadline: Deadline | None = None,
+        **kwargs: Any,
+    ) -> Generator[Self, None, None]:
+        r"""Fetch the incidents started in a time range, slice by slice in parallel.
+
+        A single long ``from``/``to`` query is paginated deeply, one page
+        after another. This splits the range into ``slices`` windows that
+        are listed concurrently, each with its own pagination. Incidents
+        returned by two windows are yielded once, and all incidents are
+        yielded in ``started_at`` order. Each window is held in memory
+        until the windows before it have been yielded. Closing the generator
+        early cancels the windows not started yet and waits for the others
+        to stop after their current page.
+
+        Dates (``"2024-01-01"``) are split into whole days, datetimes
+        (``"2024-01-01T12:00:00Z"``) into windows of equal length.
+
+        Args:
+            api: API instance with pagination support.
+            from\_: Start of the range, as a date, datetime or ISO 8601 string.
+            to: End of the range, as a date, datetime or ISO 8601 string.
+            slices: Maximum number of windows to split the range into.
+            max_workers: Number of windows fetched at the same time, at most
+                ``HISTORY_WORKERS`` across all calls.
+            deadline: Deadline bounding the listings of all windows.
+            \*\*kwargs: Other query parameters to filter by.
+
+        Yields:
+            Incidents started in the range, ordered by ``started_at``.
+
+        Raises:
+            ValidationError: If a filter parameter is not allowed or the range
+                is invalid.
+        """
+        cls._validate_query_options(**kwargs)
+        if {"from", "from_", "to"} & set(kwargs):
+            raise ValidationError("Pass the time range as the from_ and to arguments")
+        if slices < 1 or max_workers < 1:
+            raise ValidationError("slices and max_workers should be at least 1")
+        windows = _split_range(_parse_bound(from_), _parse_bound(to), slices)
+
+        url = cls.generate_global_url()
+        stop = threading.Event()
+
+        def fetch(window: tuple[str, str]) -> list[dict[str, Any]]:
+            items = []
+            parameters = {**kwargs, "from": window[0], "to": window[1]}
+            listing = api.get(url, parameters=parameters, deadline=deadline, listing=True)
+            try:
+                for item in listing:
+                    if stop.is_set():
+                        break
+                    items.append(item)
+            finally:
+                listing.close()
+            return items
+
+        executor = _get_history_executor()
+        remaining = iter(windows)
+        pending: deque[Future[list[dict[str, Any]]]] = deque(
+            executor.submit(fetch, window) for window in islice(remaining, max_workers)
+        )
+        seen: set[str] = set()
+        try:
+            while pending:
+                items = pending[0].result()
+                pending.popleft()
+                window = next(remaining, None)
+                if window is not None:
+                    pending.append(executor.submit(fetch, window))
+                items.sort(key=lambda item: item.get("attributes", {}).get("started_at") or "")
+                for item in items:
+                    if item["id"] in seen:
+                        continue
+                    seen.add(item["id"])
+                    yield cls._from_api_response(api, item)
+        finally:
+            stop.set()
+            for future in pending:
+                future.cancel()
+            wait(pending)
+
     @property
     def is_resolved(self) -> bool:
         """Check if the incident has been resolved.
@@ -117,7 +318,9 @@ class Incident(BaseAPIObject):
         """
         return self.acknowledged_at is not None or self.status == "Acknowledged"
 
-    def acknowledge(self, acknowledged_by: str | None = None) -> None:
+    def acknowledge(
+        self, acknowledged_by: str | None = None, deadline: Deadline | None = None
+    ) -> None:
         """Acknowledge this incident.
 
         Acknowledging an incident indicates that someone is aware of
@@ -126,20 +329,23 @@ class Incident(BaseAPIObject):
         Args:
             acknowledged_by: Optional name of who is acknowledging
                 the incident.
+            deadline: Deadline bounding the request and its retries.
         """
         body = {}
         if acknowledged_by:
             body["acknowledged_by"] = acknowledged_by
 
-        response = self._api.post(f"{self.generate_url()}/acknowledge", body=body)
-        response_data = response.json()
+        response = self._api.post(
+            f"{self.generate_url()}/acknowledge", body=body, deadline=deadline
+        )
+        response_data = self._api.decode(response)
 
         # Update local state with response
         for key, value in response_data.get("data", {}).get("attributes", {}).items():
             self._set_attribute(key, value)
         self.reset_variable_tracking()
 
-    def resolve(self, resolved_by: str | None = None) -> None:
+    def resolve(self, resolved_by: str | None = None, deadline: Deadline | None = None) -> None:
         """Resolve this incident.
 
         Resolving an incident marks it as fixed. This stops all
@@ -147,13 +353,14 @@ class Incident(BaseAPIObject):
 
         Args:
             resolved_by: Optional name of who is resolving the incident.
+            deadline: Deadline bounding the request and its retries.
         """
         body = {}
         if resolved_by:
             body["resolved_by"] = resolved_by
 
-        response = self._api.post(f"{self.generate_url()}/resolve", body=body)
-        response_data = response.json()
+        response = self._api.post(f"{self.generate_url()}/resolve", body=body, deadline=deadline)
+        response_data = self._api.decode(response)
 
         # Update local state with response
         for key, value in response_data.get("data", {}).get("attributes", {}).items():
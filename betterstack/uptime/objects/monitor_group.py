@@ -29,7 +29,7 @@ class MonitorGroup(BaseAPIObject):
 
     type: ClassVar[str] = "monitor_group"
     _url_endpoint: ClassVar[str] = "monitor-groups"
-    _allowed_query_parameters: ClassVar[list[str]] = ["team_name"]
+    _allowed_query_parameters: ClassVar[list[str]] = ["per_page", "team_name"]
 
     # Known fields
     name: str | None = None
@@ -133,7 +133,7 @@ class OnCallCalendar(BaseAPIObject):
             "end_rotations_at": end_rotations_at,
         }
         response = self._api.post(url, body=data)
-        return response.json()
+        return self._api.decode(response)
 
 
 @dataclass
@@ -0,0 +1,159 @@
+"""Page size selection for paginated listings.
+
+Listings use the server's default page size unless ``per_page`` is
+passed, so large accounts need many more round-trips than necessary. A
+:class:`PageSizer` picks the ``per_page`` of every listing that doesn't
+set one itself: the largest size the endpoint supports, taken from its
+configuration or learned from a server that returned fewer items than
+requested while more pages followed. With a ``target_latency`` it also
+scales the size of the next listing of an endpoint so its pages take
+about that long.
+
+Example:
+    >>> sizer = PageSizer(endpoint_limits={"incidents": 100}, target_latency=1.0)
+    >>> api = UptimeAPI("your-bearer-token", auto_per_page=sizer)
+    >>> monitors = list(Monitor.get_all_instances(api))
+    >>> sizer.per_page("monitors")
+    250
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+
+from .transfer import endpoint_name
+
+# Largest per_page the BetterStack Uptime API accepts on its listings.
+DEFAULT_MAX_PER_PAGE = 250
+
+
+class PageSizer:
+    """Chooses and tunes the ``per_page`` parameter per endpoint.
+
+    Endpoints are named by their path with numeric IDs folded into
+    ``{id}``, as in :func:`~betterstack.uptime.transfer.endpoint_name`.
+    URLs ending in an ID address a single object and are left alone.
+
+    Attributes:
+        max_per_page: Page size requested from endpoints without a limit.
+        endpoint_limits: Largest page size per endpoint prefix.
+        min_per_page: Smallest page size latency tuning goes down to.
+        target_latency: Seconds a page request should take, or None to
+            always request the largest page size.
+    """
+
+    def __init__(
+        self,
+        max_per_page: int = DEFAULT_MAX_PER_PAGE,
+        endpoint_limits: Mapping[str, int] | None = None,
+        min_per_page: int = 10,
+        target_latency: float | None = None,
+    ) -> None:
+        """Initialize the sizer.
+
+        Args:
+            max_per_page: Page size requested from endpoints without a limit.
+            endpoint_limits: Largest page size per endpoint prefix, e.g.
+                ``{"incidents": 100}``. The longest matching prefix wins.
+            min_per_page: Smallest page size latency tuning goes down to.
+            target_latency: Seconds a page request should take. Page sizes
+                shrink when pages take longer and grow back up to the limit
+                when they are faster.
+
+        Raises:
+            ValueError: If a page size is smaller than 1, ``min_per_page``
+                exceeds ``max_per_page`` or ``target_latency`` is not positive.
+        """
+        if min_per_page < 1 or max_per_page < min_per_page:
+            raise ValueError("Page sizes must satisfy 1 <= min_per_page <= max_per_page")
+        if endpoint_limits and min(endpoint_limits.values()) < 1:
+            raise ValueError("Endpoint page size limits must be at least 1")
+        if target_latency is not None and target_latency <= 0:
+            raise ValueError("target_latency must be positive")
+
+        self.max_per_page = max_per_page
+        self.endpoint_limits = {
+            prefix.strip("/"): limit for prefix, limit in (endpoint_limits or {}).items()
+        }
+        self.min_per_page = min_per_page
+        self.target_latency = target_latency
+        self._lock = threading.Lock()
+        self._learned: dict[str, int] = {}
+        self._tuned: dict[str, int] = {}
+
+    def limit_for(self, url: str) -> int:
+        """Determine the largest page size of an endpoint.
+
+        Args:
+            url: URL path, relative to the API base URL.
+
+        Returns:
+            The learned limit, or the limit of the longest matching prefix
+            in ``endpoint_limits``, or ``max_per_page``.
+        """
+        endpoint = endpoint_name(url)
+        with self._lock:
+            learned = self._learned.get(endpoint)
+        if learned is not None:
+            return learned
+
+        best: str | None = None
+        for prefix in self.endpoint_limits:
+            if (endpoint == prefix or endpoint.startswith(f"{prefix}/") or not prefix) and (
+                best is None or len(prefix) > len(best)
+            ):
+                best = prefix
+        return self.endpoint_limits[best] if best is not None else self.max_per_page
+
+    def per_page(self, url: str) -> int | None:
+        """Choose the page size of the next listing of an endpoint.
+
+        Args:
+            url: URL path, relative to the API base URL.
+
+        Returns:
+            The page size to request, or None for single object URLs.
+        """
+        endpoint = endpoint_name(url)
+        if endpoint.endswith("{id}"):
+            return None
+        limit = self.limit_for(url)
+        with self._lock:
+            tuned = self._tuned.get(endpoint, limit)
+        return min(tuned, limit)
+
+    def observe(self, url: str, per_page: int, items: int, has_next: bool, latency: float) -> None:
+        """Learn from the first page of a listing.
+
+        A page holding fewer items than requested while more pages follow
+        reveals the server's limit, which is used from then on. With a
+        ``target_latency``, the page size of the next listing is scaled by
+        how far the page's latency was from the target. Pages of listings
+        that fit on one page never grow the size.
+
+        Args:
+            url: URL path, relative to the API base URL.
+            per_page: Page size that was requested.
+            items: Number of items the page held.
+            has_next: Whether the listing has more pages.
+            latency: Seconds the page request took.
+        """
+        endpoint = endpoint_name(url)
+        with self._lock:
+            if has_next and 0 < items < per_page:
+                self._learned[endpoint] = items
+                per_page = items
+
+            if self.target_latency is None or latency <= 0:
+                return
+            if latency <= self.target_latency and not has_next:
+                return
+            scaled = int(per_page * self.target_latency / latency)
+            self._tuned[endpoint] = max(self.min_per_page, scaled)
+
+    def reset(self) -> None:
+        """Forget all learned limits and tuned page sizes."""
+        with self._lock:
+            self._learned.clear()
+            self._tuned.clear()
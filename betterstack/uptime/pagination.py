@@ -0,0 +1,70 @@
+"""Query parameter and pagination link handling shared by the API clients.
+
+The synchronous and asyncio clients build their query strings and follow
+``pagination`` links the same way; these helpers keep them in step.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+
+def clean_params(parameters: dict[str, Any] | None) -> dict[str, Any]:
+    """Remove trailing underscores from parameter names.
+
+    This allows using Python reserved words like 'from' as parameters
+    by naming them 'from_' in the code.
+
+    Args:
+        parameters: A dict with parameters to clean.
+
+    Returns:
+        A dict with cleaned parameter names.
+    """
+    if not parameters:
+        return {}
+
+    result = {}
+    for key, value in parameters.items():
+        if key.endswith("_"):
+            key = key[:-1]
+        result[key] = value
+    return result
+
+
+def total_pages(pagination: dict[str, Any]) -> int | None:
+    """Extract total page count from pagination info.
+
+    Args:
+        pagination: Pagination dictionary from API response.
+
+    Returns:
+        Total number of pages, or None if not determinable.
+    """
+    # Try to get last page URL and extract page number
+    last_url = pagination.get("last")
+    if last_url:
+        params = parse_qs(urlparse(last_url).query)
+        if "page" in params:
+            try:
+                return int(params["page"][0])
+            except (ValueError, IndexError):
+                pass
+    return None
+
+
+def next_page_parameters(next_url: str, parameters: dict[str, Any]) -> dict[str, Any]:
+    """Merge the query parameters of a ``next`` link into the base parameters.
+
+    Args:
+        next_url: The ``next`` link of a page.
+        parameters: Base URL query parameters.
+
+    Returns:
+        The parameters to request the linked page with.
+    """
+    page_params = parse_qs(urlparse(next_url).query)
+    params = {**parameters}
+    params.update({k: v[0] if len(v) == 1 else v for k, v in page_params.items()})
+    return params
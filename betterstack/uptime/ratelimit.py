@@ -0,0 +1,288 @@
+"""Client-side rate limiters for the BetterStack Uptime API.
+
+A rate limiter paces outgoing requests so bulk jobs stay below the API's
+rate limit instead of running into 429 responses.
+
+Example:
+    >>> api = UptimeAPI("your-bearer-token", rate_limiter=TokenBucket(rate=5, burst=10))
+
+To share one budget between all processes on a host, use a
+:class:`FileTokenBucket` pointing at the same file in every process:
+
+    >>> limiter = FileTokenBucket("/tmp/betterstack-uptime.bucket", rate=5, burst=10)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+from .deadline import current_deadline
+from .exceptions import ConfigurationError
+
+
+class RateLimiter:
+    """Base class for rate limiters used by :class:`~betterstack.uptime.api.RESTAPI`.
+
+    Subclasses must implement :meth:`acquire`. The client calls
+    :meth:`penalize` whenever the API answers with a 429 response.
+    """
+
+    def acquire(self) -> None:
+        """Block until a request may be sent.
+
+        Implementations should give up once the current deadline, see
+        :func:`~betterstack.uptime.deadline.current_deadline`, can't be met.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement acquire()")
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Slow down after the API reported that the rate limit was exceeded.
+
+        Args:
+            retry_after: Seconds the API asked to wait, if it said so.
+        """
+
+
+class TokenBucket(RateLimiter):
+    """Thread-safe token bucket rate limiter.
+
+    Tokens are added at ``rate`` per second up to ``burst`` tokens, and each
+    request takes one token. A limiter instance is shared by all threads
+    using the client it is passed to.
+
+    When the API reports a rate limit violation, the bucket stops handing
+    out tokens until ``Retry-After`` has passed and halves its rate. The
+    rate then recovers linearly to the configured rate over
+    ``recovery_time`` seconds.
+
+    Attributes:
+        rate: Configured number of requests per second.
+        burst: Maximum number of requests that may be sent back to back.
+        recovery_time: Seconds to recover from a reduced rate to ``rate``.
+    """
+
+    # Never slow down below this fraction of the configured rate.
+    MIN_RATE_FACTOR = 0.1
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        recovery_time: float = 60.0,
+    ) -> None:
+        """Initialize the token bucket, starting full.
+
+        Args:
+            rate: Number of requests per second.
+            burst: Bucket capacity, defaults to one second worth of requests.
+            recovery_time: Seconds to recover from a reduced rate to ``rate``.
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate should be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst should be at least 1")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.recovery_time = recovery_time
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._current_rate = rate
+        self._blocked_until = 0.0
+        self._updated_at = time.monotonic()
+
+    @property
+    def current_rate(self) -> float:
+        """Rate currently applied, lower than ``rate`` after a 429 response."""
+        with self._state():
+            self._refill(self._now())
+            return self._current_rate
+
+    def _now(self) -> float:
+        """Return the current time on the clock the bucket state is kept in."""
+        return time.monotonic()
+
+    @contextmanager
+    def _state(self) -> Iterator[None]:
+        """Hold exclusive access to the bucket state."""
+        with self._lock:
+            yield
+
+    def _refill(self, now: float) -> None:
+        """Add tokens and recover the rate for the time passed since the last update.
+
+        Must be called while holding :meth:`_state`.
+
+        Args:
+            now: Current time, as returned by :meth:`_now`.
+        """
+        elapsed = max(now - self._updated_at, 0.0)
+        self._updated_at = now
+        if now < self._blocked_until:
+            return
+
+        if self._current_rate < self.rate:
+            recovered = (
+                self.rate * elapsed / self.recovery_time if self.recovery_time else self.rate
+            )
+            self._current_rate = min(self.rate, self._current_rate + recovered)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._current_rate)
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it.
+
+        Raises:
+            DeadlineExceededError: If the current deadline expires before a
+                token becomes available.
+        """
+        deadline = current_deadline()
+        while True:
+            with self._state():
+                now = self._now()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self._current_rate
+            if deadline is not None and wait >= deadline.remaining():
+                raise deadline.error()
+            time.sleep(wait)
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Pause until ``retry_after`` has passed and halve the current rate.
+
+        Args:
+            retry_after: Seconds the API asked to wait. When unknown, the
+                bucket pauses for one interval at the reduced rate.
+        """
+        with self._state():
+            now = self._now()
+            self._refill(now)
+            self._current_rate = max(self._current_rate / 2, self.rate * self.MIN_RATE_FACTOR)
+            pause = retry_after if retry_after is not None else 1 / self._current_rate
+            self._blocked_until = max(self._blocked_until, now + pause)
+            self._tokens = 0.0
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is shared between processes through a file.
+
+    Every process (and thread) using a bucket with the same ``path`` draws
+    from a single budget, so separate workers and scheduled jobs on one
+    host stay below the account's rate limit together. Access to the
+    state is serialized with an exclusive ``flock`` on the file, and the
+    wall clock is used so that timestamps are comparable between
+    processes.
+
+    Only available on platforms providing :mod:`fcntl`.
+
+    Attributes:
+        path: Path of the file holding the shared bucket state.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        rate: float,
+        burst: int | None = None,
+        recovery_time: float = 60.0,
+    ) -> None:
+        """Initialize the file-backed token bucket.
+
+        The file is created when it does not exist yet. A new or empty file
+        starts with a full bucket.
+
+        Args:
+            path: Path of the state file, identical in all cooperating processes.
+            rate: Number of requests per second for all processes together.
+            burst: Bucket capacity, defaults to one second worth of requests.
+            recovery_time: Seconds to recover from a reduced rate to ``rate``.
+
+        Raises:
+            ConfigurationError: If file locking is not supported on this platform.
+            ValueError: If rate or burst is not positive.
+        """
+        if fcntl is None:
+            raise ConfigurationError("FileTokenBucket requires fcntl, which is not available")
+
+        super().__init__(rate, burst, recovery_time)
+        self.path = os.fspath(path)
+        self._updated_at = self._now()
+
+    def _now(self) -> float:
+        """Return the wall clock time, which is shared between processes."""
+        return time.time()
+
+    @contextmanager
+    def _state(self) -> Iterator[None]:
+        """Lock the state file, load the bucket state and store it afterwards."""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            with os.fdopen(os.dup(fd), "r+", encoding="utf-8") as state_file:
+                self._load(state_file.read())
+                yield
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(self._dump())
+                state_file.flush()
+        finally:
+            # Closing the descriptor releases the lock
+            os.close(fd)
+
+    def _load(self, content: str) -> None:
+        """Restore the bucket state from the state file contents.
+
+        Args:
+            content: Contents of the state file, possibly empty.
+        """
+        try:
+            state = json.loads(content)
+            self._tokens = float(state["tokens"])
+            self._current_rate = float(state["current_rate"])
+            self._blocked_until = float(state["blocked_until"])
+            self._updated_at = float(state["updated_at"])
+        except (ValueError, KeyError, TypeError):
+            self._tokens = float(self.burst)
+            self._current_rate = self.rate
+            self._blocked_until = 0.0
+            self._updated_at = self._now()
+
+        # Another process may have been configured with a different rate
+        self._tokens = min(self._tokens, float(self.burst))
+        self._current_rate = min(self._current_rate, self.rate)
+
+    def _dump(self) -> str:
+        """Serialize the bucket state for the state file.
+
+        Returns:
+            JSON encoded bucket state.
+        """
+        return json.dumps(
+            {
+                "tokens": self._tokens,
+                "current_rate": self._current_rate,
+                "blocked_until": self._blocked_until,
+                "updated_at": self._updated_at,
+            }
+        )
@@ -0,0 +1,177 @@
+"""Priority scheduling of requests sharing one client.
+
+A client shared by a bulk export and interactive tooling sends the
+interactive requests into the same queues as hundreds of page fetches: the
+``max_in_flight`` slots and the rate limiter. A :class:`PriorityScheduler`
+gives every priority class its own pool of in-flight requests and lets
+requests of a higher class take their turn at the rate limiter before
+waiting requests of a lower class.
+
+Requests are ``interactive`` unless they are marked otherwise. The pages of
+listings are ``bulk``, except when the listing's caller set a priority
+with :func:`request_priority`. Single objects, such as those fetched by
+``fetch_data``, and all writes are ``interactive``.
+
+Example:
+    >>> api = UptimeAPI("your-bearer-token", max_in_flight=16, priorities=True)
+    >>> export = threading.Thread(target=lambda: list(Incident.get_all_instances(api)))
+    >>> export.start()
+    >>> incident.acknowledge()  # Doesn't wait behind the export's pages
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+
+from .deadline import wait_within_deadline
+
+# Priority classes, from highest to lowest.
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+_local = threading.local()
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """Send the requests made by this thread in the block with a priority.
+
+    Args:
+        priority: ``"interactive"`` or ``"bulk"``.
+
+    Raises:
+        ValueError: If the priority is unknown.
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"priority should be one of {', '.join(PRIORITIES)}")
+    previous = getattr(_local, "priority", None)
+    _local.priority = priority
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+def current_priority() -> str | None:
+    """Return the priority set by :func:`request_priority` in this thread, if any."""
+    priority: str | None = getattr(_local, "priority", None)
+    return priority
+
+
+class PriorityScheduler:
+    """Admits requests by priority class.
+
+    Each class has its own limit on requests in flight, so interactive
+    requests never wait for a slot held by a bulk request. Requests wait
+    for the rate limiter one at a time, and a waiting request of a higher
+    class always goes before waiting requests of lower classes.
+
+    Example:
+        >>> scheduler = PriorityScheduler(limits={"interactive": 2, "bulk": 8})
+        >>> api = UptimeAPI("your-bearer-token", priorities=scheduler)
+        >>> scheduler.in_flight("bulk"), scheduler.preempted
+
+    Attributes:
+        limits: Maximum number of requests in flight per class, None for no limit.
+        preempted: Number of turns taken ahead of waiting requests of a lower class.
+    """
+
+    def __init__(self, limits: Mapping[str, int | None] | None = None) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            limits: Maximum number of requests in flight per priority class.
+                Classes left out have no limit.
+
+        Raises:
+            ValueError: If a class is unknown or a limit is smaller than 1.
+        """
+        limits = dict(limits or {})
+        unknown = set(limits) - set(PRIORITIES)
+        if unknown:
+            raise ValueError(f"Unknown priority classes: {', '.join(sorted(unknown))}")
+        if any(limit is not None and limit < 1 for limit in limits.values()):
+            raise ValueError("Limits should be at least 1")
+
+        self.limits: dict[str, int | None] = {p: limits.get(p) for p in PRIORITIES}
+        self.preempted = 0
+        self._condition = threading.Condition()
+        self._in_flight = dict.fromkeys(PRIORITIES, 0)
+        self._waiting = dict.fromkeys(PRIORITIES, 0)
+        self._turn_taken = False
+
+    def in_flight(self, priority: str) -> int:
+        """Count the requests of a class holding a slot.
+
+        Args:
+            priority: Priority class.
+
+        Returns:
+            The number of requests in flight.
+        """
+        with self._condition:
+            return self._in_flight[priority]
+
+    @contextmanager
+    def slot(self, priority: str) -> Iterator[None]:
+        """Hold one of the in-flight slots of a priority class.
+
+        Waits at most until the current deadline, see
+        :func:`~betterstack.uptime.deadline.deadline_scope`.
+
+        Args:
+            priority: Priority class of the request.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before a slot is free.
+        """
+        limit = self.limits[priority]
+        with self._condition:
+            while limit is not None and self._in_flight[priority] >= limit:
+                wait_within_deadline(self._condition)
+            self._in_flight[priority] += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight[priority] -= 1
+                self._condition.notify_all()
+
+    @contextmanager
+    def turn(self, priority: str) -> Iterator[None]:
+        """Take the exclusive turn at a shared resource such as the rate limiter.
+
+        The turn goes to a waiting request of the highest class. Waits at
+        most until the current deadline.
+
+        Args:
+            priority: Priority class of the request.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before the turn.
+        """
+        rank = PRIORITIES.index(priority)
+        higher, lower = PRIORITIES[:rank], PRIORITIES[rank + 1 :]
+        with self._condition:
+            self._waiting[priority] += 1
+            try:
+                while self._turn_taken or any(self._waiting[p] for p in higher):
+                    wait_within_deadline(self._condition)
+            except BaseException:
+                # Lower classes may have been waiting behind this request
+                self._condition.notify_all()
+                raise
+            finally:
+                self._waiting[priority] -= 1
+            self._turn_taken = True
+            if any(self._waiting[p] for p in lower):
+                self.preempted += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._turn_taken = False
+                self._condition.notify_all()
@@ -0,0 +1,191 @@
+"""Incremental decoding of paginated JSON responses.
+
+Pages of some resources carry large blobs per item, so decoding a whole
+page before yielding its first item holds the full document in memory.
+:class:`StreamingPage` parses the ``data`` array of a response item by
+item while the body is being downloaded, and keeps the other top-level
+members (such as ``pagination``) in :attr:`StreamingPage.document`.
+
+Items are decoded with :meth:`json.JSONDecoder.raw_decode`; the client's
+``json_codec`` has no incremental API and is not used for streamed pages.
+
+Example:
+    >>> page = StreamingPage(response.iter_content(chunk_size=65536))
+    >>> for item in page:
+    ...     handle(item)
+    >>> page.document["pagination"]["next"]
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import Callable, Generator, Iterable, Iterator
+from typing import Any
+
+# Compact the buffer once this many characters were consumed.
+COMPACT_THRESHOLD = 1 << 16
+
+WHITESPACE = " \t\n\r"
+
+
+class StreamingPage:
+    """Iterator over the items of a page, decoded while the body streams in.
+
+    The body must be a JSON object. When its ``data`` member is an array,
+    the items are yielded one at a time as soon as each one is complete,
+    so at most about one item plus one chunk is held in memory. All other
+    members, and ``data`` itself when it is not an array, are collected
+    in :attr:`document`, which is complete once iteration finished.
+
+    Attributes:
+        document: Top-level members of the body other than the ``data`` array.
+        count: Number of items yielded so far.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        key: str = "data",
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        """Prepare decoding; nothing is read until iteration starts.
+
+        Args:
+            chunks: Raw body chunks, for example ``response.iter_content(65536)``.
+            key: Name of the array member to stream.
+            on_close: Called once when iteration ends or :meth:`close` is called,
+                for example to release the connection.
+        """
+        self.document: dict[str, Any] = {}
+        self.count = 0
+        self._chunks = iter(chunks)
+        self._key = key
+        self._on_close = on_close
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+        self._items = self._parse()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Return the item iterator."""
+        return self
+
+    def __next__(self) -> Any:
+        """Decode and return the next item of the streamed array."""
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stop decoding and release the underlying body."""
+        self._items.close()
+        self._release()
+
+    def _release(self) -> None:
+        """Call ``on_close`` if it wasn't called yet."""
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+    def _parse(self) -> Generator[Any, None, None]:
+        """Walk the top-level object, yielding the streamed array items.
+
+        Raises:
+            ValueError: If the body is not a JSON object or is truncated.
+        """
+        try:
+            self._expect("{")
+            if self._peek() == "}":
+                self._pos += 1
+                return
+            while True:
+                name = self._value()
+                self._expect(":")
+                if name == self._key and self._peek() == "[":
+                    self._pos += 1
+                    yield from self._array_items()
+                else:
+                    self.document[name] = self._value()
+                separator = self._peek()
+                self._pos += 1
+                if separator == "}":
+                    return
+                if separator != ",":
+                    raise ValueError(f"Expected ',' or '}}' in JSON object, got {separator!r}")
+        finally:
+            self._release()
+
+    def _array_items(self) -> Generator[Any, None, None]:
+        """Yield the items of an array whose opening bracket was consumed."""
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            self.count += 1
+            separator = self._peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {separator!r}")
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value, reading more of the body as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Double the pending text before retrying, so a value spanning
+                # many chunks is decoded a logarithmic number of times
+                pending = len(self._buffer) - self._pos
+                if not self._read():
+                    raise
+                while len(self._buffer) - self._pos < 2 * pending and self._read():
+                    pass
+                continue
+            # A value touching the end of the buffer may continue in the next chunk
+            if end < len(self._buffer) or not self._read():
+                self._pos = end
+                return value
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                raise ValueError("Unexpected end of JSON document")
+
+    def _expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be ``char``."""
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON document, got {found!r}")
+        self._pos += 1
+
+    def _read(self) -> bool:
+        """Append the next chunk of the body to the buffer.
+
+        Returns:
+            False when the body is exhausted.
+        """
+        if self._pos >= COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+        while not self._exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                text = self._text.decode(b"", final=True)
+            else:
+                text = self._text.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        return False
@@ -0,0 +1,169 @@
+"""Compression negotiation and bandwidth accounting for the REST API client.
+
+The client asks for compressed responses with every encoding urllib3 can
+decode: gzip and deflate, plus brotli and zstd when their packages are
+installed:
+
+    pip install betterstack-uptime[compression]
+
+For every decoded response it records the bytes received on the wire, the
+bytes after decompression and the time spent decoding the JSON body, per
+endpoint. Numeric path segments are folded into ``{id}``, so
+``monitors/123`` and ``monitors/456`` share the ``monitors/{id}`` counters.
+
+Example:
+    >>> api = UptimeAPI("your-bearer-token")
+    >>> monitors = list(Monitor.get_all_instances(api))
+    >>> api.transfer_stats()["monitors"].compression_ratio
+    6.8
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, replace
+from urllib.parse import urlparse
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Value of the Accept-Encoding header, e.g. "gzip,deflate,br,zstd"
+SUPPORTED_ENCODINGS = ACCEPT_ENCODING
+
+
+def accept_encoding(compression: bool) -> str:
+    """Build the ``Accept-Encoding`` header sent with every request.
+
+    Args:
+        compression: Whether compressed responses are accepted.
+
+    Returns:
+        All encodings urllib3 can decode, or ``"identity"``.
+    """
+    return SUPPORTED_ENCODINGS if compression else "identity"
+
+
+def endpoint_name(url: str, base_path: str = "") -> str:
+    """Name the endpoint a URL belongs to.
+
+    Args:
+        url: Absolute or relative URL of a request.
+        base_path: Path of the API base URL, stripped from the front.
+
+    Returns:
+        The path relative to the base path with numeric segments replaced
+        by ``{id}``, e.g. ``"monitors/{id}/sla"``.
+    """
+    path = urlparse(url).path.strip("/")
+    base_path = base_path.strip("/")
+    if base_path and (path == base_path or path.startswith(f"{base_path}/")):
+        path = path[len(base_path) :].lstrip("/")
+    return "/".join("{id}" if part.isdigit() else part for part in path.split("/"))
+
+
+@dataclass(frozen=True)
+class TransferStats:
+    """Bandwidth counters of an endpoint.
+
+    Attributes:
+        responses: Number of decoded responses.
+        compressed_responses: Number of those sent with a ``Content-Encoding``.
+        wire_bytes: Bytes of response bodies received, before decompression.
+        decoded_bytes: Bytes of response bodies after decompression.
+        decode_seconds: Time spent decoding the JSON bodies. Streamed pages,
+            which are decoded while they download, don't add to it.
+    """
+
+    responses: int = 0
+    compressed_responses: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    decode_seconds: float = 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Decoded bytes per byte on the wire, 1.0 when nothing was compressed."""
+        if not self.wire_bytes:
+            return 1.0
+        return self.decoded_bytes / self.wire_bytes
+
+    @property
+    def saved_bytes(self) -> int:
+        """Number of bytes compression kept off the wire."""
+        return max(self.decoded_bytes - self.wire_bytes, 0)
+
+    def __add__(self, other: TransferStats) -> TransferStats:
+        """Combine the counters of two endpoints."""
+        return TransferStats(
+            responses=self.responses + other.responses,
+            compressed_responses=self.compressed_responses + other.compressed_responses,
+            wire_bytes=self.wire_bytes + other.wire_bytes,
+            decoded_bytes=self.decoded_bytes + other.decoded_bytes,
+            decode_seconds=self.decode_seconds + other.decode_seconds,
+        )
+
+
+class TransferMeter:
+    """Thread-safe per-endpoint bandwidth counters.
+
+    Example:
+        >>> meter = TransferMeter()
+        >>> meter.record("monitors", wire_bytes=1200, decoded_bytes=9000, encoding="gzip")
+        >>> meter.stats()["monitors"].saved_bytes
+        7800
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self._stats: dict[str, TransferStats] = {}
+
+    def record(
+        self,
+        endpoint: str,
+        wire_bytes: int,
+        decoded_bytes: int,
+        encoding: str | None = None,
+        decode_seconds: float = 0.0,
+    ) -> None:
+        """Count a response.
+
+        Args:
+            endpoint: Name of the endpoint, see :func:`endpoint_name`.
+            wire_bytes: Size of the body as received.
+            decoded_bytes: Size of the body after decompression.
+            encoding: ``Content-Encoding`` of the response, if any.
+            decode_seconds: Time spent decoding the JSON body.
+        """
+        compressed = encoding is not None and encoding.lower() not in ("", "identity")
+        with self._lock:
+            current = self._stats.get(endpoint, TransferStats())
+            self._stats[endpoint] = replace(
+                current,
+                responses=current.responses + 1,
+                compressed_responses=current.compressed_responses + compressed,
+                wire_bytes=current.wire_bytes + wire_bytes,
+                decoded_bytes=current.decoded_bytes + decoded_bytes,
+                decode_seconds=current.decode_seconds + decode_seconds,
+            )
+
+    def stats(self) -> dict[str, TransferStats]:
+        """Take a snapshot of the counters.
+
+        Returns:
+            Counters per endpoint name.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def total(self) -> TransferStats:
+        """Sum the counters of all endpoints.
+
+        Returns:
+            The combined counters.
+        """
+        return sum(self.stats().values(), TransferStats())
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._stats.clear()
@@ -1,5 +1,7 @@
 """Shared test fixtures and constants for API mocking."""
 
+import time
+
 # Base URLs for testing
 BASE_URL = "https://uptime.betterstack.com/api/v2/"
 V3_BASE_URL = "https://uptime.betterstack.com/api/v3/"
@@ -160,3 +162,36 @@ def make_paginated_response(data: list, next_url: str | None = None) -> dict:
             "next": next_url,
         },
     }
+
+
+class FakeClock:
+    """Deterministic replacement for time.monotonic, time.time and time.sleep.
+
+    Patch it over the ``time`` module of the code under test, e.g.
+    ``mock.patch("betterstack.uptime.cache.time", FakeClock())``.
+    """
+
+    def __init__(self):
+        """Start the clock at an arbitrary point."""
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        """Return the current fake time."""
+        return self.now
+
+    def time(self):
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Advance the fake time instead of sleeping."""
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
@@ -0,0 +1,62 @@
+"""Minimal local HTTP server for tests that need real connections."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """Keep-alive request handler answering every request with a JSON body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Answer with the body configured on the server."""
+        self.server.requests.append((self.command, self.path, dict(self.headers)))
+        body = json.dumps(self.server.body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+
+
+class LocalServer:
+    """Threaded HTTP server on a random localhost port.
+
+    Example:
+        >>> with LocalServer({"data": []}) as server:
+        ...     requests.get(f"{server.base_url}monitors")
+    """
+
+    def __init__(self, body=None, handler=JSONHandler):
+        """Create the server without starting it."""
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        self.httpd.body = body if body is not None else {"data": []}
+        self.httpd.requests = []
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        """Base URL of the server, ending with a forward slash."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def requests(self):
+        """(method, path, headers) of the requests received so far."""
+        return self.httpd.requests
+
+    def __enter__(self):
+        """Start serving in a background thread."""
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop the server."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
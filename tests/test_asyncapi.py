@@ -0,0 +1,263 @@
+"""Tests for the asyncio client classes."""
+
+import json
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from betterstack.uptime import AsyncPaginatedAPI, AsyncUptimeAPI, BearerAuth  # noqa: E402
+from betterstack.uptime.exceptions import (  # noqa: E402
+    APIError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+)
+from betterstack.uptime.objects import Monitor  # noqa: E402
+from tests.fixtures import (  # noqa: E402
+    BASE_URL,
+    MONITOR_1,
+    MONITOR_2,
+    MONITOR_3,
+    TEST_BASE_URL,
+    make_paginated_response,
+)
+
+
+def mock_client(api, handler):
+    """Replace the client of an async API with one backed by a mock transport."""
+    api.client = httpx.AsyncClient(
+        headers=api.client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def paged_body(page, total, url=f"{TEST_BASE_URL}test_json"):
+    """Build the body for one page of a paginated listing."""
+    return {
+        "data": [{"id": str(page)}],
+        "pagination": {
+            "first": f"{url}?page=1",
+            "last": f"{url}?page={total}",
+            "prev": None,
+            "next": f"{url}?page={page + 1}" if page < total else None,
+        },
+    }
+
+
+class TestAsyncPaginatedAPI(unittest.IsolatedAsyncioTestCase):
+    """Tests for AsyncPaginatedAPI request handling and pagination."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api = AsyncPaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+        self.requests = []
+
+    async def asyncTearDown(self):
+        """Close the client."""
+        await self.api.aclose()
+
+    def test_base_url_exception(self):
+        """Test that base_url must end with a slash."""
+        with self.assertRaises(ValueError):
+            AsyncPaginatedAPI(base_url="helloworld", auth=BearerAuth("test"))
+
+    async def test_get_multiple_pages_in_order(self):
+        """Test that pages are fetched concurrently and yielded in order."""
+
+        def handler(request):
+            self.requests.append(request)
+            page = int(parse_qs(urlparse(str(request.url)).query).get("page", ["1"])[0])
+            return httpx.Response(200, json=paged_body(page, 4))
+
+        mock_client(self.api, handler)
+
+        items = [item async for item in self.api.get("test_json")]
+
+        self.assertEqual([item["id"] for item in items], ["1", "2", "3", "4"])
+        self.assertEqual(len(self.requests), 4)
+        self.assertEqual(self.requests[0].headers["Authorization"], "Bearer test-token")
+
+    async def test_get_sequential_fallback(self):
+        """Test following next links when the last page is unknown."""
+
+        def handler(request):
+            page = int(parse_qs(urlparse(str(request.url)).query).get("page", ["1"])[0])
+            next_url = f"{TEST_BASE_URL}test_json?page={page + 1}" if page < 3 else None
+            return httpx.Response(200, json=make_paginated_response([{"id": page}], next_url))
+
+        mock_client(self.api, handler)
+
+        items = [item async for item in self.api.get("test_json")]
+
+        self.assertEqual([item["id"] for item in items], [1, 2, 3])
+
+    async def test_close_cancels_pending_pages(self):
+        """Test that closing the generator early stops fetching further pages."""
+
+        def handler(request):
+            self.requests.append(request)
+            page = int(parse_qs(urlparse(str(request.url)).query).get("page", ["1"])[0])
+            return httpx.Response(200, json=paged_body(page, 50))
+
+        mock_client(self.api, handler)
+        self.api.max_workers = 1
+
+        items = self.api.get("test_json")
+        self.assertEqual((await anext(items))["id"], "1")
+        await items.aclose()
+
+        self.assertLess(len(self.requests), 50)
+
+    async def test_pages_ahead_are_bounded(self):
+        """Test that only a window of pages is requested ahead of the consumer."""
+
+        def handler(request):
+            self.requests.append(request)
+            page = int(parse_qs(urlparse(str(request.url)).query).get("page", ["1"])[0])
+            return httpx.Response(200, json=paged_body(page, 100))
+
+        mock_client(self.api, handler)
+        self.api.max_workers = 2
+
+        items = self.api.get("test_json")
+        self.assertEqual((await anext(items))["id"], "1")
+        self.assertEqual((await anext(items))["id"], "2")
+
+        # First page, pages 2 to 5 in the window, and page 6 refilled after page 2
+        self.assertLessEqual(len(self.requests), 6)
+        rest = [item["id"] async for item in items]
+        self.assertEqual(rest, [str(page) for page in range(3, 101)])
+
+    async def test_parameters_are_cleaned(self):
+        """Test that trailing underscores are removed from parameters."""
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(200, json=make_paginated_response([]))
+
+        mock_client(self.api, handler)
+
+        _ = [item async for item in self.api.get("test_json", parameters={"from_": "2023"})]
+
+        self.assertIn("from=2023", str(self.requests[0].url))
+
+    async def test_retries_server_errors(self):
+        """Test that 5xx responses are retried before succeeding."""
+        statuses = [503, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            return httpx.Response(status, json=make_paginated_response([{"id": 1}]))
+
+        mock_client(self.api, handler)
+        self.api.backoff_factor = 0
+
+        items = [item async for item in self.api.get("test_json")]
+
+        self.assertEqual(items, [{"id": 1}])
+        self.assertEqual(statuses, [])
+
+    async def test_error_mapping(self):
+        """Test that error responses raise the same exceptions as RESTAPI."""
+        cases = [
+            (404, {}, NotFoundError),
+            (422, {}, APIError),
+            (429, {"Retry-After": "7"}, RateLimitError),
+            (500, {}, ServerError),
+        ]
+        self.api.retries = 0
+        for status, headers, exc_class in cases:
+            mock_client(
+                self.api,
+                lambda request, s=status, h=headers: httpx.Response(
+                    s, headers=h, content=json.dumps({"error": "boom"})
+                ),
+            )
+            with self.assertRaises(exc_class) as ctx:
+                await self.api.post("test_json", body={"a": 1})
+            self.assertEqual(ctx.exception.status_code, status)
+            self.assertIn("boom", str(ctx.exception))
+            if exc_class is RateLimitError:
+                self.assertEqual(ctx.exception.retry_after, 7)
+
+
+class TestAsyncBaseAPIObject(unittest.IsolatedAsyncioTestCase):
+    """Tests for the asynchronous BaseAPIObject methods."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api = AsyncUptimeAPI("test-token")
+        self.requests = []
+
+    async def asyncTearDown(self):
+        """Close the client."""
+        await self.api.aclose()
+
+    async def test_get_all_instances(self):
+        """Test fetching all monitors asynchronously."""
+        mock_client(
+            self.api,
+            lambda request: httpx.Response(
+                200, json=make_paginated_response([MONITOR_1["data"], MONITOR_2["data"]])
+            ),
+        )
+
+        monitors = [monitor async for monitor in Monitor.aget_all_instances(self.api)]
+
+        self.assertEqual([monitor.id for monitor in monitors], ["1", "2"])
+        self.assertEqual(monitors[0].url, "https://example.com")
+
+    async def test_filter(self):
+        """Test filtering monitors asynchronously."""
+
+        def handler(request):
+            self.requests.append(request)
+            return httpx.Response(200, json=make_paginated_response([MONITOR_3["data"]]))
+
+        mock_client(self.api, handler)
+
+        monitors = [m async for m in Monitor.afilter(self.api, url="https://thirdexample.com")]
+
+        self.assertEqual(len(monitors), 1)
+        self.assertIn("url=https", str(self.requests[0].url))
+
+    async def test_fetch_save_delete(self):
+        """Test the fetch, save and delete lifecycle of an object."""
+
+        def handler(request):
+            self.requests.append(request)
+            if request.method == "PATCH":
+                body = json.loads(request.content)
+                updated = json.loads(json.dumps(MONITOR_1))
+                updated["data"]["attributes"].update(body)
+                return httpx.Response(200, json=updated)
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            return httpx.Response(200, json=MONITOR_1)
+
+        mock_client(self.api, handler)
+
+        monitor = Monitor(id="1", _api=self.api)
+        await monitor.afetch_data()
+        self.assertEqual(monitor.url, "https://example.com")
+
+        monitor.check_frequency = 60
+        await monitor.asave()
+        self.assertEqual(json.loads(self.requests[1].content), {"check_frequency": 60})
+        self.assertEqual(monitor.get_modified_properties(), [])
+
+        await monitor.adelete()
+        self.assertEqual(self.requests[2].method, "DELETE")
+        self.assertEqual(str(self.requests[2].url), f"{BASE_URL}monitors/1")
+
+    async def test_new(self):
+        """Test creating an object asynchronously."""
+        mock_client(self.api, lambda request: httpx.Response(201, json=MONITOR_1))
+
+        monitor = await Monitor.anew(self.api, url="https://example.com")
+
+        self.assertEqual(monitor.id, "1")
+        self.assertEqual(monitor.pronounceable_name, "MyWeirdExampleSite")
@@ -0,0 +1,648 @@
+"""Tests for the response cache."""
+
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import responses
+
+from betterstack.uptime import RESTAPI, BearerAuth, PaginatedAPI, ResponseCache, SQLiteCache
+from betterstack.uptime.cache import TOUCH_FLUSH_INTERVAL
+from betterstack.uptime.exceptions import ForbiddenError, NotFoundError
+from tests.fixtures import TEST_BASE_URL, FakeClock
+from tests.test_paginatedapi import add_paged_callback
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for ResponseCache entries, expiry and eviction."""
+
+    def setUp(self):
+        """Patch the clock used by the cache."""
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.cache.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_key_normalizes_path_and_parameter_order(self):
+        """Test that equivalent requests share a key."""
+        self.assertEqual(
+            ResponseCache.key("/monitors/", {"b": 2, "a": 1}),
+            ResponseCache.key("monitors", {"a": 1, "b": 2}),
+        )
+        self.assertNotEqual(
+            ResponseCache.key("monitors", {"page": 1}),
+            ResponseCache.key("monitors", {"page": 2}),
+        )
+
+    def test_entry_expires_after_ttl(self):
+        """Test that an entry is served until its TTL passes."""
+        cache = ResponseCache(ttl=10)
+        key = cache.key("monitors")
+        cache.set(key, {"data": []})
+
+        self.clock.now += 9
+        self.assertEqual(cache.get(key), {"data": []})
+
+        self.clock.now += 1
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(len(cache), 0)
+
+    def test_endpoint_ttl_longest_prefix_wins(self):
+        """Test that per-endpoint TTLs match on the longest path prefix."""
+        cache = ResponseCache(ttl=30, endpoint_ttls={"monitors": 5, "monitors/1/sla": 60})
+
+        self.assertEqual(cache.ttl_for("monitors"), 5)
+        self.assertEqual(cache.ttl_for("monitors/2"), 5)
+        self.assertEqual(cache.ttl_for("monitors/1/sla"), 60)
+        self.assertEqual(cache.ttl_for("monitor-groups"), 30)
+
+    def test_zero_ttl_is_not_cached(self):
+        """Test that an endpoint with a TTL of zero is never stored."""
+        cache = ResponseCache(endpoint_ttls={"incidents": 0})
+        cache.set(cache.key("incidents"), {"data": []})
+
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        first, second, third = (cache.key(f"monitors/{i}") for i in range(3))
+        cache.set(first, 1)
+        cache.set(second, 2)
+        cache.get(first)
+
+        cache.set(third, 3)
+
+        self.assertEqual(cache.get(first), 1)
+        self.assertIsNone(cache.get(second))
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_hits_return_copies(self):
+        """Test that mutating a returned body does not change the cache."""
+        cache = ResponseCache()
+        key = cache.key("monitors")
+        body = {"data": [{"id": "1"}]}
+        cache.set(key, body)
+        body["data"].clear()
+
+        cache.get(key)["data"].clear()
+
+        self.assertEqual(cache.get(key), {"data": [{"id": "1"}]})
+
+    def test_negative_caching(self):
+        """Test that a cached 404 raises NotFoundError until it expires."""
+        cache = ResponseCache(negative_ttl=5)
+        key = cache.key("monitors/404")
+        cache.set_not_found(key)
+
+        with self.assertRaises(NotFoundError):
+            cache.get(key)
+
+        self.clock.now += 5
+        self.assertIsNone(cache.get(key))
+
+    def test_negative_caching_disabled_by_default(self):
+        """Test that 404 responses are not stored without negative_ttl."""
+        cache = ResponseCache()
+        cache.set_not_found(cache.key("monitors/404"))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_resource_children_and_parents(self):
+        """Test that a write drops the resource, its children and its collections."""
+        cache = ResponseCache()
+        for url in ("monitors", "monitors/1", "monitors/1/sla", "monitors/12", "heartbeats"):
+            cache.set(cache.key(url, {"page": 1}), {})
+
+        self.assertEqual(cache.invalidate("monitors/1"), 3)
+
+        remaining = sorted(path for path, _ in cache._entries)
+        self.assertEqual(remaining, ["heartbeats", "monitors/12"])
+
+    def test_stats(self):
+        """Test the hit and miss counters."""
+        cache = ResponseCache()
+        key = cache.key("monitors")
+        cache.get(key)
+        cache.set(key, {})
+        cache.get(key)
+        cache.get(key)
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (2, 1, 1))
+        self.assertAlmostEqual(stats.hit_ratio, 2 / 3)
+
+    def test_invalid_configuration(self):
+        """Test that a cache without room for entries is rejected."""
+        with self.assertRaises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+class TestResponseCacheValidators(unittest.TestCase):
+    """Tests for keeping and revalidating expired entries with validators."""
+
+    def setUp(self):
+        """Patch the clock used by the cache."""
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.cache.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_expired_entry_with_validators_is_kept(self):
+        """Test that an expired entry with an ETag can be revalidated."""
+        cache = ResponseCache(ttl=10)
+        key = cache.key("monitors")
+        cache.set(key, {"data": []}, etag='"abc"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+        self.clock.now += 10
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(
+            cache.validators(key),
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+        self.assertEqual(cache.revalidate(key), {"data": []})
+        self.assertEqual(cache.get(key), {"data": []})
+        self.assertEqual(cache.stats().revalidations, 1)
+
+    def test_expired_entry_without_validators_is_dropped(self):
+        """Test that an expired entry without validators cannot be revalidated."""
+        cache = ResponseCache(ttl=10)
+        key = cache.key("monitors")
+        cache.set(key, {"data": []})
+
+        self.clock.now += 10
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.validators(key), {})
+        self.assertIsNone(cache.revalidate(key))
+
+    def test_zero_ttl_with_validators_is_kept(self):
+        """Test that a TTL of zero still allows revalidation."""
+        cache = ResponseCache(ttl=0)
+        key = cache.key("monitors")
+        cache.set(key, {"data": []}, etag='"abc"')
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.validators(key), {"If-None-Match": '"abc"'})
+
+
+class TestResponseCacheStale(unittest.TestCase):
+    """Tests for serving stale entries and expiring entries on demand."""
+
+    def setUp(self):
+        """Patch the clock used by the cache."""
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.cache.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stale_entry_served_within_stale_ttl(self):
+        """Test that an expired entry is served until stale_ttl passes."""
+        cache = ResponseCache(ttl=10, stale_ttl=20)
+        key = cache.key("monitors")
+        cache.set(key, {"data": []})
+
+        self.clock.now += 15
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.get_stale(key), {"data": []})
+
+        self.clock.now += 15
+        self.assertIsNone(cache.get(key))
+        self.assertIsNone(cache.get_stale(key))
+        self.assertEqual(len(cache), 0)
+
+    def test_no_stale_entries_by_default(self):
+        """Test that expired entries are not served without stale_ttl."""
+        cache = ResponseCache(ttl=10)
+        key = cache.key("monitors")
+        cache.set(key, {"data": []}, etag='"v1"')
+
+        self.clock.now += 10
+        self.assertIsNone(cache.get_stale(key))
+
+    def test_expire_on_demand(self):
+        """Test that expire marks matching entries as expired, keeping validators."""
+        cache = ResponseCache(ttl=60, stale_ttl=60)
+        monitors, monitor, heartbeats = (
+            cache.key(url) for url in ("monitors", "monitors/1", "heartbeats")
+        )
+        cache.set(monitors, {}, etag='"v1"')
+        cache.set(monitor, {})
+        cache.set(heartbeats, {})
+
+        self.assertEqual(cache.expire("monitors"), 2)
+
+        self.assertIsNone(cache.get(monitors))
+        self.assertIsNone(cache.get_stale(monitors))
+        self.assertEqual(cache.validators(monitors), {"If-None-Match": '"v1"'})
+        self.assertIsNone(cache.get(monitor))
+        self.assertEqual(cache.get(heartbeats), {})
+
+    def test_expire_all(self):
+        """Test that expire without a path expires every entry."""
+        cache = ResponseCache()
+        for url in ("monitors", "heartbeats"):
+            cache.set(cache.key(url), {})
+
+        self.assertEqual(cache.expire(), 2)
+        self.assertIsNone(cache.get(cache.key("heartbeats")))
+
+
+class TestSQLiteCache(unittest.TestCase):
+    """Tests for the SQLite backed cache."""
+
+    def setUp(self):
+        """Create a temporary database path and patch the clock."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.db")
+
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.cache.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def open_cache(self, **kwargs):
+        """Open a cache on the temporary database, closed after the test."""
+        cache = SQLiteCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_entries_survive_reopening(self):
+        """Test that a new cache on the same file serves earlier responses."""
+        key = ResponseCache.key("monitors", {"page": 1})
+        self.open_cache().set(key, {"data": [{"id": "1"}]}, etag='"v1"')
+
+        cache = self.open_cache()
+
+        self.assertEqual(cache.get(key), {"data": [{"id": "1"}]})
+        self.assertEqual(cache.validators(key), {"If-None-Match": '"v1"'})
+
+    def test_expiry_and_revalidation(self):
+        """Test that expired entries are revalidated like in memory."""
+        cache = self.open_cache(ttl=10)
+        key = cache.key("monitors")
+        cache.set(key, {"data": []}, last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+        self.clock.now += 10
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.revalidate(key), {"data": []})
+        self.assertEqual(cache.get(key), {"data": []})
+
+    def test_negative_entries(self):
+        """Test that 404 responses are persisted when negative caching is enabled."""
+        cache = self.open_cache(negative_ttl=10)
+        key = cache.key("monitors/404")
+        cache.set_not_found(key)
+
+        with self.assertRaises(NotFoundError):
+            self.open_cache(negative_ttl=10).get(key)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = self.open_cache(max_entries=2)
+        first, second, third = (cache.key(f"monitors/{i}") for i in range(3))
+        cache.set(first, 1)
+        self.clock.now += 1
+        cache.set(second, 2)
+        self.clock.now += 1
+        cache.get(first)
+        self.clock.now += 1
+
+        cache.set(third, 3)
+
+        self.assertEqual(cache.get(first), 1)
+        self.assertIsNone(cache.get(second))
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def used_at(self, key):
+        """Read the recency of an entry as stored in the database."""
+        with sqlite3.connect(self.path) as connection:
+            return connection.execute(
+                "SELECT used_at FROM responses WHERE path = ? AND query = ?", key
+            ).fetchone()[0]
+
+    def test_reads_write_recency_in_batches(self):
+        """Test that cache hits don't write to the database on every read."""
+        cache = self.open_cache()
+        key = cache.key("monitors")
+        cache.set(key, {})
+        stored = self.used_at(key)
+
+        self.clock.now += 1
+        cache.get(key)
+        self.assertEqual(self.used_at(key), stored)
+
+        self.clock.now += TOUCH_FLUSH_INTERVAL
+        cache.get(key)
+        self.assertEqual(self.used_at(key), self.clock.now)
+
+    def test_eviction_without_counting(self):
+        """Test that inserts only evict when over the limit, without counting rows."""
+        cache = self.open_cache(max_entries=2)
+        with mock.patch.object(cache, "_size", wraps=cache._size) as size:
+            for i in range(4):
+                self.clock.now += 1
+                cache.set(cache.key(f"monitors/{i}"), i)
+            cache.set(cache.key("monitors/3"), 3)
+
+        size.assert_not_called()
+        self.assertEqual(cache.stats().evictions, 2)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(cache.key("monitors/2")), 2)
+
+    def test_expire(self):
+        """Test that expire marks matching rows as expired."""
+        cache = self.open_cache(ttl=60)
+        for url in ("monitors", "monitors/1", "monitors-sla", "heartbeats"):
+            cache.set(cache.key(url), {})
+
+        self.assertEqual(cache.expire("monitors"), 2)
+        self.assertEqual(cache.expire("monitors"), 0)
+
+        self.assertIsNone(cache.get(cache.key("monitors/1")))
+        self.assertEqual(cache.get(cache.key("monitors-sla")), {})
+        self.assertEqual(cache.expire(), 2)
+
+    def test_invalidate_and_clear(self):
+        """Test that invalidation and clearing delete rows."""
+        cache = self.open_cache()
+        for url in ("monitors", "monitors/1", "heartbeats"):
+            cache.set(cache.key(url), {})
+
+        self.assertEqual(cache.invalidate("monitors/1"), 2)
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestRESTAPICache(unittest.TestCase):
+    """Tests for the response cache integration in RESTAPI."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cache = ResponseCache(negative_ttl=30)
+        self.api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), cache=self.cache)
+
+    @responses.activate
+    def test_get_served_from_cache(self):
+        """Test that a repeated GET does not hit the network."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+
+        self.assertEqual(self.api.get("monitors"), {"data": []})
+        self.assertEqual(self.api.get("monitors"), {"data": []})
+
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_cleaned_parameters_share_key(self):
+        """Test that parameters differing only by a trailing underscore share an entry."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+
+        self.api.get("monitors", parameters={"from_": "2024-01-01"})
+        self.api.get("monitors", parameters={"from": "2024-01-01"})
+
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_write_invalidates(self):
+        """Test that a PATCH to a resource drops the cached resource and collection."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", json={"data": {}}, status=200)
+        responses.add(responses.PATCH, f"{TEST_BASE_URL}monitors/1", json={"data": {}}, status=200)
+
+        self.api.get("monitors")
+        self.api.get("monitors/1")
+        self.api.patch("monitors/1", body={"paused": True})
+        self.api.get("monitors")
+        self.api.get("monitors/1")
+
+        self.assertEqual(len(responses.calls), 5)
+
+    @responses.activate
+    def test_failed_write_invalidates(self):
+        """Test that a failed write still drops the cached resource."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", json={"data": {}}, status=200)
+        responses.add(responses.DELETE, f"{TEST_BASE_URL}monitors/1", status=403)
+
+        self.api.get("monitors/1")
+        with self.assertRaises(ForbiddenError):
+            self.api.delete("monitors/1")
+
+        self.assertEqual(len(self.cache), 0)
+
+    @responses.activate
+    def test_not_found_cached(self):
+        """Test that a 404 is remembered when negative caching is enabled."""
+        responses.add(
+            responses.GET, f"{TEST_BASE_URL}monitors/404", json={"errors": "Not found"}, status=404
+        )
+
+        for _ in range(2):
+            with self.assertRaises(NotFoundError):
+                self.api.get("monitors/404")
+
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_errors_not_cached(self):
+        """Test that other error responses are not stored."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", status=403)
+
+        for _ in range(2):
+            with self.assertRaises(ForbiddenError):
+                self.api.get("monitors")
+
+        self.assertEqual(len(responses.calls), 2)
+
+
+class TestRESTAPIConditionalRequests(unittest.TestCase):
+    """Tests for conditional GET requests."""
+
+    def setUp(self):
+        """Set up a client whose cache revalidates on every read."""
+        self.cache = ResponseCache(ttl=0)
+        self.api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), cache=self.cache)
+
+    @responses.activate
+    def test_not_modified_reuses_body(self):
+        """Test that a 304 answer returns the cached body."""
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            json={"data": [{"id": "1"}]},
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+
+        self.api.get("monitors")
+        self.assertEqual(self.api.get("monitors"), {"data": [{"id": "1"}]})
+
+        self.assertNotIn("If-None-Match", responses.calls[0].request.headers)
+        self.assertEqual(responses.calls[1].request.headers["If-None-Match"], '"v1"')
+        self.assertEqual(self.cache.stats().revalidations, 1)
+
+    @responses.activate
+    def test_if_modified_since(self):
+        """Test that Last-Modified is sent back as If-Modified-Since."""
+        last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            json={"data": []},
+            headers={"Last-Modified": last_modified},
+            status=200,
+        )
+
+        self.api.get("monitors")
+        self.api.get("monitors")
+
+        self.assertEqual(responses.calls[1].request.headers["If-Modified-Since"], last_modified)
+
+    @responses.activate
+    def test_modified_response_replaces_entry(self):
+        """Test that a full response to a conditional request updates the cache."""
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            json={"data": []},
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            json={"data": [{"id": "2"}]},
+            headers={"ETag": '"v2"'},
+            status=200,
+        )
+
+        self.api.get("monitors")
+        self.assertEqual(self.api.get("monitors"), {"data": [{"id": "2"}]})
+        self.assertEqual(
+            self.cache.validators(self.cache.key("monitors")), {"If-None-Match": '"v2"'}
+        )
+
+    @responses.activate
+    def test_no_validators_sends_plain_requests(self):
+        """Test that responses without validators are fetched in full every time."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+
+        self.api.get("monitors")
+        self.api.get("monitors")
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertNotIn("If-None-Match", responses.calls[1].request.headers)
+        self.assertNotIn("If-Modified-Since", responses.calls[1].request.headers)
+
+    @responses.activate
+    def test_evicted_during_revalidation_refetches(self):
+        """Test that a 304 for an entry dropped meanwhile falls back to a full request."""
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            json={"data": []},
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", status=304)
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+        self.api.get("monitors")
+
+        with mock.patch.object(self.cache, "revalidate", return_value=None):
+            self.assertEqual(self.api.get("monitors"), {"data": []})
+
+        self.assertEqual(len(responses.calls), 3)
+        self.assertNotIn("If-None-Match", responses.calls[2].request.headers)
+
+
+class TestRESTAPIStaleWhileRevalidate(unittest.TestCase):
+    """Tests for background revalidation of stale responses."""
+
+    def wait_for_revalidation(self, api):
+        """Wait until no background revalidation is running."""
+        deadline = time.monotonic() + 5
+        while api._revalidating and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    @responses.activate
+    def test_stale_served_then_refreshed(self):
+        """Test that a stale response is returned at once and refreshed behind it."""
+        cache = ResponseCache(ttl=0.05, stale_ttl=3600)
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), cache=cache)
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": [1]}, status=200)
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": [2]}, status=200)
+
+        api.get("monitors")
+        time.sleep(0.1)
+
+        self.assertEqual(api.get("monitors"), {"data": [1]})
+        self.wait_for_revalidation(api)
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(api.get("monitors"), {"data": [2]})
+
+    @responses.activate
+    def test_failed_refresh_keeps_stale_entry(self):
+        """Test that a failing background refresh keeps serving the stale response."""
+        cache = ResponseCache(ttl=0, stale_ttl=3600)
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), cache=cache)
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            json={"data": [1]},
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", status=403)
+
+        api.get("monitors")
+        self.assertEqual(api.get("monitors"), {"data": [1]})
+        self.wait_for_revalidation(api)
+
+        self.assertEqual(cache.get_stale(cache.key("monitors")), {"data": [1]})
+
+    @responses.activate
+    def test_warm_start_from_sqlite(self):
+        """Test that a new client serves a listing from a persisted cache."""
+        add_paged_callback(3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.db")
+            for _ in range(2):
+                cache = SQLiteCache(path, ttl=60)
+                api = PaginatedAPI(
+                    base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), cache=cache
+                )
+                items = list(api.get("test_json"))
+                cache.close()
+
+        self.assertEqual(len(items), 3)
+        self.assertEqual(len(responses.calls), 3)
+
+
+class TestPaginatedAPICache(unittest.TestCase):
+    """Tests for caching paginated listings."""
+
+    @responses.activate
+    def test_pages_cached_individually(self):
+        """Test that a repeated listing is served entirely from the cache."""
+        add_paged_callback(3)
+        cache = ResponseCache()
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), cache=cache)
+
+        first = list(api.get("test_json"))
+        second = list(api.get("test_json"))
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(cache.stats().entries, 3)
@@ -0,0 +1,238 @@
+"""Tests for the circuit breaker and the retry budget."""
+
+import unittest
+from unittest import mock
+
+import requests
+import responses
+from urllib3.exceptions import MaxRetryError
+
+from betterstack.uptime import RESTAPI, BearerAuth, CircuitBreaker, RetryBudget, UptimeAPI
+from betterstack.uptime.adapters import ClientRetry
+from betterstack.uptime.exceptions import NotFoundError, RateLimitError, ServerError
+from tests.fixtures import TEST_BASE_URL, FakeClock
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for the state machine of CircuitBreaker."""
+
+    def setUp(self):
+        """Patch the time functions used by the breaker."""
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.circuit.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+
+    def fail(self, url, times=1):
+        """Record failed requests to an endpoint."""
+        for _ in range(times):
+            self.breaker.before_request(url)
+            self.breaker.record_failure(url)
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the threshold and rejects requests."""
+        self.fail("monitors/1", times=2)
+        self.assertEqual(self.breaker.state("monitors/{id}"), "closed")
+
+        self.fail("monitors/2")
+
+        self.assertEqual(self.breaker.state("monitors/3"), "open")
+        with self.assertRaises(ServerError) as ctx:
+            self.breaker.before_request("monitors/4")
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual((self.breaker.opened, self.breaker.rejected), (1, 1))
+        # Other endpoints are unaffected
+        self.breaker.before_request("monitors")
+
+    def test_success_resets_failures(self):
+        """Test that only consecutive failures count."""
+        self.fail("monitors", times=2)
+        self.breaker.record_success("monitors")
+        self.fail("monitors", times=2)
+
+        self.assertEqual(self.breaker.state("monitors"), "closed")
+
+    def test_half_open_trial(self):
+        """Test that one trial is let through after the recovery timeout."""
+        self.fail("monitors", times=3)
+        self.clock.now += 30
+
+        self.assertEqual(self.breaker.state("monitors"), "half_open")
+        self.breaker.before_request("monitors")
+        with self.assertRaises(ServerError):
+            self.breaker.before_request("monitors")
+
+        self.breaker.record_success("monitors")
+        self.assertEqual(self.breaker.state("monitors"), "closed")
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed trial opens the circuit for another timeout."""
+        self.fail("monitors", times=3)
+        self.clock.now += 30
+
+        self.fail("monitors")
+
+        self.assertEqual(self.breaker.state("monitors"), "open")
+        self.assertEqual(self.breaker.opened, 2)
+        self.clock.now += 29
+        with self.assertRaises(ServerError):
+            self.breaker.before_request("monitors")
+
+    def test_lost_trial_is_replaced(self):
+        """Test that a trial that never reports back doesn't block the circuit."""
+        self.fail("monitors", times=3)
+        self.clock.now += 30
+        self.breaker.before_request("monitors")
+
+        self.clock.now += 30
+
+        self.breaker.before_request("monitors")
+
+    def test_invalid_configuration(self):
+        """Test that invalid settings are rejected."""
+        with self.assertRaises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(recovery_timeout=-1)
+
+
+class TestRetryBudget(unittest.TestCase):
+    """Tests for RetryBudget."""
+
+    def setUp(self):
+        """Patch the time functions used by the budget."""
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.circuit.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_min_retries(self):
+        """Test that a quiet client may retry up to min_retries per window."""
+        budget = RetryBudget(ratio=0.1, min_retries=2, window=10)
+
+        self.assertEqual([budget.try_retry() for _ in range(3)], [True, True, False])
+        self.assertEqual((budget.retries, budget.denied), (2, 1))
+
+        self.clock.now += 11
+        self.assertTrue(budget.try_retry())
+
+    def test_ratio_of_successes(self):
+        """Test that successful requests add to the budget."""
+        budget = RetryBudget(ratio=0.5, min_retries=0, window=10)
+        for _ in range(4):
+            budget.record_success()
+
+        self.assertEqual([budget.try_retry() for _ in range(3)], [True, True, False])
+
+    def test_invalid_configuration(self):
+        """Test that invalid settings are rejected."""
+        with self.assertRaises(ValueError):
+            RetryBudget(ratio=2)
+        with self.assertRaises(ValueError):
+            RetryBudget(min_retries=-1)
+        with self.assertRaises(ValueError):
+            RetryBudget(window=0)
+
+
+class TestClientRetryBudget(unittest.TestCase):
+    """Tests for the retry budget of ClientRetry."""
+
+    def test_budget_is_kept_by_copies(self):
+        """Test that the budget survives the copies urllib3 makes per attempt."""
+        budget = RetryBudget()
+        retry = ClientRetry(total=3, budget=budget)
+
+        self.assertIs(retry.increment(method="GET", url="/").budget, budget)
+
+    def test_spent_budget_stops_retries(self):
+        """Test that a retry is refused when the budget is spent."""
+        budget = RetryBudget(min_retries=1, ratio=0)
+        retry = ClientRetry(total=3, budget=budget).increment(method="GET", url="/")
+
+        with self.assertRaises(MaxRetryError):
+            retry.increment(method="GET", url="/")
+        self.assertEqual(budget.denied, 1)
+
+
+class TestRESTAPICircuitBreaker(unittest.TestCase):
+    """Tests for the circuit breaker and retry budget in RESTAPI."""
+
+    def setUp(self):
+        """Set up a client without transport retries."""
+        self.breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        self.api = RESTAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            retries=0,
+            circuit_breaker=self.breaker,
+        )
+
+    @responses.activate
+    def test_server_errors_open_circuit(self):
+        """Test that requests fail fast once an endpoint keeps failing."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", status=503, json={})
+
+        for _ in range(2):
+            with self.assertRaises(ServerError):
+                self.api.get("monitors/1")
+
+        with self.assertRaisesRegex(ServerError, "Circuit breaker open for monitors/{id}"):
+            self.api.get("monitors/2")
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_connection_errors_count_as_failures(self):
+        """Test that transport errors count towards opening the circuit."""
+        responses.add(
+            responses.GET, f"{TEST_BASE_URL}monitors", body=requests.ConnectionError("refused")
+        )
+
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                self.api.get("monitors")
+
+        self.assertEqual(self.breaker.state("monitors"), "open")
+
+    @responses.activate
+    def test_client_errors_close_circuit(self):
+        """Test that answered requests, even 4xx, count as successes."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", status=503, json={})
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", status=404, json={})
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", status=503, json={})
+
+        for error in (ServerError, NotFoundError, ServerError):
+            with self.assertRaises(error):
+                self.api.get("monitors/1")
+
+        self.assertEqual(self.breaker.state("monitors/1"), "closed")
+
+    @responses.activate
+    def test_rate_limit_retries_use_budget(self):
+        """Test that 429 retries are refused when the retry budget is spent."""
+        responses.add(
+            responses.GET, f"{TEST_BASE_URL}monitors", status=429, headers={"Retry-After": "0"}
+        )
+        budget = RetryBudget(ratio=0, min_retries=1)
+        api = RESTAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            rate_limit_retries=5,
+            retry_budget=budget,
+        )
+
+        with self.assertRaises(RateLimitError):
+            api.get("monitors")
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual((budget.retries, budget.denied), (1, 1))
+
+    def test_disabled_by_default(self):
+        """Test that no breaker or budget is used unless requested."""
+        api = UptimeAPI("token")
+        self.assertIsNone(api.circuit_breaker)
+        self.assertIsNone(api.retry_budget)
+
+        api = UptimeAPI("token", circuit_breaker=True, retry_budget=True)
+        self.assertIsInstance(api.circuit_breaker, CircuitBreaker)
+        self.assertIs(api.adapter.max_retries.budget, api.retry_budget)
@@ -0,0 +1,171 @@
+"""Tests for the JSON codecs."""
+
+import json
+import unittest
+from unittest import mock
+
+import responses
+
+from betterstack.uptime import RESTAPI, BearerAuth, JSONCodec
+from betterstack.uptime import codec as codec_module
+from betterstack.uptime.codec import MsgspecCodec, OrjsonCodec, StdlibCodec, get_codec
+from betterstack.uptime.exceptions import ConfigurationError, ForbiddenError
+from tests.fixtures import TEST_BASE_URL
+
+DOCUMENT = {"data": [{"id": "1", "attributes": {"url": "https://example.com", "paused": False}}]}
+
+
+class RecordingCodec(StdlibCodec):
+    """Standard library codec recording what it encoded and decoded."""
+
+    name = "recording"
+
+    def __init__(self):
+        """Initialize the records."""
+        self.dumped = []
+        self.loaded = []
+
+    def dumps(self, value):
+        """Record and encode a value."""
+        self.dumped.append(value)
+        return super().dumps(value)
+
+    def loads(self, data):
+        """Record and decode a document."""
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+class TestCodecs(unittest.TestCase):
+    """Tests for the codec implementations."""
+
+    def assert_roundtrip(self, codec):
+        """Assert that a codec encodes to bytes and decodes its own output."""
+        encoded = codec.dumps(DOCUMENT)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded), DOCUMENT)
+        self.assertEqual(codec.loads(encoded), DOCUMENT)
+        self.assertEqual(codec.loads(encoded.decode()), DOCUMENT)
+        with self.assertRaises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_stdlib(self):
+        """Test the standard library codec."""
+        self.assert_roundtrip(StdlibCodec())
+
+    @unittest.skipIf(codec_module.orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        """Test the orjson codec."""
+        self.assert_roundtrip(OrjsonCodec())
+
+    @unittest.skipIf(codec_module.msgspec is None, "msgspec is not installed")
+    def test_msgspec(self):
+        """Test the msgspec codec."""
+        self.assert_roundtrip(MsgspecCodec())
+
+    def test_base_class_requires_implementation(self):
+        """Test that the base class cannot be used directly."""
+        with self.assertRaises(NotImplementedError):
+            JSONCodec().dumps({})
+        with self.assertRaises(NotImplementedError):
+            JSONCodec().loads(b"{}")
+
+
+class TestGetCodec(unittest.TestCase):
+    """Tests for resolving codecs by name."""
+
+    def test_by_name(self):
+        """Test that codecs are resolved by their name."""
+        self.assertIsInstance(get_codec("stdlib"), StdlibCodec)
+        self.assertIsInstance(get_codec(), StdlibCodec)
+
+    def test_instance_passed_through(self):
+        """Test that a codec instance is used as is."""
+        codec = RecordingCodec()
+
+        self.assertIs(get_codec(codec), codec)
+
+    def test_unknown_name(self):
+        """Test that an unknown name is a configuration error."""
+        with self.assertRaises(ConfigurationError):
+            get_codec("yaml")
+
+    @mock.patch.object(codec_module, "orjson", None)
+    @mock.patch.object(codec_module, "msgspec", None)
+    def test_auto_falls_back_to_stdlib(self):
+        """Test that auto picks the standard library without optional packages."""
+        self.assertIsInstance(get_codec("auto"), StdlibCodec)
+
+    @mock.patch.object(codec_module, "orjson", None)
+    def test_missing_package(self):
+        """Test that requesting a codec without its package is a configuration error."""
+        with self.assertRaises(ConfigurationError):
+            get_codec("orjson")
+
+    @unittest.skipIf(codec_module.orjson is None, "orjson is not installed")
+    def test_auto_prefers_orjson(self):
+        """Test that auto picks orjson when it is installed."""
+        self.assertIsInstance(get_codec("auto"), OrjsonCodec)
+
+
+class TestRESTAPICodec(unittest.TestCase):
+    """Tests for the codec integration in RESTAPI."""
+
+    def setUp(self):
+        """Set up a client with a recording codec."""
+        self.codec = RecordingCodec()
+        self.api = RESTAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), json_codec=self.codec
+        )
+
+    @responses.activate
+    def test_get_decodes_with_codec(self):
+        """Test that GET responses are decoded by the codec."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json=DOCUMENT, status=200)
+
+        self.assertEqual(self.api.get("monitors"), DOCUMENT)
+        self.assertEqual(len(self.codec.loaded), 1)
+
+    @responses.activate
+    def test_write_body_encoded_with_codec(self):
+        """Test that request bodies are encoded by the codec and sent as JSON."""
+        responses.add(
+            responses.POST,
+            f"{TEST_BASE_URL}monitors",
+            json=DOCUMENT,
+            status=201,
+            match=[responses.matchers.json_params_matcher({"url": "https://example.com"})],
+        )
+
+        self.api.post("monitors", body={"url": "https://example.com"})
+
+        self.assertEqual(self.codec.dumped, [{"url": "https://example.com"}])
+        self.assertEqual(responses.calls[0].request.headers["Content-Type"], "application/json")
+
+    @responses.activate
+    def test_no_body_not_encoded(self):
+        """Test that requests without a body send none."""
+        responses.add(responses.DELETE, f"{TEST_BASE_URL}monitors/1", status=204)
+
+        self.api.delete("monitors/1")
+
+        self.assertEqual(self.codec.dumped, [])
+        self.assertIsNone(responses.calls[0].request.body)
+
+    @responses.activate
+    def test_error_body_decoded_with_codec(self):
+        """Test that error bodies are decoded by the codec."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"error": "Nope"}, status=403)
+
+        with self.assertRaises(ForbiddenError) as context:
+            self.api.get("monitors")
+
+        self.assertIn("Nope", str(context.exception))
+        self.assertEqual(len(self.codec.loaded), 1)
+
+    def test_default_codec(self):
+        """Test that the standard library codec is used by default."""
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+
+        self.assertIsInstance(api.codec, StdlibCodec)
@@ -0,0 +1,642 @@
+"""Tests for the adaptive concurrency controller."""
+
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+import responses
+
+from betterstack.uptime import RESTAPI, AdaptiveConcurrency, BearerAuth, PaginatedAPI
+from betterstack.uptime.concurrency import HedgingPolicy, SingleFlight
+from betterstack.uptime.deadline import Deadline, deadline_scope
+from betterstack.uptime.exceptions import DeadlineExceededError, RateLimitError, ServerError
+from tests.fixtures import TEST_BASE_URL, FakeClock, wait_until
+from tests.test_paginatedapi import add_paged_callback
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    """Tests for AIMD decisions of AdaptiveConcurrency."""
+
+    def setUp(self):
+        """Patch the time functions used by the controller."""
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.concurrency.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_request(self, controller, latency=0.1, error=None):
+        """Run one request of the given latency through a slot."""
+        with controller.slot():
+            self.clock.now += latency
+            if error is not None:
+                raise error
+
+    def test_grows_on_stable_latency(self):
+        """Test that a full window of stable requests adds one to the limit."""
+        controller = AdaptiveConcurrency(initial_limit=2, max_limit=4)
+
+        for _ in range(2):
+            self.run_request(controller)
+        self.assertEqual(controller.limit, 3)
+
+        for _ in range(3):
+            self.run_request(controller)
+        self.assertEqual(controller.limit, 4)
+
+        for _ in range(10):
+            self.run_request(controller)
+        self.assertEqual(controller.limit, 4)
+
+    def test_halves_on_rate_limit(self):
+        """Test that a 429 halves the limit and is re-raised."""
+        controller = AdaptiveConcurrency(initial_limit=8)
+
+        with self.assertRaises(RateLimitError):
+            self.run_request(controller, error=RateLimitError())
+
+        self.assertEqual(controller.limit, 4)
+        self.assertEqual(controller.decisions[-1].reason, "rate limited")
+
+    def test_halves_on_server_error(self):
+        """Test that a 5xx halves the limit."""
+        controller = AdaptiveConcurrency(initial_limit=8)
+
+        with self.assertRaises(ServerError):
+            self.run_request(controller, error=ServerError(status_code=503))
+
+        self.assertEqual(controller.limit, 4)
+        self.assertEqual(controller.decisions[-1].reason, "server error")
+
+    def test_halves_on_latency_spike(self):
+        """Test that a request much slower than the baseline halves the limit."""
+        controller = AdaptiveConcurrency(initial_limit=8, max_limit=8)
+
+        self.run_request(controller, latency=0.1)
+        self.run_request(controller, latency=0.5)
+
+        self.assertEqual(controller.limit, 4)
+        self.assertEqual(controller.decisions[-1].reason, "latency spike")
+
+    def test_throttled_retry_halves_limit(self):
+        """Test that a 429 that was retried inside the slot still halves the limit."""
+        controller = AdaptiveConcurrency(initial_limit=8)
+
+        with controller.slot():
+            controller.throttled()
+
+        self.assertEqual(controller.limit, 4)
+
+    def test_throttle_reported_from_bound_thread(self):
+        """Test that a 429 retried on another thread counts for the slot that bound it."""
+        controller = AdaptiveConcurrency(initial_limit=8)
+
+        with controller.slot():
+            thread = threading.Thread(target=controller.bind(controller.throttled))
+            thread.start()
+            thread.join()
+
+        self.assertEqual(controller.limit, 4)
+        self.assertEqual(controller.decisions[-1].reason, "rate limited")
+
+    def test_slot_wait_ends_at_deadline(self):
+        """Test that waiting for a slot ends at the current deadline."""
+        controller = AdaptiveConcurrency(initial_limit=1)
+        self.clock.now = time.monotonic()
+
+        with controller.slot(), deadline_scope(Deadline(0.05)):
+            with self.assertRaises(DeadlineExceededError), controller.slot():
+                pass
+
+        self.assertEqual(controller.in_flight, 0)
+
+    def test_one_decrease_per_window(self):
+        """Test that failures of requests started before a decrease are ignored."""
+        controller = AdaptiveConcurrency(initial_limit=8)
+        errors = []
+
+        def fail():
+            try:
+                with controller.slot():
+                    barrier.wait()
+                    raise ServerError()
+            except ServerError as error:
+                errors.append(error)
+
+        barrier = threading.Barrier(4)
+        threads = [threading.Thread(target=fail) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(controller.limit, 4)
+        self.assertEqual(len(controller.decisions), 1)
+
+    def test_never_below_min_limit(self):
+        """Test that repeated failures stop at min_limit."""
+        controller = AdaptiveConcurrency(initial_limit=4, min_limit=2)
+
+        for _ in range(5):
+            with self.assertRaises(ServerError):
+                self.run_request(controller, error=ServerError())
+
+        self.assertEqual(controller.limit, 2)
+
+    def test_decision_records_change(self):
+        """Test that decisions record the limit before and after a change."""
+        controller = AdaptiveConcurrency(initial_limit=1)
+
+        self.run_request(controller)
+
+        decision = controller.decisions[0]
+        self.assertEqual((decision.previous_limit, decision.limit), (1, 2))
+        self.assertEqual(decision.reason, "latency stable")
+        self.assertEqual(decision.timestamp, self.clock.now)
+
+    def test_invalid_configuration(self):
+        """Test that inconsistent limits are rejected."""
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(min_limit=0)
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(min_limit=4, max_limit=2, initial_limit=3)
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(initial_limit=20, max_limit=16)
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(latency_tolerance=1)
+
+
+class TestAdaptiveConcurrencyLimit(unittest.TestCase):
+    """Tests for enforcement of the in-flight limit."""
+
+    def test_slot_blocks_at_limit(self):
+        """Test that no more than limit requests run at once."""
+        controller = AdaptiveConcurrency(initial_limit=2, max_limit=2)
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def request():
+            with controller.slot():
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(controller.in_flight, 0)
+
+
+class TestPaginatedAPIAdaptiveConcurrency(unittest.TestCase):
+    """Tests for adaptive concurrency in PaginatedAPI."""
+
+    def test_disabled_by_default(self):
+        """Test that no controller is created unless requested."""
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+
+        self.assertIsNone(api.concurrency)
+
+    def test_true_creates_controller_up_to_max_workers(self):
+        """Test that adaptive_concurrency=True grows up to max_workers."""
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            max_workers=12,
+            adaptive_concurrency=True,
+        )
+
+        self.assertEqual(api.concurrency.max_limit, 12)
+        self.assertEqual(api.concurrency.limit, 2)
+
+    @responses.activate
+    def test_pages_run_through_controller(self):
+        """Test that page fetches are counted by the controller."""
+        add_paged_callback(10)
+        controller = AdaptiveConcurrency(initial_limit=1, max_limit=4, latency_tolerance=1000)
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            max_workers=4,
+            adaptive_concurrency=controller,
+        )
+
+        items = list(api.get("test_json"))
+
+        self.assertEqual([item["id"] for item in items], [f"{page}-0" for page in range(1, 11)])
+        self.assertGreater(controller.limit, 1)
+
+    @responses.activate
+    @mock.patch("betterstack.uptime.api.time.sleep")
+    def test_retried_rate_limit_decreases(self, _sleep):
+        """Test that a 429 retried by the client decreases the limit."""
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}test_json",
+            status=429,
+            json={"error": "Too many requests"},
+            match=[responses.matchers.query_param_matcher({"page": "2"})],
+        )
+        add_paged_callback(2)
+        controller = AdaptiveConcurrency(initial_limit=4, max_limit=4)
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            rate_limit_retries=1,
+            adaptive_concurrency=controller,
+        )
+
+        items = list(api.get("test_json"))
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual(controller.limit, 2)
+        self.assertEqual(controller.decisions[-1].reason, "rate limited")
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Tests for SingleFlight call de-duplication."""
+
+    def run_concurrently(self, group, key, call, count):
+        """Call group.do from count threads, releasing the call once all wait."""
+        results = []
+        errors = []
+
+        def target():
+            try:
+                results.append(group.do(key, call))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        wait_until(lambda: group.shared == count - 1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def setUp(self):
+        """Set up the event holding the shared call."""
+        self.release = threading.Event()
+        self.calls = 0
+
+    def slow_call(self):
+        """Count the call and block until released."""
+        self.calls += 1
+        self.release.wait(5)
+        return {"data": [1]}
+
+    def test_concurrent_calls_share_result(self):
+        """Test that concurrent calls with one key run the call once."""
+        group = SingleFlight()
+
+        results, errors = self.run_concurrently(group, "key", self.slow_call, 4)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{"data": [1]}] * 4)
+        self.assertEqual(group.shared, 3)
+
+    def test_shared_results_are_copies(self):
+        """Test that every caller of a shared call gets its own copy."""
+        group = SingleFlight()
+
+        results, _ = self.run_concurrently(group, "key", self.slow_call, 3)
+
+        self.assertEqual(len({id(result) for result in results}), 3)
+
+    def test_errors_are_shared(self):
+        """Test that an exception of the shared call is raised in every caller."""
+        group = SingleFlight()
+
+        def failing_call():
+            self.release.wait(5)
+            raise ServerError()
+
+        results, errors = self.run_concurrently(group, "key", failing_call, 3)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(isinstance(error, ServerError) for error in errors))
+
+    def test_sequential_calls_are_not_shared(self):
+        """Test that a finished call's result is not reused."""
+        group = SingleFlight()
+        self.release.set()
+
+        group.do("key", self.slow_call)
+        group.do("key", self.slow_call)
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(group.shared, 0)
+
+
+class TestRESTAPICoalescing(unittest.TestCase):
+    """Tests for coalescing concurrent identical GET requests."""
+
+    def setUp(self):
+        """Set up the event holding requests."""
+        self.release = threading.Event()
+
+    def add_held_callback(self):
+        """Register a callback that holds requests until released."""
+
+        def callback(request):
+            self.release.wait(5)
+            return (200, {}, '{"data": [{"id": "1"}]}')
+
+        responses.add_callback(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            callback=callback,
+            content_type="application/json",
+        )
+
+    def concurrent_gets(self, api, parameters_list):
+        """Start a GET for each set of parameters in its own thread."""
+        threads = [
+            threading.Thread(target=api.get, args=("monitors", None, None, parameters))
+            for parameters in parameters_list
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    @responses.activate
+    def test_identical_gets_share_one_request(self):
+        """Test that concurrent identical GETs send a single request."""
+        self.add_held_callback()
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), coalesce_requests=True)
+
+        threads = self.concurrent_gets(api, [{"page": 1}] * 4)
+        wait_until(lambda: api.single_flight.shared == 3)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_different_parameters_not_shared(self):
+        """Test that GETs with different parameters are sent separately."""
+        self.add_held_callback()
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), coalesce_requests=True)
+        self.release.set()
+
+        threads = self.concurrent_gets(api, [{"page": 1}, {"page": 2}])
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(responses.calls), 2)
+
+    def test_disabled_by_default(self):
+        """Test that requests are not coalesced unless enabled."""
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+
+        self.assertIsNone(api.single_flight)
+
+
+def page_body(page, total_pages=2):
+    """Return page ``page`` of a listing holding one monitor per page."""
+    url = f"{TEST_BASE_URL}monitors"
+    return {
+        "data": [{"id": str(page)}],
+        "pagination": {
+            "first": f"{url}?page=1",
+            "last": f"{url}?page={total_pages}",
+            "prev": None,
+            "next": f"{url}?page={page + 1}" if page < total_pages else None,
+        },
+    }
+
+
+def warm_up(policy, calls=20, latency=0.0):
+    """Feed ``calls`` fast calls through a hedging policy."""
+    for _ in range(calls):
+        policy.call(lambda: time.sleep(latency))
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    """Tests for HedgingPolicy."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.policy = HedgingPolicy(delay=0.05, min_samples=4, max_hedge_ratio=0.5, history=10)
+        self.addCleanup(self.policy.close)
+
+    def test_no_hedging_while_observing(self):
+        """Test that calls are not hedged before min_samples calls were seen."""
+        self.assertIsNone(self.policy.delay)
+        calls = []
+
+        self.assertEqual(self.policy.call(lambda: calls.append(1) or "ok"), "ok")
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.policy.hedged, 0)
+
+    def test_delay_from_percentile(self):
+        """Test that the delay is the configured percentile of observed latencies."""
+        policy = HedgingPolicy(percentile=0.5, min_samples=4, history=10)
+        self.addCleanup(policy.close)
+        for latency in (0.01, 0.02, 0.03, 0.04):
+            policy.call(lambda latency=latency: time.sleep(latency))
+
+        self.assertGreaterEqual(policy.delay, 0.03)
+        self.assertLess(policy.delay, 0.04)
+
+    def test_slow_call_is_hedged(self):
+        """Test that a slow call is raced against a second call that wins."""
+        warm_up(self.policy, calls=4)
+        release = threading.Event()
+        attempts = []
+
+        def call():
+            attempts.append(len(attempts))
+            if attempts[-1] == 0:
+                release.wait(5)
+                return "primary"
+            return "hedge"
+
+        start = time.monotonic()
+        self.assertEqual(self.policy.call(call), "hedge")
+        release.set()
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(self.policy.hedged, 1)
+        self.assertEqual(self.policy.hedge_wins, 1)
+
+    def test_close_waits_for_losing_call(self):
+        """Test that close returns once the losing copy has finished."""
+        warm_up(self.policy, calls=4)
+        attempts = []
+        finished = []
+
+        def call():
+            attempts.append(len(attempts))
+            if attempts[-1] == 0:
+                time.sleep(0.2)
+                finished.append("primary")
+                return "primary"
+            return "hedge"
+
+        self.assertEqual(self.policy.call(call), "hedge")
+        self.assertEqual(finished, [])
+
+        self.policy.close()
+
+        self.assertEqual(finished, ["primary"])
+
+    def test_fast_call_is_not_hedged(self):
+        """Test that calls finishing within the delay are sent once."""
+        warm_up(self.policy, calls=8)
+
+        self.assertEqual(self.policy.hedged, 0)
+
+    def test_failed_call_uses_other_result(self):
+        """Test that a failing copy doesn't hide the result of the other one."""
+        warm_up(self.policy, calls=4)
+        attempts = []
+
+        def call():
+            attempts.append(len(attempts))
+            if attempts[-1] == 0:
+                time.sleep(0.1)
+                raise ServerError("Bad gateway", 502)
+            time.sleep(0.2)
+            return "hedge"
+
+        self.assertEqual(self.policy.call(call), "hedge")
+        self.assertEqual(self.policy.hedge_wins, 1)
+
+    def test_error_when_both_fail(self):
+        """Test that an error is raised when neither copy succeeds."""
+        warm_up(self.policy, calls=4)
+
+        def call():
+            time.sleep(0.1)
+            raise ServerError("Bad gateway", 502)
+
+        with self.assertRaises(ServerError):
+            self.policy.call(call)
+        self.assertEqual(self.policy.hedged, 1)
+
+    def test_hedge_ratio_is_capped(self):
+        """Test that no more than max_hedge_ratio of recent calls are hedged."""
+        policy = HedgingPolicy(delay=0.01, min_samples=10, max_hedge_ratio=0.1, history=10)
+        self.addCleanup(policy.close)
+        warm_up(policy, calls=10)
+        attempts = []
+
+        def slow():
+            attempts.append(1)
+            time.sleep(0.05)
+
+        for _ in range(5):
+            policy.call(slow)
+
+        self.assertEqual(policy.hedged, 1)
+        self.assertEqual(len(attempts), 6)
+
+    def test_invalid_settings(self):
+        """Test that out of range settings are rejected."""
+        for kwargs in (
+            {"delay": -1},
+            {"percentile": 1.0},
+            {"max_hedge_ratio": 2},
+            {"min_samples": 0},
+            {"min_samples": 10, "history": 5},
+        ):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                HedgingPolicy(**kwargs)
+
+
+class TestRESTAPIHedging(unittest.TestCase):
+    """Tests for hedged GET requests in RESTAPI."""
+
+    @responses.activate
+    def test_slow_get_is_hedged(self):
+        """Test that a slow GET is answered by the hedged request."""
+        release = threading.Event()
+        calls = []
+
+        def callback(request):
+            calls.append(request.method)
+            if len(calls) == 5:
+                release.wait(5)
+            return (200, {}, '{"data": {"id": "1"}}')
+
+        responses.add_callback(responses.GET, f"{TEST_BASE_URL}monitors/1", callback=callback)
+        policy = HedgingPolicy(delay=0.05, min_samples=4, max_hedge_ratio=0.5, history=10)
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), hedging=policy)
+
+        for _ in range(4):
+            api.get("monitors/1")
+        start = time.monotonic()
+        self.assertEqual(api.get("monitors/1"), {"data": {"id": "1"}})
+        elapsed = time.monotonic() - start
+        release.set()
+        api.close()
+        policy.close()
+
+        self.assertLess(elapsed, 1)
+        self.assertEqual(policy.hedge_wins, 1)
+        self.assertEqual(len(calls), 6)
+
+    @responses.activate
+    def test_rate_limited_hedge_reduces_concurrency(self):
+        """Test that a 429 retried by the hedged copy of a page counts for the page's slot."""
+        release = threading.Event()
+        page_calls = []
+
+        def callback(request):
+            if "page=2" not in request.url:
+                return (200, {}, json.dumps(page_body(1)))
+            page_calls.append(len(page_calls))
+            if page_calls[-1] == 0:
+                release.wait(5)
+            elif page_calls[-1] == 1:
+                return (429, {"Retry-After": "0"}, "")
+            return (200, {}, json.dumps(page_body(2)))
+
+        responses.add_callback(responses.GET, f"{TEST_BASE_URL}monitors", callback=callback)
+        policy = HedgingPolicy(delay=0.05, min_samples=1, max_hedge_ratio=1.0, history=10)
+        controller = AdaptiveConcurrency(initial_limit=2, max_limit=4)
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            hedging=policy,
+            adaptive_concurrency=controller,
+        )
+
+        items = [item["id"] for item in api.get("monitors")]
+        release.set()
+        policy.close()
+        api.close()
+
+        self.assertEqual(items, ["1", "2"])
+        self.assertEqual(policy.hedge_wins, 1)
+        self.assertEqual(controller.limit, 1)
+        self.assertEqual(controller.decisions[-1].reason, "rate limited")
+
+    @responses.activate
+    def test_writes_are_not_hedged(self):
+        """Test that only GET requests go through the hedging policy."""
+        responses.add(responses.POST, f"{TEST_BASE_URL}monitors", json={"data": {}})
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), hedging=True)
+
+        with mock.patch.object(api.hedging, "call") as call:
+            api.post("monitors", body={"url": "https://example.com"})
+
+        call.assert_not_called()
+        api.close()
@@ -0,0 +1,320 @@
+"""Tests for deadlines bounding API operations."""
+
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+import responses
+
+from betterstack.uptime import (
+    RESTAPI,
+    BearerAuth,
+    Deadline,
+    DeadlineExceededError,
+    Monitor,
+    PaginatedAPI,
+)
+from betterstack.uptime.adapters import ClientRetry
+from betterstack.uptime.deadline import current_deadline, deadline_scope, wait_within_deadline
+from betterstack.uptime.ratelimit import TokenBucket
+from betterstack.uptime.scheduling import BULK, request_priority
+from tests.fixtures import TEST_BASE_URL
+from tests.test_paginatedapi import add_paged_callback
+
+
+class TestDeadline(unittest.TestCase):
+    """Tests for Deadline."""
+
+    def test_remaining_and_expiry(self):
+        """Test that the remaining time runs down to zero."""
+        deadline = Deadline(0.05)
+
+        self.assertGreater(deadline.remaining(), 0)
+        self.assertFalse(deadline.expired)
+        deadline.check()
+
+        time.sleep(0.06)
+        self.assertEqual(deadline.remaining(), 0.0)
+        self.assertTrue(deadline.expired)
+        with self.assertRaisesRegex(DeadlineExceededError, "Deadline of 0.05 seconds"):
+            deadline.check()
+
+    def test_cancel(self):
+        """Test that a cancelled deadline expires, even without a timeout."""
+        deadline = Deadline()
+        self.assertEqual(deadline.remaining(), float("inf"))
+
+        deadline.cancel()
+
+        self.assertTrue(deadline.cancelled)
+        self.assertTrue(deadline.expired)
+        with self.assertRaisesRegex(DeadlineExceededError, "cancelled"):
+            deadline.check()
+
+    def test_clamp(self):
+        """Test that timeouts are shortened to the remaining time."""
+        deadline = Deadline(10)
+
+        self.assertLessEqual(deadline.clamp(30.0), 10)
+        self.assertEqual(deadline.clamp(1.0), 1.0)
+        self.assertEqual(Deadline().clamp(30.0), 30.0)
+
+    def test_negative_timeout(self):
+        """Test that a negative timeout is rejected."""
+        with self.assertRaises(ValueError):
+            Deadline(-1)
+
+    def test_scope(self):
+        """Test that the scope sets and restores the current deadline."""
+        outer, inner = Deadline(), Deadline()
+        self.assertIsNone(current_deadline())
+
+        with deadline_scope(outer):
+            with deadline_scope(inner):
+                self.assertIs(current_deadline(), inner)
+            self.assertIs(current_deadline(), outer)
+
+        self.assertIsNone(current_deadline())
+
+    def test_wait_within_deadline(self):
+        """Test that condition waits end at the current deadline."""
+        condition = threading.Condition()
+
+        with condition, deadline_scope(Deadline(0.05)):
+            started = time.monotonic()
+            wait_within_deadline(condition)
+            self.assertLess(time.monotonic() - started, 1)
+            with self.assertRaises(DeadlineExceededError):
+                wait_within_deadline(condition)
+
+
+class TestClientRetryDeadline(unittest.TestCase):
+    """Tests for the deadline check of ClientRetry."""
+
+    def test_backoff_beyond_deadline(self):
+        """Test that a backoff outlasting the deadline is not slept."""
+        retry = ClientRetry(total=3, backoff_factor=10).increment(method="GET", url="/")
+        retry = retry.increment(method="GET", url="/")
+
+        with deadline_scope(Deadline(1)), self.assertRaises(DeadlineExceededError):
+            retry.sleep()
+
+    def test_backoff_within_deadline(self):
+        """Test that retries within the deadline sleep as usual."""
+        retry = ClientRetry(total=3, backoff_factor=0)
+
+        with deadline_scope(Deadline(1)), mock.patch.object(ClientRetry, "_sleep_backoff") as sleep:
+            retry.sleep()
+
+        sleep.assert_called_once()
+
+
+class TestRESTAPIDeadline(unittest.TestCase):
+    """Tests for deadlines in RESTAPI."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), timeout=30.0)
+
+    @responses.activate
+    def test_timeout_is_clamped(self):
+        """Test that the request timeout is cut to the remaining time."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", json={"data": {}})
+
+        self.api.get("monitors/1", deadline=Deadline(2))
+        self.api.get("monitors/1")
+
+        self.assertLessEqual(responses.calls[0].request.req_kwargs["timeout"], 2)
+        self.assertEqual(responses.calls[1].request.req_kwargs["timeout"], 30.0)
+
+    @responses.activate
+    def test_expired_deadline_sends_nothing(self):
+        """Test that no request is made once the deadline expired."""
+        deadline = Deadline()
+        deadline.cancel()
+
+        with self.assertRaises(DeadlineExceededError):
+            self.api.post("monitors", body={"url": "https://example.com"}, deadline=deadline)
+
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    def test_rate_limit_retry_beyond_deadline(self):
+        """Test that a 429 retry that can't finish in time is not waited for."""
+        responses.add(
+            responses.GET, f"{TEST_BASE_URL}monitors/1", status=429, headers={"Retry-After": "5"}
+        )
+        self.api.rate_limit_retries = 3
+
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            self.api.get("monitors/1", deadline=Deadline(1))
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self.api.throttled_retries, 0)
+
+    @responses.activate
+    def test_rate_limiter_wait_beyond_deadline(self):
+        """Test that a request doesn't wait for a penalized rate limiter past its deadline."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", json={"data": {}})
+        limiter = TokenBucket(rate=10)
+        limiter.penalize(retry_after=5)
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), rate_limiter=limiter)
+
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            api.get("monitors/1", deadline=Deadline(0.5))
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(len(responses.calls), 0)
+
+    @responses.activate
+    def test_in_flight_wait_ends_at_deadline(self):
+        """Test that waiting for an in-flight slot ends at the deadline."""
+        started, release = threading.Event(), threading.Event()
+
+        def callback(request):
+            started.set()
+            release.wait(5)
+            return (200, {}, '{"data": {}}')
+
+        responses.add_callback(responses.GET, f"{TEST_BASE_URL}monitors/1", callback=callback)
+        for kwargs in ({}, {"priorities": True}):
+            with self.subTest(**kwargs):
+                started.clear()
+                release.clear()
+                api = RESTAPI(
+                    base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), max_in_flight=1, **kwargs
+                )
+
+                def get(api=api):
+                    with request_priority(BULK):
+                        api.get("monitors/1")
+
+                busy = threading.Thread(target=get)
+                busy.start()
+                self.addCleanup(busy.join)
+                self.assertTrue(started.wait(5))
+
+                begin = time.monotonic()
+                with request_priority(BULK), self.assertRaises(DeadlineExceededError):
+                    api.get("monitors/1", deadline=Deadline(0.2))
+                elapsed = time.monotonic() - begin
+                release.set()
+                busy.join()
+
+                self.assertGreaterEqual(elapsed, 0.15)
+                self.assertLess(elapsed, 2)
+
+    def test_timeout_after_expiry_is_reported_as_deadline(self):
+        """Test that a timeout caused by the deadline raises DeadlineExceededError."""
+        deadline = Deadline(0.01)
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.02)
+            raise requests.Timeout
+
+        with (
+            mock.patch.object(self.api.session, "request", side_effect=slow_request),
+            self.assertRaises(DeadlineExceededError),
+        ):
+            self.api.get("monitors/1", deadline=deadline)
+
+    def test_timeout_within_deadline_is_kept(self):
+        """Test that transport errors before the deadline are raised unchanged."""
+        with (
+            mock.patch.object(self.api.session, "request", side_effect=requests.Timeout),
+            self.assertRaises(requests.Timeout),
+        ):
+            self.api.get("monitors/1", deadline=Deadline(10))
+
+
+class TestPaginatedAPIDeadline(unittest.TestCase):
+    """Tests for deadlines spanning paginated listings."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+        self.release = threading.Event()
+
+    def tearDown(self):
+        """Let blocked page requests finish and shut down the executor."""
+        self.release.set()
+        self.api.close()
+
+    def add_blocking_callback(self, total_pages):
+        """Serve the first page right away and block the others until released."""
+        url = f"{TEST_BASE_URL}test_json"
+
+        def callback(request):
+            page = int(request.params.get("page", "1"))
+            if page > 1:
+                self.release.wait(5)
+            body = {
+                "data": [{"id": str(page)}],
+                "pagination": {
+                    "last": f"{url}?page={total_pages}",
+                    "next": f"{url}?page={page + 1}" if page < total_pages else None,
+                },
+            }
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET, url, callback=callback, content_type="application/json"
+        )
+
+    @responses.activate
+    def test_listing_within_deadline(self):
+        """Test that a listing finishing in time is unaffected."""
+        add_paged_callback(4)
+
+        items = list(self.api.get("test_json", deadline=Deadline(10)))
+
+        self.assertEqual([item["id"] for item in items], ["1-0", "2-0", "3-0", "4-0"])
+
+    @responses.activate
+    def test_pending_pages_are_cancelled(self):
+        """Test that the listing stops at the deadline and cancels queued pages."""
+        self.add_blocking_callback(20)
+        self.api.prefetch_window = 10
+        self.api.max_workers = 2
+
+        items = []
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            items.extend(self.api.get("test_json", deadline=Deadline(0.2)))
+
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([item["id"] for item in items], ["1"])
+        self.release.set()
+        self.api.executor.shutdown(wait=True)
+        # Only the pages that were already on the wire were requested
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_cancel_from_another_thread(self):
+        """Test that cancelling the deadline stops a listing without a timeout."""
+        self.add_blocking_callback(5)
+        deadline = Deadline()
+        threading.Timer(0.1, deadline.cancel).start()
+
+        with self.assertRaisesRegex(DeadlineExceededError, "cancelled"):
+            list(self.api.get("test_json", deadline=deadline))
+        self.release.set()
+        self.api.executor.shutdown(wait=True)
+
+    @responses.activate
+    def test_get_all_instances(self):
+        """Test that object listings pass the deadline to the client."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []})
+        deadline = Deadline()
+        deadline.cancel()
+
+        with self.assertRaises(DeadlineExceededError):
+            list(Monitor.get_all_instances(self.api, deadline=deadline))
+
+        self.assertEqual(len(responses.calls), 0)
@@ -1,10 +1,16 @@
 """Tests for Incident API object."""
 
+import json
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
 
 import responses
 
-from betterstack.uptime import UptimeAPI
+from betterstack.uptime import UptimeAPI, ValidationError
 from betterstack.uptime.objects import Incident
 from tests.fixtures import V3_BASE_URL, make_paginated_response
 
@@ -345,3 +351,186 @@ class TestIncident(unittest.TestCase):
             "metadata",
         ]
         self.assertEqual(Incident._allowed_query_parameters, expected_params)
+
+
+def make_incident(incident_id, started_at):
+    """Create an incident resource started at ``started_at``."""
+    return {
+        "id": str(incident_id),
+        "type": "incident",
+        "attributes": {"name": f"Incident {incident_id}", "started_at": started_at},
+    }
+
+
+class TestIncidentHistory(unittest.TestCase):
+    """Tests for fetching incident history in time slices."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api = UptimeAPI("test-token")
+        # Two incidents per day in January, listed newest first like the API does
+        self.incidents = [
+            make_incident(day * 10 + hour, f"2024-01-{day:02d}T{hour:02d}:00:00.000Z")
+            for day in range(1, 32)
+            for hour in (6, 18)
+        ][::-1]
+
+    def add_history_callback(self, per_page=5, boundary_duplicates=False):
+        """Serve incidents filtered on from/to, paginated by ``per_page``."""
+
+        def callback(request):
+            params = {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+            start, end = params["from"], params["to"]
+            if len(end) == 10:
+                end += "T23:59:59.999Z"
+            matches = [
+                item
+                for item in self.incidents
+                if start <= item["attributes"]["started_at"][: len(start)]
+                and item["attributes"]["started_at"] <= end
+            ]
+            if boundary_duplicates:
+                matches.extend(self.incidents[:1])
+            page = int(params.get("page", "1"))
+            pages = max(-(-len(matches) // per_page), 1)
+            body = make_paginated_response(
+                matches[(page - 1) * per_page : page * per_page],
+                f"{V3_BASE_URL}incidents?page={page + 1}" if page < pages else None,
+            )
+            body["pagination"]["last"] = f"{V3_BASE_URL}incidents?page={pages}"
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET,
+            f"{V3_BASE_URL}incidents",
+            callback=callback,
+            content_type="application/json",
+        )
+
+    def requested_windows(self):
+        """Return the from/to pairs of the first page requests."""
+        windows = set()
+        for call in responses.calls:
+            params = {k: v[0] for k, v in parse_qs(urlparse(call.request.url).query).items()}
+            windows.add((params["from"], params["to"]))
+        return sorted(windows)
+
+    @responses.activate
+    def test_date_range_is_split_into_days(self):
+        """Test that a date range is split into non-overlapping day windows."""
+        self.add_history_callback()
+
+        incidents = list(Incident.history(self.api, from_="2024-01-01", to="2024-01-31", slices=4))
+
+        self.assertEqual(len(incidents), 62)
+        started = [incident.started_at for incident in incidents]
+        self.assertEqual(started, sorted(started))
+        self.assertEqual(
+            self.requested_windows(),
+            [
+                ("2024-01-01", "2024-01-08"),
+                ("2024-01-09", "2024-01-16"),
+                ("2024-01-17", "2024-01-24"),
+                ("2024-01-25", "2024-01-31"),
+            ],
+        )
+
+    @responses.activate
+    def test_duplicates_are_yielded_once(self):
+        """Test that incidents returned by several windows are de-duplicated by id."""
+        self.add_history_callback(boundary_duplicates=True)
+
+        incidents = list(Incident.history(self.api, from_="2024-01-01", to="2024-01-31", slices=3))
+
+        ids = [incident.id for incident in incidents]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(len(ids), 62)
+
+    @responses.activate
+    def test_datetime_range_shares_boundaries(self):
+        """Test that datetime ranges are split into equal windows."""
+        self.add_history_callback()
+
+        incidents = list(
+            Incident.history(
+                self.api,
+                from_="2024-01-01T00:00:00Z",
+                to="2024-01-03T00:00:00Z",
+                slices=2,
+                monitor_id=1,
+            )
+        )
+
+        self.assertEqual([incident.id for incident in incidents], ["16", "28", "26", "38"])
+        self.assertEqual(
+            self.requested_windows(),
+            [
+                ("2024-01-01T00:00:00+00:00", "2024-01-02T00:00:00+00:00"),
+                ("2024-01-02T00:00:00+00:00", "2024-01-03T00:00:00+00:00"),
+            ],
+        )
+        self.assertIn("monitor_id=1", responses.calls[0].request.url)
+
+    @responses.activate
+    def test_close_stops_fetching(self):
+        """Test that closing the generator early doesn't raise."""
+        self.add_history_callback(per_page=1)
+
+        history = Incident.history(self.api, from_="2024-01-01", to="2024-01-31", slices=31)
+        self.assertEqual(next(history).id, "16")
+        history.close()
+
+        # Closing waits for the workers to stop after their current request
+        calls = len(responses.calls)
+        time.sleep(0.1)
+        self.assertEqual(len(responses.calls), calls)
+        self.assertLess(calls, 31)
+
+    @responses.activate
+    def test_windows_share_one_executor(self):
+        """Test that history calls list their windows on the same threads."""
+        self.add_history_callback()
+
+        with patch(
+            "betterstack.uptime.objects.incident.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor_class:
+            for _ in range(3):
+                list(Incident.history(self.api, from_="2024-01-01", to="2024-01-31", slices=4))
+
+        self.assertLessEqual(executor_class.call_count, 1)
+
+    @responses.activate
+    def test_max_workers_bounds_windows_in_flight(self):
+        """Test that no more than max_workers windows are listed at the same time."""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def callback(request):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return (200, {}, json.dumps(make_paginated_response([])))
+
+        responses.add_callback(responses.GET, f"{V3_BASE_URL}incidents", callback=callback)
+
+        list(
+            Incident.history(self.api, from_="2024-01-01", to="2024-01-31", slices=8, max_workers=2)
+        )
+
+        self.assertEqual(len(responses.calls), 8)
+        self.assertLessEqual(peak[0], 2)
+
+    def test_invalid_arguments(self):
+        """Test that invalid ranges and filters are rejected."""
+        with self.assertRaises(ValidationError):
+            next(Incident.history(self.api, from_="2024-02-01", to="2024-01-01"))
+        with self.assertRaises(ValidationError):
+            next(Incident.history(self.api, from_="2024-01-01", to="yesterday"))
+        with self.assertRaises(ValidationError):
+            next(Incident.history(self.api, from_="2024-01-01", to="2024-01-02", status="x"))
+        with self.assertRaises(ValidationError):
+            next(Incident.history(self.api, from_="2024-01-01", to="2024-01-02", slices=0))
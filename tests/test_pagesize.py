@@ -0,0 +1,210 @@
+"""Tests for page size selection."""
+
+import json
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+import responses
+
+from betterstack.uptime import (
+    BearerAuth,
+    Heartbeat,
+    Monitor,
+    MonitorGroup,
+    PageSizer,
+    PaginatedAPI,
+)
+from betterstack.uptime.pagesize import DEFAULT_MAX_PER_PAGE
+from tests.fixtures import TEST_BASE_URL
+
+
+def add_capped_callback(total_items, server_max, url=f"{TEST_BASE_URL}monitors"):
+    """Serve ``total_items`` items, honouring ``per_page`` up to ``server_max``."""
+
+    def callback(request):
+        params = parse_qs(urlparse(request.url).query)
+        page = int(params.get("page", ["1"])[0])
+        per_page = min(int(params.get("per_page", ["50"])[0]), server_max)
+        pages = max(-(-total_items // per_page), 1)
+        start = (page - 1) * per_page
+        body = {
+            "data": [{"id": str(i)} for i in range(start, min(start + per_page, total_items))],
+            "pagination": {
+                "first": f"{url}?page=1",
+                "last": f"{url}?page={pages}",
+                "prev": None,
+                "next": f"{url}?page={page + 1}" if page < pages else None,
+            },
+        }
+        return (200, {}, json.dumps(body))
+
+    responses.add_callback(responses.GET, url, callback=callback, content_type="application/json")
+
+
+def requested_per_page():
+    """Return the per_page parameter of every recorded request."""
+    return [
+        parse_qs(urlparse(call.request.url).query).get("per_page", [None])[0]
+        for call in responses.calls
+    ]
+
+
+class TestPageSizer(unittest.TestCase):
+    """Tests for PageSizer."""
+
+    def test_limits(self):
+        """Test the default, configured and longest prefix limits."""
+        sizer = PageSizer(endpoint_limits={"incidents": 100, "incidents/{id}/comments": 20})
+
+        self.assertEqual(sizer.per_page("monitors"), DEFAULT_MAX_PER_PAGE)
+        self.assertEqual(sizer.per_page("/incidents/"), 100)
+        self.assertEqual(sizer.per_page("incidents/12/comments"), 20)
+
+    def test_single_objects_are_not_sized(self):
+        """Test that URLs ending in an ID get no page size."""
+        self.assertIsNone(PageSizer().per_page("monitors/123"))
+
+    def test_learns_server_limit(self):
+        """Test that a short page followed by more pages reveals the server limit."""
+        sizer = PageSizer()
+        sizer.observe("monitors", 250, 100, has_next=True, latency=0.1)
+
+        self.assertEqual(sizer.limit_for("monitors"), 100)
+        self.assertEqual(sizer.per_page("monitors"), 100)
+
+        # The last page of a listing is short without revealing anything
+        sizer.observe("incidents", 250, 30, has_next=False, latency=0.1)
+        self.assertEqual(sizer.per_page("incidents"), 250)
+
+    def test_latency_tuning(self):
+        """Test that slow pages shrink the size and fast pages grow it back."""
+        sizer = PageSizer(max_per_page=200, min_per_page=20, target_latency=1.0)
+
+        sizer.observe("monitors", 200, 200, has_next=True, latency=4.0)
+        self.assertEqual(sizer.per_page("monitors"), 50)
+
+        sizer.observe("monitors", 50, 50, has_next=True, latency=10.0)
+        self.assertEqual(sizer.per_page("monitors"), 20)
+
+        sizer.observe("monitors", 20, 20, has_next=True, latency=0.1)
+        self.assertEqual(sizer.per_page("monitors"), 200)
+
+    def test_single_page_listing_does_not_grow(self):
+        """Test that a fast listing that fit on one page keeps its size."""
+        sizer = PageSizer(max_per_page=200, target_latency=1.0)
+        sizer.observe("monitors", 200, 200, has_next=True, latency=2.0)
+
+        sizer.observe("monitors", 100, 3, has_next=False, latency=0.01)
+
+        self.assertEqual(sizer.per_page("monitors"), 100)
+
+    def test_reset(self):
+        """Test that reset forgets learned and tuned sizes."""
+        sizer = PageSizer(target_latency=1.0)
+        sizer.observe("monitors", 250, 100, has_next=True, latency=5.0)
+
+        sizer.reset()
+
+        self.assertEqual(sizer.per_page("monitors"), DEFAULT_MAX_PER_PAGE)
+
+    def test_invalid_configuration(self):
+        """Test that invalid sizes and latencies are rejected."""
+        with self.assertRaises(ValueError):
+            PageSizer(max_per_page=5, min_per_page=10)
+        with self.assertRaises(ValueError):
+            PageSizer(endpoint_limits={"monitors": 0})
+        with self.assertRaises(ValueError):
+            PageSizer(target_latency=0)
+
+
+class TestPaginatedAPIAutoPerPage(unittest.TestCase):
+    """Tests for PaginatedAPI with auto_per_page."""
+
+    @responses.activate
+    def test_largest_page_size_is_requested(self):
+        """Test that listings request the maximum page size."""
+        add_capped_callback(600, server_max=250)
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), auto_per_page=True)
+
+        items = list(api.get("monitors", listing=True))
+
+        self.assertEqual([item["id"] for item in items], [str(i) for i in range(600)])
+        self.assertEqual(requested_per_page(), ["250", "250", "250"])
+
+    @responses.activate
+    def test_learned_limit_is_used_for_next_listing(self):
+        """Test that a server limit below the request is learned from the first page."""
+        add_capped_callback(250, server_max=100)
+        sizer = PageSizer()
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), auto_per_page=sizer)
+
+        self.assertEqual(len(list(api.get("monitors", listing=True))), 250)
+        self.assertEqual(sizer.per_page("monitors"), 100)
+
+        responses.calls.reset()
+        self.assertEqual(len(list(api.get("monitors", listing=True))), 250)
+        self.assertEqual(requested_per_page(), ["100", "100", "100"])
+
+    @responses.activate
+    def test_explicit_per_page_is_kept(self):
+        """Test that a per_page passed by the caller is not overridden."""
+        add_capped_callback(30, server_max=250)
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), auto_per_page=True)
+
+        list(api.get("monitors", parameters={"per_page": 10}, listing=True))
+
+        self.assertEqual(requested_per_page(), ["10", "10", "10"])
+
+    @responses.activate
+    def test_single_object_has_no_per_page(self):
+        """Test that single object requests are sent unchanged."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors/1", json={"data": {"id": "1"}})
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), auto_per_page=True)
+
+        list(api.get("monitors/1", listing=True))
+
+        self.assertEqual(requested_per_page(), [None])
+
+    @responses.activate
+    def test_sub_resource_has_no_per_page(self):
+        """Test that requests other than collection listings are sent unchanged."""
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors/1/sla",
+            json={"data": {"id": "1", "type": "monitor_sla", "attributes": {}}},
+        )
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), auto_per_page=True)
+
+        list(api.get("monitors/1/sla", parameters={"from_": "2024-01-01"}))
+
+        self.assertEqual(requested_per_page(), [None])
+
+    @responses.activate
+    def test_instances_are_listed_with_per_page(self):
+        """Test that get_all_instances sizes the pages of its listing."""
+        add_capped_callback(300, server_max=250)
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), auto_per_page=True)
+
+        self.assertEqual(len(list(Monitor.get_all_instances(api))), 300)
+        self.assertEqual(requested_per_page(), ["250", "250"])
+
+    @responses.activate
+    def test_disabled_by_default(self):
+        """Test that the server default page size is used without auto_per_page."""
+        add_capped_callback(10, server_max=250)
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"))
+
+        list(api.get("monitors", listing=True))
+
+        self.assertIsNone(api.page_sizer)
+        self.assertEqual(requested_per_page(), [None])
+
+
+class TestPerPageFilter(unittest.TestCase):
+    """Tests for per_page on resources that previously rejected it."""
+
+    def test_per_page_is_allowed(self):
+        """Test that per_page passes query parameter validation."""
+        for cls in (Heartbeat, MonitorGroup):
+            with self.subTest(cls=cls.__name__):
+                cls._validate_query_options(per_page=250, team_name="ops")
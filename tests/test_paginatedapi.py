@@ -1,6 +1,8 @@
 """Tests for PaginatedAPI class."""
 
 import json
+import threading
+import time
 import unittest
 
 import responses
@@ -401,3 +403,438 @@ class TestPaginatedAPI(unittest.TestCase):
         self.assertEqual(resp[0]["id"], "1")
         # Only one request made - did not follow next
         self.assertEqual(len(responses.calls), 1)
+
+
+def add_paged_callback(total_pages, url=f"{TEST_BASE_URL}test_json", items_per_page=1, delay=0.0):
+    """Register a callback serving ``total_pages`` pages with ``last`` links."""
+    from urllib.parse import parse_qs, urlparse
+
+    def page_callback(request):
+        time.sleep(delay)
+        params = parse_qs(urlparse(request.url).query)
+        page = int(params.get("page", ["1"])[0])
+        body = {
+            "data": [{"id": f"{page}-{i}"} for i in range(items_per_page)],
+            "pagination": {
+                "first": f"{url}?page=1",
+                "last": f"{url}?page={total_pages}",
+                "prev": None,
+                "next": f"{url}?page={page + 1}" if page < total_pages else None,
+            },
+        }
+        return (200, {}, json.dumps(body))
+
+    responses.add_callback(
+        responses.GET, url, callback=page_callback, content_type="application/json"
+    )
+
+
+class TestPaginatedAPIPrefetchWindow(unittest.TestCase):
+    """Tests for the bounded prefetch window of PaginatedAPI."""
+
+    @responses.activate
+    def test_window_limits_requests_ahead_of_consumer(self):
+        """Test that at most prefetch_window pages are requested ahead."""
+        add_paged_callback(10)
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), prefetch_window=2)
+
+        items = api.get("test_json")
+        self.assertEqual(next(items)["id"], "1-0")
+        self.assertEqual(next(items)["id"], "2-0")
+
+        # First page, pages 2 and 3 in the window, and page 4 refilled after page 2
+        self.assertLessEqual(len(responses.calls), 4)
+
+        rest = [item["id"] for item in items]
+        self.assertEqual(rest, [f"{page}-0" for page in range(3, 11)])
+        self.assertEqual(len(responses.calls), 10)
+
+    @responses.activate
+    def test_window_larger_than_listing(self):
+        """Test a window that is larger than the number of pages."""
+        add_paged_callback(3, items_per_page=2)
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), prefetch_window=10
+        )
+
+        resp = [item["id"] for item in api.get("test_json")]
+
+        self.assertEqual(resp, ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"])
+
+    @responses.activate
+    def test_default_window_lets_listings_take_turns(self):
+        """Test that a short listing isn't queued behind every page of a long one."""
+        add_paged_callback(40, url=f"{TEST_BASE_URL}long", delay=0.01)
+        add_paged_callback(2, url=f"{TEST_BASE_URL}short")
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), max_workers=2)
+        self.addCleanup(api.close)
+
+        def long_pages():
+            return sum("long" in call.request.url for call in responses.calls)
+
+        long_listing = threading.Thread(target=lambda: list(api.get("long")))
+        long_listing.start()
+        while long_pages() < 3:
+            time.sleep(0.001)
+
+        started = long_pages()
+        self.assertEqual(len(list(api.get("short"))), 2)
+        finished = long_pages()
+        long_listing.join(5)
+
+        # Only the pages in the long listing's window went before the short listing
+        self.assertLessEqual(finished - started, 2 * 2 * api.max_workers)
+        self.assertEqual(long_pages(), 40)
+
+    def test_invalid_window(self):
+        """Test that a window smaller than one page is rejected."""
+        with self.assertRaises(ValueError):
+            PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), prefetch_window=0)
+
+
+class TestPaginatedAPICancellation(unittest.TestCase):
+    """Tests for cancelling page fetches when the generator is closed."""
+
+    @responses.activate
+    def test_close_cancels_pending_pages(self):
+        """Test that closing the generator stops issuing page requests."""
+        import threading
+        import time
+        from urllib.parse import parse_qs, urlparse
+
+        release = threading.Event()
+        requested_pages = []
+
+        def page_callback(request):
+            page = int(parse_qs(urlparse(request.url).query).get("page", ["1"])[0])
+            requested_pages.append(page)
+            if page >= 3:
+                release.wait(5)
+            body = {
+                "data": [{"id": page}],
+                "pagination": {
+                    "first": f"{TEST_BASE_URL}test_json?page=1",
+                    "last": f"{TEST_BASE_URL}test_json?page=20",
+                    "prev": None,
+                    "next": f"{TEST_BASE_URL}test_json?page={page + 1}",
+                },
+            }
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET,
+            f"{TEST_BASE_URL}test_json",
+            callback=page_callback,
+            content_type="application/json",
+        )
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), max_workers=1)
+
+        items = api.get("test_json")
+        self.assertEqual(next(items)["id"], 1)
+        self.assertEqual(next(items)["id"], 2)
+
+        start = time.monotonic()
+        items.close()
+        elapsed = time.monotonic() - start
+        release.set()
+
+        # Closing must not wait for the blocked in-flight request
+        self.assertLess(elapsed, 1)
+        # Only the page already handed to the worker may have been requested
+        self.assertLessEqual(max(requested_pages), 3)
+
+
+class TestPaginatedAPIUnordered(unittest.TestCase):
+    """Tests for the unordered (as-completed) pagination mode."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+
+    @responses.activate
+    def test_unordered_yields_completed_pages_first(self):
+        """Test that a slow page does not hold back pages that already arrived."""
+        import threading
+        from urllib.parse import parse_qs, urlparse
+
+        release = threading.Event()
+
+        def page_callback(request):
+            page = int(parse_qs(urlparse(request.url).query).get("page", ["1"])[0])
+            if page == 2:
+                release.wait(5)
+            body = {
+                "data": [{"id": page}],
+                "pagination": {
+                    "first": f"{TEST_BASE_URL}test_json?page=1",
+                    "last": f"{TEST_BASE_URL}test_json?page=3",
+                    "prev": None,
+                    "next": f"{TEST_BASE_URL}test_json?page={page + 1}" if page < 3 else None,
+                },
+            }
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET,
+            f"{TEST_BASE_URL}test_json",
+            callback=page_callback,
+            content_type="application/json",
+        )
+
+        resp = []
+        for item in self.api.get("test_json", ordered=False):
+            resp.append(item["id"])
+            if item["id"] == 3:
+                release.set()
+
+        self.assertEqual(resp, [1, 3, 2])
+
+    @responses.activate
+    def test_get_all_instances_unordered(self):
+        """Test that get_all_instances passes the ordered flag through."""
+        from betterstack.uptime.objects import Monitor
+
+        add_paged_callback(4, url=f"{TEST_BASE_URL}monitors")
+
+        ids = sorted(monitor.id for monitor in Monitor.get_all_instances(self.api, ordered=False))
+
+        self.assertEqual(ids, ["1-0", "2-0", "3-0", "4-0"])
+        self.assertEqual(len(responses.calls), 4)
+
+
+class TestPaginatedAPIExecutor(unittest.TestCase):
+    """Tests for the shared page executor and client lifecycle."""
+
+    @responses.activate
+    def test_executor_is_reused_between_listings(self):
+        """Test that one executor serves every listing of a client."""
+        add_paged_callback(3)
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+
+        list(api.get("test_json"))
+        executor = api.executor
+        list(api.get("test_json"))
+
+        self.assertIs(api.executor, executor)
+        api.close()
+
+    @responses.activate
+    def test_injected_executor_is_not_shut_down(self):
+        """Test that an injected executor is used but left running on close."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        add_paged_callback(3)
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        with PaginatedAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), executor=executor
+        ) as api:
+            self.assertIs(api.executor, executor)
+            self.assertEqual(len(list(api.get("test_json"))), 3)
+
+        # Still usable after the client has been closed
+        self.assertEqual(executor.submit(lambda: 42).result(), 42)
+        executor.shutdown()
+
+    def test_close_shuts_down_owned_executor(self):
+        """Test that closing the client shuts down the executor it created."""
+        with PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token")) as api:
+            executor = api.executor
+
+        with self.assertRaises(RuntimeError):
+            executor.submit(lambda: None)
+
+    @responses.activate
+    def test_max_in_flight_caps_concurrent_requests(self):
+        """Test that max_in_flight bounds requests across concurrent listings."""
+        import threading
+        import time
+        from urllib.parse import parse_qs, urlparse
+
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def page_callback(request):
+            page = int(parse_qs(urlparse(request.url).query).get("page", ["1"])[0])
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            body = {
+                "data": [{"id": page}],
+                "pagination": {
+                    "first": None,
+                    "last": f"{TEST_BASE_URL}test_json?page=8",
+                    "prev": None,
+                    "next": f"{TEST_BASE_URL}test_json?page={page + 1}" if page < 8 else None,
+                },
+            }
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET,
+            f"{TEST_BASE_URL}test_json",
+            callback=page_callback,
+            content_type="application/json",
+        )
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), max_workers=8, max_in_flight=2
+        )
+
+        threads = [threading.Thread(target=lambda: list(api.get("test_json"))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        api.close()
+
+        self.assertEqual(len(responses.calls), 24)
+        self.assertLessEqual(state["peak"], 2)
+
+
+def add_unbounded_callback(total_pages, url=f"{TEST_BASE_URL}test_json", next_link=None):
+    """Register pages without ``last`` links; pages past the end are empty."""
+    from urllib.parse import parse_qs, urlparse
+
+    def page_callback(request):
+        page = int(parse_qs(urlparse(request.url).query).get("page", ["1"])[0])
+        body = {
+            "data": [{"id": page}] if page <= total_pages else [],
+            "pagination": {
+                "first": f"{url}?page=1",
+                "last": None,
+                "prev": None,
+                "next": (next_link or f"{url}?per_page=1&page={page + 1}")
+                if page < total_pages
+                else None,
+            },
+        }
+        return (200, {}, json.dumps(body))
+
+    responses.add_callback(
+        responses.GET, url, callback=page_callback, content_type="application/json"
+    )
+
+
+class TestPaginatedAPISpeculative(unittest.TestCase):
+    """Tests for speculative page fetching when the last page is unknown."""
+
+    def requested_pages(self):
+        """Return the page numbers requested so far."""
+        from urllib.parse import parse_qs, urlparse
+
+        return [
+            int(parse_qs(urlparse(call.request.url).query).get("page", ["1"])[0])
+            for call in responses.calls
+        ]
+
+    @responses.activate
+    def test_pages_are_fetched_ahead(self):
+        """Test that guessed pages are yielded in order and overshoots discarded."""
+        add_unbounded_callback(10)
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            speculative_pages=4,
+            max_workers=4,
+        )
+
+        resp = [item["id"] for item in api.get("test_json", parameters={"per_page": 1})]
+        api.close()
+
+        self.assertEqual(resp, list(range(1, 11)))
+        requested = self.requested_pages()
+        self.assertEqual(sorted(set(requested))[:10], list(range(1, 11)))
+        # At most the window of pages past the last one was requested
+        self.assertLessEqual(max(requested), 10 + 4)
+
+    @responses.activate
+    def test_window_bounds_requests_ahead(self):
+        """Test that no more than speculative_pages pages are requested ahead."""
+        add_unbounded_callback(20)
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), speculative_pages=2
+        )
+
+        items = api.get("test_json", parameters={"per_page": 1})
+        self.assertEqual(next(items)["id"], 1)
+        self.assertEqual(next(items)["id"], 2)
+        items.close()
+        api.close()
+
+        # First page, pages 2 and 3 in the window, and page 4 refilled after page 2
+        self.assertLessEqual(max(self.requested_pages()), 4)
+
+    @responses.activate
+    def test_overshoot_errors_are_ignored(self):
+        """Test that failing requests for pages past the end don't surface."""
+        from urllib.parse import parse_qs, urlparse
+
+        def page_callback(request):
+            page = int(parse_qs(urlparse(request.url).query).get("page", ["1"])[0])
+            if page > 3:
+                return (404, {}, json.dumps({"error": "Not found"}))
+            body = {
+                "data": [{"id": page}],
+                "pagination": {
+                    "next": f"{TEST_BASE_URL}test_json?page={page + 1}" if page < 3 else None
+                },
+            }
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET,
+            f"{TEST_BASE_URL}test_json",
+            callback=page_callback,
+            content_type="application/json",
+        )
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), speculative_pages=5
+        )
+
+        self.assertEqual([item["id"] for item in api.get("test_json")], [1, 2, 3])
+
+    @responses.activate
+    def test_cursor_links_are_followed_sequentially(self):
+        """Test that next links carrying unknown parameters are not guessed."""
+        from urllib.parse import parse_qs, urlparse
+
+        def page_callback(request):
+            cursor = parse_qs(urlparse(request.url).query).get("after", ["0"])[0]
+            page = int(cursor) + 1
+            body = {
+                "data": [{"id": page}],
+                "pagination": {
+                    "next": f"{TEST_BASE_URL}test_json?page=2&after={page}" if page < 3 else None
+                },
+            }
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET,
+            f"{TEST_BASE_URL}test_json",
+            callback=page_callback,
+            content_type="application/json",
+        )
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), speculative_pages=5
+        )
+
+        self.assertEqual([item["id"] for item in api.get("test_json")], [1, 2, 3])
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_disabled_by_default(self):
+        """Test that next links are followed one at a time by default."""
+        add_unbounded_callback(3)
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+
+        self.assertEqual([item["id"] for item in api.get("test_json")], [1, 2, 3])
+        self.assertEqual(self.requested_pages(), [1, 2, 3])
+
+    def test_negative_window(self):
+        """Test that a negative number of speculative pages is rejected."""
+        with self.assertRaises(ValueError):
+            PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), speculative_pages=-1)
@@ -0,0 +1,257 @@
+"""Tests for the client-side rate limiters."""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import responses
+
+from betterstack.uptime import RESTAPI, BearerAuth, FileTokenBucket, RateLimiter, TokenBucket
+from betterstack.uptime.exceptions import ConfigurationError, RateLimitError
+from tests.fixtures import TEST_BASE_URL, FakeClock
+
+
+class RecordingLimiter(RateLimiter):
+    """Rate limiter recording how the client uses it."""
+
+    def __init__(self):
+        """Initialize the call records."""
+        self.acquired = 0
+        self.penalties = []
+
+    def acquire(self):
+        """Record an acquire."""
+        self.acquired += 1
+
+    def penalize(self, retry_after=None):
+        """Record a penalty."""
+        self.penalties.append(retry_after)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for TokenBucket pacing."""
+
+    def setUp(self):
+        """Patch the time functions used by the limiter."""
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.ratelimit.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_paced(self):
+        """Test that a full bucket allows a burst and then paces requests."""
+        bucket = TokenBucket(rate=10, burst=3)
+
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.clock.slept, [])
+
+        bucket.acquire()
+        self.assertAlmostEqual(sum(self.clock.slept), 0.1)
+
+    def test_default_burst(self):
+        """Test that the burst defaults to one second worth of requests."""
+        self.assertEqual(TokenBucket(rate=5).burst, 5)
+        self.assertEqual(TokenBucket(rate=0.5).burst, 1)
+
+    def test_invalid_configuration(self):
+        """Test that a non-positive rate or burst is rejected."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+    def test_penalize_pauses_and_halves_rate(self):
+        """Test that a 429 pauses for Retry-After and tightens the rate."""
+        bucket = TokenBucket(rate=10, burst=10, recovery_time=10)
+
+        bucket.penalize(retry_after=2)
+        self.assertEqual(bucket.current_rate, 5)
+
+        bucket.acquire()
+        self.assertGreaterEqual(sum(self.clock.slept), 2)
+
+    def test_rate_recovers_after_penalty(self):
+        """Test that the rate relaxes back to the configured rate."""
+        bucket = TokenBucket(rate=10, recovery_time=10)
+
+        bucket.penalize(retry_after=0)
+        self.assertEqual(bucket.current_rate, 5)
+
+        self.clock.now += 5
+        self.assertEqual(bucket.current_rate, 10)
+
+    def test_rate_never_drops_below_minimum(self):
+        """Test that repeated penalties stop at the minimum rate."""
+        bucket = TokenBucket(rate=10)
+
+        for _ in range(10):
+            bucket.penalize(retry_after=0)
+
+        self.assertAlmostEqual(bucket.current_rate, 1)
+
+
+class TestTokenBucketThreads(unittest.TestCase):
+    """Tests for sharing a TokenBucket between threads."""
+
+    def test_shared_between_threads(self):
+        """Test that concurrent threads together respect the rate."""
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+
+        threads = [
+            threading.Thread(target=lambda: [bucket.acquire() for _ in range(2)]) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Ten requests at 50/s with a burst of one take at least 9 intervals
+        self.assertGreaterEqual(time.monotonic() - start, 0.17)
+
+
+def acquire_from_file_bucket(path, count):
+    """Acquire tokens from a FileTokenBucket in a separate process."""
+    bucket = FileTokenBucket(path, rate=50, burst=1)
+    for _ in range(count):
+        bucket.acquire()
+
+
+class TestFileTokenBucket(unittest.TestCase):
+    """Tests for FileTokenBucket state sharing."""
+
+    def setUp(self):
+        """Create a temporary state file path and patch the time functions."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "bucket")
+
+        self.clock = FakeClock()
+        patcher = mock.patch("betterstack.uptime.ratelimit.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_instances_share_budget(self):
+        """Test that two buckets on the same file draw from one budget."""
+        first = FileTokenBucket(self.path, rate=10, burst=2)
+        second = FileTokenBucket(self.path, rate=10, burst=2)
+
+        first.acquire()
+        second.acquire()
+        self.assertEqual(self.clock.slept, [])
+
+        second.acquire()
+        self.assertAlmostEqual(sum(self.clock.slept), 0.1)
+
+    def test_penalty_is_shared(self):
+        """Test that a 429 seen by one instance slows down the others."""
+        first = FileTokenBucket(self.path, rate=10, burst=10)
+        second = FileTokenBucket(self.path, rate=10, burst=10)
+
+        first.penalize(retry_after=2)
+
+        self.assertEqual(second.current_rate, 5)
+        second.acquire()
+        self.assertGreaterEqual(sum(self.clock.slept), 2)
+
+    def test_corrupt_state_starts_full(self):
+        """Test that an unreadable state file is replaced by a full bucket."""
+        with open(self.path, "w") as state_file:
+            state_file.write("not json")
+
+        bucket = FileTokenBucket(self.path, rate=10, burst=3)
+        for _ in range(3):
+            bucket.acquire()
+
+        self.assertEqual(self.clock.slept, [])
+
+    def test_lower_configured_rate_wins(self):
+        """Test that state written by a faster configuration is clamped."""
+        FileTokenBucket(self.path, rate=100, burst=100).acquire()
+
+        bucket = FileTokenBucket(self.path, rate=10, burst=5)
+
+        self.assertEqual(bucket.current_rate, 10)
+
+    @mock.patch("betterstack.uptime.ratelimit.fcntl", None)
+    def test_requires_fcntl(self):
+        """Test that a missing fcntl module is reported as a configuration error."""
+        with self.assertRaises(ConfigurationError):
+            FileTokenBucket(self.path, rate=10)
+
+
+class TestFileTokenBucketProcesses(unittest.TestCase):
+    """Tests for sharing a FileTokenBucket between processes."""
+
+    def test_shared_between_processes(self):
+        """Test that concurrent processes together respect the rate."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bucket")
+            FileTokenBucket(path, rate=50, burst=1).acquire()
+            start = time.monotonic()
+
+            processes = [
+                multiprocessing.Process(target=acquire_from_file_bucket, args=(path, 2))
+                for _ in range(4)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            self.assertTrue(all(process.exitcode == 0 for process in processes))
+            # Eight requests at 50/s on an empty bucket take at least 8 intervals
+            self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+
+class TestRESTAPIRateLimiter(unittest.TestCase):
+    """Tests for the rate limiter integration in RESTAPI."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.limiter = RecordingLimiter()
+        self.api = RESTAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            rate_limiter=self.limiter,
+            rate_limit_retries=0,
+        )
+
+    @responses.activate
+    def test_every_verb_acquires(self):
+        """Test that every HTTP verb waits on the rate limiter."""
+        for method in (responses.GET, responses.POST, responses.PATCH, responses.DELETE):
+            responses.add(method, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+
+        self.api.get("monitors")
+        self.api.post("monitors", body={})
+        self.api.patch("monitors", body={})
+        self.api.delete("monitors")
+
+        self.assertEqual(self.limiter.acquired, 4)
+
+    @responses.activate
+    def test_rate_limit_error_penalizes(self):
+        """Test that a 429 response tightens the rate limiter."""
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            json={"error": "Too many requests"},
+            status=429,
+            headers={"Retry-After": "3"},
+        )
+
+        with self.assertRaises(RateLimitError):
+            self.api.get("monitors")
+
+        self.assertEqual(self.limiter.penalties, [3])
+
+    def test_base_class_requires_acquire(self):
+        """Test that the base class cannot be used directly."""
+        with self.assertRaises(NotImplementedError):
+            RateLimiter().acquire()
@@ -1,10 +1,18 @@
 """Tests for RESTAPI class."""
 
+import json
+import socket
+import threading
+import time
 import unittest
+from unittest import mock
 
+import requests
 import responses
+from urllib3.connection import HTTPConnection
+from urllib3.util.connection import is_connection_dropped
 
-from betterstack.uptime import RESTAPI, BearerAuth
+from betterstack.uptime import RESTAPI, BearerAuth, PaginatedAPI
 from betterstack.uptime.exceptions import (
     APIError,
     AuthenticationError,
@@ -13,7 +21,8 @@ from betterstack.uptime.exceptions import (
     RateLimitError,
     ServerError,
 )
-from tests.fixtures import TEST_BASE_URL
+from tests.fixtures import TEST_BASE_URL, wait_until
+from tests.server import LocalServer
 
 
 class TestRESTAPI(unittest.TestCase):
@@ -122,8 +131,10 @@ class TestRESTAPIErrorHandling(unittest.TestCase):
     """Tests for RESTAPI error handling."""
 
     def setUp(self):
-        """Set up test fixtures."""
-        self.api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+        """Set up test fixtures with 429 responses raised right away."""
+        self.api = RESTAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), rate_limit_retries=0
+        )
 
     @responses.activate
     def test_401_raises_authentication_error(self):
@@ -288,3 +299,307 @@ class TestRESTAPIErrorHandling(unittest.TestCase):
 
         with self.assertRaises(NotFoundError):
             self.api.delete("monitors/999")
+
+
+class TestRESTAPIConnectionPool(unittest.TestCase):
+    """Tests for connection pool sizing and reuse statistics."""
+
+    def test_default_pool_size(self):
+        """Test that the pool size defaults to the client's concurrency."""
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+        self.assertEqual(api.adapter._pool_maxsize, 10)
+
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), max_in_flight=40)
+        self.assertEqual(api.adapter._pool_maxsize, 40)
+
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), max_workers=32)
+        self.assertEqual(api.adapter._pool_maxsize, 33)
+
+    def test_explicit_pool_configuration(self):
+        """Test that explicit pool settings are passed to the pool manager."""
+        api = RESTAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            pool_connections=2,
+            pool_maxsize=4,
+            pool_block=True,
+            tcp_keepalive=True,
+        )
+
+        pool = api.adapter.poolmanager.connection_from_url(TEST_BASE_URL)
+        self.assertEqual(pool.pool.maxsize, 4)
+        self.assertTrue(pool.block)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool.conn_kw["socket_options"])
+
+    def test_pool_stats_report_reuse(self):
+        """Test that sequential requests reuse a single pooled connection."""
+        with LocalServer({"data": []}) as server:
+            api = RESTAPI(base_url=server.base_url, auth=BearerAuth("test-token"))
+            for _ in range(5):
+                api.get("monitors")
+            stats = api.pool_stats()
+            api.close()
+
+        self.assertEqual(stats.connections_created, 1)
+        self.assertEqual(stats.requests, 5)
+        self.assertEqual(stats.reused, 4)
+        self.assertEqual(stats.reuse_ratio, 0.8)
+        self.assertEqual(stats.idle_connections, 1)
+
+
+class TestRESTAPIWarmUp(unittest.TestCase):
+    """Tests for opening pooled connections ahead of requests."""
+
+    def setUp(self):
+        """Start a local server and a client for it."""
+        self.server = LocalServer({"data": []}).__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.api = RESTAPI(base_url=self.server.base_url, auth=BearerAuth("test-token"))
+        self.addCleanup(self.api.close)
+
+    def idle_connections(self, api=None):
+        """Return the connections idle in the only pool of a client."""
+        pools = (api or self.api).adapter.poolmanager.pools
+        (key,) = pools.keys()
+        return [conn for conn in pools.get(key).pool.queue if conn is not None]
+
+    def test_opens_connections_without_requests(self):
+        """Test that warm-up fills the pool without sending a request."""
+        self.assertEqual(self.api.warm_up(3), 3)
+
+        self.assertEqual(self.server.requests, [])
+        self.assertEqual(len(self.idle_connections()), 3)
+        self.assertFalse(any(map(is_connection_dropped, self.idle_connections())))
+
+        self.api.get("monitors")
+        stats = self.api.pool_stats()
+        self.assertEqual((stats.connections_created, stats.idle_connections), (3, 3))
+
+    def test_only_reopens_closed_connections(self):
+        """Test that open connections are kept and closed ones are reopened."""
+        self.api.warm_up(3)
+        self.assertEqual(self.api.warm_up(3), 0)
+
+        self.idle_connections()[0].close()
+
+        self.assertEqual(self.api.warm_up(3), 1)
+
+    def test_default_size(self):
+        """Test the default number of connections and the cap at the pool size."""
+        self.assertEqual(self.api.warm_up(), 1)
+
+        api = PaginatedAPI(base_url=self.server.base_url, auth=BearerAuth("t"), max_workers=4)
+        self.addCleanup(api.close)
+        self.assertEqual(api.warm_up(), 4)
+
+        api = RESTAPI(base_url=self.server.base_url, auth=BearerAuth("t"), pool_maxsize=2)
+        self.addCleanup(api.close)
+        self.assertEqual(api.warm_up(10), 2)
+
+    def test_connection_error(self):
+        """Test that failing to connect raises and leaves the pool usable."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        api = RESTAPI(base_url=f"http://127.0.0.1:{port}/", auth=BearerAuth("t"), timeout=1)
+        self.addCleanup(api.close)
+
+        with self.assertRaises(requests.ConnectionError):
+            api.warm_up(2)
+
+        pools = api.adapter.poolmanager.pools
+        (key,) = pools.keys()
+        slots = pools.get(key).pool
+        self.assertEqual(slots.qsize(), slots.maxsize)
+        self.assertTrue(all(map(is_connection_dropped, self.idle_connections(api))))
+
+    def test_requests_during_warm_up(self):
+        """Test that open connections serve requests while dropped ones reconnect."""
+        api = RESTAPI(
+            base_url=self.server.base_url, auth=BearerAuth("t"), pool_maxsize=2, pool_block=True
+        )
+        self.addCleanup(api.close)
+        api.warm_up(2)
+        self.idle_connections(api)[0].close()
+        connecting, release = threading.Event(), threading.Event()
+        connect = HTTPConnection.connect
+
+        def slow_connect(conn):
+            if threading.current_thread().name.startswith("betterstack-uptime-warm-up"):
+                connecting.set()
+                release.wait(5)
+            connect(conn)
+
+        with mock.patch.object(HTTPConnection, "connect", slow_connect):
+            warm_up = threading.Thread(target=api.warm_up, args=(2,))
+            warm_up.start()
+            self.assertTrue(connecting.wait(1))
+
+            started = time.monotonic()
+            api.get("monitors")
+            elapsed = time.monotonic() - started
+
+            release.set()
+            warm_up.join(1)
+
+        self.assertLess(elapsed, 1)
+        self.assertEqual(api.pool_stats().connections_created, 2)
+        self.assertFalse(any(map(is_connection_dropped, self.idle_connections(api))))
+
+    def test_keep_alive_reopens_dropped_connections(self):
+        """Test that the keep-alive reopens idle connections until close."""
+        with self.assertRaises(ValueError):
+            self.api.warm_up(keep_alive=0)
+
+        self.api.warm_up(2, keep_alive=0.02)
+        thread = self.api._keep_alive_thread
+        self.assertEqual(self.api.keep_alive, 0.02)
+
+        for conn in self.idle_connections():
+            conn.close()
+        wait_until(lambda: not any(map(is_connection_dropped, self.idle_connections())), 2)
+        self.assertFalse(any(map(is_connection_dropped, self.idle_connections())))
+
+        self.api.close()
+        self.assertIsNone(self.api.keep_alive)
+        self.assertFalse(thread.is_alive())
+
+
+class TestRESTAPIRateLimitRetries(unittest.TestCase):
+    """Tests for retrying requests answered with 429."""
+
+    def setUp(self):
+        """Set up test fixtures with sleeping disabled."""
+        self.api = RESTAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            rate_limit_retries=2,
+            max_retry_after=5,
+        )
+        patcher = mock.patch("betterstack.uptime.api.time.sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def add_rate_limited(self, retry_after="2"):
+        """Register a 429 response for the monitors endpoint."""
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            json={"error": "Too many requests"},
+            status=429,
+            headers=headers,
+        )
+
+    @responses.activate
+    def test_retries_after_retry_after(self):
+        """Test that a 429 is retried after waiting for Retry-After."""
+        self.add_rate_limited("2")
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+
+        self.assertEqual(self.api.get("monitors"), {"data": []})
+
+        self.assertEqual(len(responses.calls), 2)
+        delay = self.sleep.call_args[0][0]
+        self.assertGreaterEqual(delay, 2)
+        self.assertLessEqual(delay, 2.2)
+        self.assertEqual(self.api.throttled_retries, 1)
+        self.assertEqual(self.api.throttled_seconds, delay)
+
+    @responses.activate
+    def test_retried_by_default(self):
+        """Test that a default client retries a 429 as often as other failures."""
+        self.add_rate_limited("1")
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+
+        self.assertEqual(api.get("monitors"), {"data": []})
+
+        self.assertEqual(api.rate_limit_retries, 3)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_retries_disabled(self):
+        """Test that a 429 is raised immediately with rate_limit_retries=0."""
+        self.add_rate_limited("2")
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), rate_limit_retries=0)
+
+        with self.assertRaises(RateLimitError):
+            api.get("monitors")
+
+        self.assertEqual(len(responses.calls), 1)
+        self.sleep.assert_not_called()
+
+    @responses.activate
+    def test_wait_is_capped(self):
+        """Test that a long Retry-After is capped at max_retry_after."""
+        self.add_rate_limited("120")
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+
+        self.api.get("monitors")
+
+        self.sleep.assert_called_once_with(5)
+
+    @responses.activate
+    def test_backoff_without_retry_after(self):
+        """Test that an exponential backoff is used without Retry-After."""
+        self.add_rate_limited(None)
+        self.add_rate_limited(None)
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json={"data": []}, status=200)
+
+        self.api.get("monitors")
+
+        delays = [call[0][0] for call in self.sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertGreaterEqual(delays[0], 0.5)
+        self.assertGreaterEqual(delays[1], 1.0)
+
+    @responses.activate
+    def test_raises_when_retries_exhausted(self):
+        """Test that RateLimitError is raised once all retries are used."""
+        self.add_rate_limited("1")
+
+        with self.assertRaises(RateLimitError):
+            self.api.get("monitors")
+
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.api.throttled_retries, 2)
+
+    @responses.activate
+    def test_only_failed_page_is_retried(self):
+        """Test that a 429 on one page only retries that page."""
+        from urllib.parse import parse_qs, urlparse
+
+        throttled = []
+
+        def page_callback(request):
+            page = int(parse_qs(urlparse(request.url).query).get("page", ["1"])[0])
+            if page == 3 and not throttled:
+                throttled.append(page)
+                return (429, {"Retry-After": "1"}, json.dumps({"error": "Slow down"}))
+            body = {
+                "data": [{"id": page}],
+                "pagination": {
+                    "first": None,
+                    "last": f"{TEST_BASE_URL}monitors?page=4",
+                    "prev": None,
+                    "next": f"{TEST_BASE_URL}monitors?page={page + 1}" if page < 4 else None,
+                },
+            }
+            return (200, {}, json.dumps(body))
+
+        responses.add_callback(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            callback=page_callback,
+            content_type="application/json",
+        )
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), rate_limit_retries=1
+        )
+
+        ids = [item["id"] for item in api.get("monitors")]
+
+        self.assertEqual(ids, [1, 2, 3, 4])
+        self.assertEqual(len(responses.calls), 5)
+        self.assertEqual(api.throttled_retries, 1)
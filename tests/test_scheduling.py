@@ -0,0 +1,211 @@
+"""Tests for priority scheduling of requests."""
+
+import threading
+import unittest
+
+import responses
+
+from betterstack.uptime import (
+    BearerAuth,
+    Monitor,
+    PaginatedAPI,
+    PriorityScheduler,
+    TokenBucket,
+    request_priority,
+)
+from betterstack.uptime.deadline import Deadline, deadline_scope
+from betterstack.uptime.exceptions import DeadlineExceededError
+from betterstack.uptime.scheduling import current_priority
+from tests.fixtures import TEST_BASE_URL, wait_until
+
+
+class TestRequestPriority(unittest.TestCase):
+    """Tests for request_priority."""
+
+    def test_scope(self):
+        """Test that the priority is set for the block and restored after."""
+        self.assertIsNone(current_priority())
+
+        with request_priority("bulk"):
+            with request_priority("interactive"):
+                self.assertEqual(current_priority(), "interactive")
+            self.assertEqual(current_priority(), "bulk")
+
+        self.assertIsNone(current_priority())
+
+    def test_unknown_priority(self):
+        """Test that unknown priorities are rejected."""
+        with self.assertRaises(ValueError), request_priority("urgent"):
+            pass
+
+
+class TestPriorityScheduler(unittest.TestCase):
+    """Tests for PriorityScheduler."""
+
+    def test_separate_pools(self):
+        """Test that a full bulk pool doesn't hold back interactive requests."""
+        scheduler = PriorityScheduler(limits={"bulk": 1})
+
+        with scheduler.slot("bulk"), scheduler.slot("interactive"):
+            self.assertEqual(scheduler.in_flight("bulk"), 1)
+            self.assertEqual(scheduler.in_flight("interactive"), 1)
+
+        self.assertEqual(scheduler.in_flight("bulk"), 0)
+
+    def test_slot_limit(self):
+        """Test that a class waits for a free slot of its own pool."""
+        scheduler = PriorityScheduler(limits={"bulk": 1})
+        entered = threading.Event()
+
+        def second():
+            with scheduler.slot("bulk"):
+                entered.set()
+
+        with scheduler.slot("bulk"):
+            thread = threading.Thread(target=second)
+            thread.start()
+            self.assertFalse(entered.wait(0.05))
+        thread.join(1)
+
+        self.assertTrue(entered.is_set())
+
+    def test_interactive_turn_goes_first(self):
+        """Test that waiting interactive requests take their turn before bulk ones."""
+        scheduler = PriorityScheduler()
+        order = []
+
+        def take_turn(priority):
+            with scheduler.turn(priority):
+                order.append(priority)
+
+        with scheduler.turn("bulk"):
+            bulk = threading.Thread(target=take_turn, args=("bulk",))
+            bulk.start()
+            wait_until(lambda: scheduler._waiting["bulk"] == 1)
+            interactive = threading.Thread(target=take_turn, args=("interactive",))
+            interactive.start()
+            wait_until(lambda: scheduler._waiting["interactive"] == 1)
+        bulk.join(1)
+        interactive.join(1)
+
+        self.assertEqual(order, ["interactive", "bulk"])
+        self.assertEqual(scheduler.preempted, 1)
+
+    def test_turn_wait_ends_at_deadline(self):
+        """Test that an expired wait for the turn lets lower classes go ahead."""
+        scheduler = PriorityScheduler()
+        order = []
+
+        def take_turn():
+            with scheduler.turn("bulk"):
+                order.append("bulk")
+
+        with scheduler.turn("bulk"):
+            bulk = threading.Thread(target=take_turn)
+            bulk.start()
+            wait_until(lambda: scheduler._waiting["bulk"] == 1)
+            with (
+                deadline_scope(Deadline(0.05)),
+                self.assertRaises(DeadlineExceededError),
+                scheduler.turn("interactive"),
+            ):
+                pass
+        bulk.join(1)
+
+        self.assertEqual(order, ["bulk"])
+        self.assertEqual(scheduler._waiting["interactive"], 0)
+
+    def test_invalid_limits(self):
+        """Test that unknown classes and limits below 1 are rejected."""
+        with self.assertRaises(ValueError):
+            PriorityScheduler(limits={"urgent": 1})
+        with self.assertRaises(ValueError):
+            PriorityScheduler(limits={"bulk": 0})
+
+
+class TestPaginatedAPIPriorities(unittest.TestCase):
+    """Tests for priority scheduling in PaginatedAPI."""
+
+    def setUp(self):
+        """Set up a client whose bulk pool holds a single request."""
+        self.api = PaginatedAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            max_in_flight=1,
+            priorities=True,
+            rate_limiter=TokenBucket(rate=1000),
+        )
+        self.release = threading.Event()
+        self.addCleanup(self.api.close)
+        self.addCleanup(self.release.set)
+
+    def add_blocking_listing(self):
+        """Serve a monitor listing whose response blocks until released."""
+
+        def callback(request):
+            self.release.wait(5)
+            return (200, {}, '{"data": [], "pagination": {"next": null}}')
+
+        responses.add_callback(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors",
+            callback=callback,
+            content_type="application/json",
+        )
+
+    @responses.activate
+    def test_single_fetch_bypasses_busy_listing(self):
+        """Test that a single object is fetched while a listing holds the bulk pool."""
+        self.add_blocking_listing()
+        responses.add(
+            responses.GET,
+            f"{TEST_BASE_URL}monitors/1",
+            json={"data": {"id": "1", "attributes": {"url": "https://example.com"}}},
+        )
+        scheduler = self.api.scheduler
+        listing = threading.Thread(target=lambda: list(self.api.get("monitors")))
+        listing.start()
+        wait_until(lambda: scheduler.in_flight("bulk") == 1)
+
+        monitor = Monitor(id="1", _api=self.api)
+        monitor.fetch_data()
+
+        self.assertEqual(monitor.url, "https://example.com")
+        self.assertEqual(scheduler.in_flight("bulk"), 1)
+        self.release.set()
+        listing.join(1)
+
+    @responses.activate
+    def test_caller_priority_is_kept(self):
+        """Test that a listing made inside request_priority uses that priority."""
+        self.add_blocking_listing()
+        scheduler = self.api.scheduler
+
+        def interactive_listing():
+            with request_priority("interactive"):
+                list(self.api.get("monitors"))
+
+        listing = threading.Thread(target=interactive_listing)
+        listing.start()
+        wait_until(lambda: scheduler.in_flight("interactive") == 1)
+
+        self.assertEqual(scheduler.in_flight("interactive"), 1)
+        self.assertEqual(scheduler.in_flight("bulk"), 0)
+        self.release.set()
+        listing.join(1)
+
+    def test_max_in_flight_limits_bulk(self):
+        """Test that priorities=True sizes the bulk pool with max_in_flight."""
+        self.assertEqual(self.api.scheduler.limits, {"interactive": None, "bulk": 1})
+
+    def test_max_in_flight_must_fit_priorities(self):
+        """Test that the bulk pool can't be left unlimited or limited twice."""
+        with self.assertRaisesRegex(ValueError, "max_in_flight"):
+            PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), priorities=True)
+        with self.assertRaisesRegex(ValueError, "PriorityScheduler"):
+            PaginatedAPI(
+                base_url=TEST_BASE_URL,
+                auth=BearerAuth("test-token"),
+                max_in_flight=4,
+                priorities=PriorityScheduler(limits={"bulk": 8}),
+            )
@@ -0,0 +1,207 @@
+"""Tests for incremental decoding of page bodies."""
+
+import json
+import unittest
+
+import responses
+
+from betterstack.uptime import BearerAuth, PaginatedAPI, ResponseCache
+from betterstack.uptime.streaming import StreamingPage
+from tests.fixtures import TEST_BASE_URL
+from tests.test_paginatedapi import add_paged_callback
+
+
+def chunked(text, size):
+    """Split ``text`` into UTF-8 encoded chunks of ``size`` bytes."""
+    data = text.encode("utf-8")
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+BODY = {
+    "data": [
+        {"id": "1", "attributes": {"name": "café ☃", "tags": ["a", "b"]}},
+        {"id": "2", "attributes": {"value": 1.5e3, "empty": {}, "none": None}},
+        {"id": "3", "attributes": {"text": "x" * 5000}},
+    ],
+    "pagination": {"next": None, "last": "https://example.com?page=1"},
+}
+
+
+class TestStreamingPage(unittest.TestCase):
+    """Tests for the StreamingPage decoder."""
+
+    def test_items_and_document(self):
+        """Test that items are yielded and the other members are collected."""
+        text = json.dumps(BODY, indent=2, ensure_ascii=False)
+        for size in (1, 3, 7, 64, 100000):
+            with self.subTest(size=size):
+                page = StreamingPage(chunked(text, size))
+                self.assertEqual(list(page), BODY["data"])
+                self.assertEqual(page.document, {"pagination": BODY["pagination"]})
+
+    def test_items_are_yielded_before_body_is_read(self):
+        """Test that the first item is available while the body is incomplete."""
+        read = []
+
+        def chunks():
+            for chunk in chunked(json.dumps(BODY), 16):
+                read.append(chunk)
+                yield chunk
+
+        page = StreamingPage(chunks())
+        self.assertEqual(next(page), BODY["data"][0])
+        self.assertLess(sum(map(len, read)), len(json.dumps(BODY)) // 2)
+
+    def test_members_before_data(self):
+        """Test members that precede the data array."""
+        text = '{"pagination": {"next": null}, "data": [1, 2, 3], "meta": true}'
+
+        page = StreamingPage(chunked(text, 5))
+
+        self.assertEqual(list(page), [1, 2, 3])
+        self.assertEqual(page.document, {"pagination": {"next": None}, "meta": True})
+
+    def test_data_object_is_kept_in_document(self):
+        """Test that a non-array data member is not streamed."""
+        page = StreamingPage(chunked('{"data": {"id": "1"}}', 4))
+
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.document, {"data": {"id": "1"}})
+
+    def test_empty_array_and_object(self):
+        """Test empty arrays and objects."""
+        page = StreamingPage([b'{"data": [], "pagination": {}}'])
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.document, {"pagination": {}})
+
+        page = StreamingPage([b" { } "])
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.document, {})
+
+    def test_number_split_across_chunks(self):
+        """Test that a number at the end of a chunk is not cut short."""
+        page = StreamingPage([b'{"data": [12', b"345, 6", b"7]}"])
+
+        self.assertEqual(list(page), [12345, 67])
+
+    def test_invalid_documents(self):
+        """Test that malformed and truncated bodies raise ValueError."""
+        for text in ('["data"]', '{"data": [1, 2', '{"data": [1 2]}', '{"data": [1]', '{"a" 1}'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    list(StreamingPage(chunked(text, 3)))
+
+    def test_on_close_called_once(self):
+        """Test that on_close is called when iteration ends or the page is closed."""
+        closed = []
+        page = StreamingPage([b'{"data": [1]}'], on_close=lambda: closed.append(True))
+        list(page)
+        page.close()
+        self.assertEqual(closed, [True])
+
+        closed.clear()
+        page = StreamingPage([b'{"data": [1, 2]}'], on_close=lambda: closed.append(True))
+        next(page)
+        page.close()
+        self.assertEqual(closed, [True])
+
+    def test_close_before_iteration(self):
+        """Test that closing an unread page releases it."""
+        closed = []
+        page = StreamingPage([b'{"data": []}'], on_close=lambda: closed.append(True))
+
+        page.close()
+
+        self.assertEqual(closed, [True])
+        self.assertEqual(list(page), [])
+
+
+class TestPaginatedAPIStreaming(unittest.TestCase):
+    """Tests for PaginatedAPI with streamed pages."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api = PaginatedAPI(
+            base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), stream_pages=True
+        )
+
+    @responses.activate
+    def test_concurrent_pages(self):
+        """Test that concurrently fetched pages are streamed in order."""
+        add_paged_callback(4, items_per_page=3)
+
+        resp = [item["id"] for item in self.api.get("test_json")]
+
+        self.assertEqual(resp, [f"{page}-{i}" for page in range(1, 5) for i in range(3)])
+        self.assertEqual(len(responses.calls), 4)
+
+    @responses.activate
+    def test_single_object(self):
+        """Test a single object response."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}test_json/1", json={"data": {"id": "1"}})
+
+        self.assertEqual(list(self.api.get("test_json/1")), [{"id": "1"}])
+
+    @responses.activate
+    def test_sequential_fallback(self):
+        """Test that pages followed through next links are streamed."""
+        for page, following in ((1, "?page=2"), (2, None)):
+            responses.add(
+                responses.GET,
+                f"{TEST_BASE_URL}test_json",
+                json={
+                    "data": [{"id": str(page)}],
+                    "pagination": {
+                        "next": f"{TEST_BASE_URL}test_json{following}" if following else None
+                    },
+                },
+            )
+
+        resp = [item["id"] for item in self.api.get("test_json")]
+
+        self.assertEqual(resp, ["1", "2"])
+
+    @responses.activate
+    def test_invalid_body(self):
+        """Test that a malformed page body raises ValueError."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}test_json", body='{"data": [1, ')
+
+        with self.assertRaises(ValueError):
+            list(self.api.get("test_json"))
+
+    @responses.activate
+    def test_close_releases_prefetched_pages(self):
+        """Test that closing the listing closes prefetched streamed pages."""
+        add_paged_callback(5)
+        closed = []
+        get_page = self.api._get_page
+
+        def tracking_get_page(url, headers, parameters, deadline=None):
+            page = get_page(url, headers, parameters, deadline)
+            on_close = page._on_close
+            page._on_close = lambda: (closed.append(parameters.get("page", 1)), on_close())
+            return page
+
+        self.api._get_page = tracking_get_page
+
+        items = self.api.get("test_json")
+        self.assertEqual(next(items)["id"], "1-0")
+        self.assertEqual(next(items)["id"], "2-0")
+        items.close()
+        self.api.executor.shutdown(wait=True)
+
+        self.assertEqual(sorted(closed), list(range(1, len(responses.calls) + 1)))
+
+    @responses.activate
+    def test_cache_disables_streaming(self):
+        """Test that cached pages are decoded as a whole."""
+        add_paged_callback(2)
+        api = PaginatedAPI(
+            base_url=TEST_BASE_URL,
+            auth=BearerAuth("test-token"),
+            stream_pages=True,
+            cache=ResponseCache(),
+        )
+
+        self.assertIsInstance(api._get_page("test_json", None, {}), dict)
+        self.assertEqual([item["id"] for item in api.get("test_json")], ["1-0", "2-0"])
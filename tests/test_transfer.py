@@ -0,0 +1,161 @@
+"""Tests for compression negotiation and bandwidth accounting."""
+
+import gzip
+import json
+import unittest
+
+import responses
+
+from betterstack.uptime import RESTAPI, APIError, BearerAuth, PaginatedAPI, TransferStats
+from betterstack.uptime.transfer import (
+    SUPPORTED_ENCODINGS,
+    TransferMeter,
+    accept_encoding,
+    endpoint_name,
+)
+from tests.fixtures import TEST_BASE_URL
+
+BODY = {"data": [{"id": str(i), "attributes": {"status": "up"}} for i in range(200)]}
+
+
+def add_gzip_response(url, body=BODY):
+    """Register a gzip compressed JSON response and return its compressed size."""
+    compressed = gzip.compress(json.dumps(body).encode())
+    responses.add(
+        responses.GET,
+        url,
+        body=compressed,
+        headers={"Content-Encoding": "gzip"},
+        content_type="application/json",
+    )
+    return len(compressed)
+
+
+class TestEndpointName(unittest.TestCase):
+    """Tests for endpoint_name."""
+
+    def test_ids_are_folded(self):
+        """Test that numeric path segments are replaced by {id}."""
+        self.assertEqual(endpoint_name("monitors/123/sla"), "monitors/{id}/sla")
+        self.assertEqual(endpoint_name("/monitors/?page=2"), "monitors")
+
+    def test_base_path_is_stripped(self):
+        """Test that the base URL path is removed from absolute URLs."""
+        self.assertEqual(
+            endpoint_name("https://uptime.betterstack.com/api/v2/incidents/9", "/api/v2/"),
+            "incidents/{id}",
+        )
+        self.assertEqual(endpoint_name("https://example.com/api/v2x/a", "/api/v2/"), "api/v2x/a")
+
+
+class TestTransferMeter(unittest.TestCase):
+    """Tests for TransferMeter and TransferStats."""
+
+    def test_record_and_total(self):
+        """Test that responses are counted per endpoint and summed."""
+        meter = TransferMeter()
+        meter.record("monitors", wire_bytes=100, decoded_bytes=700, encoding="gzip")
+        meter.record("monitors", wire_bytes=50, decoded_bytes=50, decode_seconds=0.5)
+        meter.record("incidents", wire_bytes=10, decoded_bytes=40, encoding="br")
+
+        monitors = meter.stats()["monitors"]
+        self.assertEqual(monitors.responses, 2)
+        self.assertEqual(monitors.compressed_responses, 1)
+        self.assertEqual(monitors.saved_bytes, 600)
+        self.assertAlmostEqual(monitors.compression_ratio, 5.0)
+        self.assertEqual(monitors.decode_seconds, 0.5)
+
+        total = meter.total()
+        self.assertEqual(total.responses, 3)
+        self.assertEqual(total.wire_bytes, 160)
+        self.assertEqual(total.decoded_bytes, 790)
+
+        meter.reset()
+        self.assertEqual(meter.stats(), {})
+
+    def test_identity_is_not_compressed(self):
+        """Test that the identity encoding doesn't count as compressed."""
+        meter = TransferMeter()
+        meter.record("monitors", wire_bytes=10, decoded_bytes=10, encoding="identity")
+
+        self.assertEqual(meter.stats()["monitors"].compressed_responses, 0)
+
+    def test_empty_stats(self):
+        """Test the ratios of empty counters."""
+        self.assertEqual(TransferStats().compression_ratio, 1.0)
+        self.assertEqual(TransferStats().saved_bytes, 0)
+
+
+class TestRESTAPITransfer(unittest.TestCase):
+    """Tests for compression and bandwidth accounting in RESTAPI."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"))
+
+    def test_accept_encoding(self):
+        """Test that compressed responses are requested unless disabled."""
+        self.assertEqual(self.api.session.headers["Accept-Encoding"], SUPPORTED_ENCODINGS)
+        self.assertIn("gzip", SUPPORTED_ENCODINGS)
+
+        api = RESTAPI(base_url=TEST_BASE_URL, auth=BearerAuth("token"), compression=False)
+        self.assertEqual(api.session.headers["Accept-Encoding"], accept_encoding(False))
+
+    @responses.activate
+    def test_compressed_response_is_counted(self):
+        """Test that wire and decoded bytes of a gzip response are recorded."""
+        wire_bytes = add_gzip_response(f"{TEST_BASE_URL}monitors/12")
+
+        self.assertEqual(self.api.get("monitors/12"), BODY)
+
+        stats = self.api.transfer_stats()["monitors/{id}"]
+        self.assertEqual(stats.responses, 1)
+        self.assertEqual(stats.compressed_responses, 1)
+        self.assertEqual(stats.wire_bytes, wire_bytes)
+        self.assertEqual(stats.decoded_bytes, len(json.dumps(BODY)))
+        self.assertGreater(stats.compression_ratio, 5)
+        self.assertGreater(stats.decode_seconds, 0)
+        request_encoding = responses.calls[0].request.headers["Accept-Encoding"]
+        self.assertEqual(request_encoding, SUPPORTED_ENCODINGS)
+
+    @responses.activate
+    def test_uncompressed_response_is_counted(self):
+        """Test that an uncompressed body has equal wire and decoded bytes."""
+        responses.add(responses.GET, f"{TEST_BASE_URL}monitors", json=BODY)
+
+        self.api.get("monitors")
+
+        stats = self.api.transfer_stats()["monitors"]
+        self.assertEqual(stats.compressed_responses, 0)
+        self.assertEqual(stats.wire_bytes, stats.decoded_bytes)
+
+    @responses.activate
+    def test_error_response_is_counted(self):
+        """Test that decoded error bodies are counted too."""
+        responses.add(
+            responses.GET, f"{TEST_BASE_URL}monitors/1", json={"error": "nope"}, status=422
+        )
+
+        with self.assertRaises(APIError):
+            self.api.get("monitors/1")
+
+        self.assertEqual(self.api.transfer_stats()["monitors/{id}"].responses, 1)
+
+
+class TestPaginatedAPITransfer(unittest.TestCase):
+    """Tests for bandwidth accounting of streamed pages."""
+
+    @responses.activate
+    def test_streamed_page_is_counted(self):
+        """Test that a streamed page records its bytes when it is consumed."""
+        wire_bytes = add_gzip_response(f"{TEST_BASE_URL}incidents")
+        api = PaginatedAPI(base_url=TEST_BASE_URL, auth=BearerAuth("test-token"), stream_pages=True)
+
+        self.assertEqual(list(api.get("incidents")), BODY["data"])
+
+        stats = api.transfer_stats()["incidents"]
+        self.assertEqual(stats.responses, 1)
+        self.assertEqual(stats.compressed_responses, 1)
+        self.assertEqual(stats.wire_bytes, wire_bytes)
+        self.assertEqual(stats.decoded_bytes, len(json.dumps(BODY)))
+        self.assertEqual(stats.decode_seconds, 0.0)